@@ -32,6 +32,7 @@ SERVER_TASK_START = 'start_server_task'
 SERVER_TASK_STATE = 'task_state'
 SERVER_TASK_BACKUP_DONE = 'backup_done'
 SERVER_TASK_RESTORE_STATE = 'restore_state'
+SERVER_CREATION_RECORDED = '__creation_transition_recorded'
 SERVER_INTERFACE_IDS = 'interfaces'
 VOLUME_TASK_DELETE = 'delete_volume_task'
 VOLUME_ATTACHMENT_TASK = 'attach_volume_task'
@@ -40,6 +41,10 @@ VOLUME_BACKUP_TASK = 'backup_volume_task'
 VOLUME_SNAPSHOT_TASK = 'snapshot_volume_task'
 VOLUME_SNAPSHOT_ID = 'snapshot_id'
 VOLUME_BACKUP_ID = 'backup_id'
+# Ids of volume backups | snapshots being deleted, formatted with the type
+VOLUME_BACKUP_DELETE_IDS = '{0}_ids_to_delete'
+# Time volume backups | snapshots deletion started, formatted with the type
+VOLUME_BACKUP_DELETE_STARTED_AT = '{0}_delete_started_at'
 VOLUME_ATTACHMENT_ID = 'attachment_id'
 
 # Openstack Server status constants.
@@ -106,6 +111,8 @@ PORT_NODE_TYPE = 'cloudify.nodes.openstack.Port'
 SUBNET_NODE_TYPE = 'cloudify.nodes.openstack.Subnet'
 VOLUME_NODE_TYPE = 'cloudify.nodes.openstack.Volume'
 SECURITY_GROUP_NODE_TYPE = 'cloudify.nodes.openstack.SecurityGroup'
+SERVER_NODE_TYPE = 'cloudify.nodes.openstack.Server'
+FLOATING_IP_NODE_TYPE = 'cloudify.nodes.openstack.FloatingIP'
 
 # Cloudify relationship types
 RBAC_POLICY_RELATIONSHIP_TYPE = \
@@ -120,6 +127,10 @@ QUOTA_INVALID_MSG = \
     '{0} (node {1}) cannot be created due to quota limitations.' \
     'provisioned {2}: {3}, quota: {4}'
 
+DEPLOYMENT_QUOTA_INVALID_MSG = \
+    '{0} cannot be created due to quota limitations. ' \
+    'provisioned: {1}, requested: {2} (nodes {3}), quota: {4}'
+
 # General constants
 OPENSTACK_RESOURCE_UUID = 'uuid'
 OPENSTACK_PORT_ID = 'port_id'
@@ -127,6 +138,21 @@ OPENSTACK_NETWORK_ID = 'net_id'
 PS_OPEN = '<powershell>'
 PS_CLOSE = '</powershell>'
 INFINITE_RESOURCE_QUOTA = -1
+# Protocols of security group rules that have port ranges
+SECURITY_GROUP_RULE_PORT_PROTOCOLS = ['tcp', 'udp', 'sctp', '6', '17', '132']
+# Port fields required to remove security groups from server ports
+SERVER_PORT_SECURITY_GROUPS_FIELDS = \
+    ['id', 'security_groups', 'revision_number']
+# Default attributes dropped from resources payload stored as runtime
+# properties for each openstack type, large sub-objects are replaced by
+# their ids
+RESOURCE_PAYLOAD_EXCLUDED_FIELDS = {
+    SERVER_OPENSTACK_TYPE: ['addresses', 'flavor', 'image', 'links',
+                            'location'],
+}
+# Sensitive attributes that are never stored as runtime properties
+RESOURCE_PAYLOAD_SENSITIVE_FIELDS = ['user_data', 'adminPass']
+VOLUME_GIGABYTES_QUOTA = 'gigabytes'
 SERVER_ACTION_STATUS_DONE = 'DONE'
 SERVER_ACTION_STATUS_PENDING = 'PENDING'
 SERVER_REBUILD_STATUS = 'rebuild_done'
@@ -161,8 +187,35 @@ SERVER_IP_PROPERTY = 'ip'
 KEY_USE_CFY_LOGGER = 'use_cfy_logger'
 KEY_GROUPS = 'groups'
 KEY_LOGGERS = 'loggers'
+KEY_CONNECTION_POOL = 'connection_pool'
+KEY_AUTH_CACHE = 'auth_cache'
+KEY_RESOURCE_WAIT = 'resource_wait'
+AUTH_CACHE_DIR = 'openstack_auth_cache'
+TRANSITION_STATS_FILE = 'openstack_transition_stats.json'
 PRIVATE_KEY_PREFIX = '-----BEGIN'
 
+# In-operation wait budget (in seconds) used to poll resources in the same
+# process before falling back to operation retry, it is disabled unless the
+# client config sets it
+DEFAULT_RESOURCE_WAIT_CONFIG = {
+    'timeout': 0,
+    'initial_interval': 1,
+    'max_interval': 10,
+}
+
+# Number of observed transition durations kept for each resource type &
+# status, and the minimum number needed to compute retry interval from them
+TRANSITION_STATS_MAX_SAMPLES = 50
+TRANSITION_STATS_MIN_SAMPLES = 3
+# Durations (in seconds) longer than this are not observed transitions but
+# resources that were updated long after they were ready
+TRANSITION_MAX_DURATION = 3600
+# Transition key suffix used for the observed deletion durations
+TRANSITION_DELETED = 'deleted'
+# Bounds (in seconds) of the retry interval computed from observed durations
+MIN_RETRY_AFTER = 5
+MAX_RETRY_AFTER = 60
+
 DEFAULT_LOGGING_CONFIG = {
     KEY_USE_CFY_LOGGER: True,
     KEY_GROUPS: {
@@ -23,7 +23,8 @@ from openstack_sdk.resources.compute import OpenstackFlavor
 from openstack_plugin.decorators import (with_openstack_resource,
                                          with_compat_node)
 from openstack_plugin.constants import (RESOURCE_ID, FLAVOR_OPENSTACK_TYPE)
-from openstack_plugin.utils import add_resource_list_to_runtime_properties
+from openstack_plugin.utils import (add_resource_list_to_runtime_properties,
+                                    get_list_query)
 
 
 @with_compat_node
@@ -39,7 +40,13 @@ def create(openstack_resource):
 
 @with_compat_node
 @with_openstack_resource(OpenstackFlavor)
-def list_flavors(openstack_resource, query={}, details=True):
+def list_flavors(openstack_resource,
+                 query={},
+                 details=True,
+                 limit=None,
+                 marker=None,
+                 max_items=None,
+                 fields=None):
     """
 
     :param openstack_resource: Instance of openstack flavor resource
@@ -50,10 +57,18 @@ def list_flavors(openstack_resource, query={}, details=True):
                 will be returned. The default, ``True``, will cause
                 :class:`~openstack.compute.v2.flavor.FlavorDetail`
                 instances to be returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
+    query = get_list_query(query, limit, marker)
     query['details'] = details
     flavors = openstack_resource.list(query=query)
-    add_resource_list_to_runtime_properties(FLAVOR_OPENSTACK_TYPE, flavors)
+    add_resource_list_to_runtime_properties(FLAVOR_OPENSTACK_TYPE, flavors,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
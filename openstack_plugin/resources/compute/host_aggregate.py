@@ -153,14 +153,18 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackHostAggregate)
-def list_aggregates(openstack_resource):
+def list_aggregates(openstack_resource, max_items=None, fields=None):
     """
     List openstack host aggregate
     :param openstack_resource: Instance of openstack host aggregate resource.
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
     aggregates = openstack_resource.list()
     add_resource_list_to_runtime_properties(HOST_AGGREGATE_OPENSTACK_TYPE,
-                                            aggregates)
+                                            aggregates,
+                                            max_items=max_items,
+                                            fields=fields)
 
 
 @with_compat_node
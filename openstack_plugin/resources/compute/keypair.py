@@ -53,13 +53,17 @@ def delete(openstack_resource):
 
 @with_compat_node
 @with_openstack_resource(OpenstackKeyPair)
-def list_keypairs(openstack_resource):
+def list_keypairs(openstack_resource, max_items=None, fields=None):
     """
     List openstack keypairs
     :param openstack_resource: Instance of openstack keypair.
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
     keypairs = openstack_resource.list()
-    add_resource_list_to_runtime_properties(KEYPAIR_OPENSTACK_TYPE, keypairs)
+    add_resource_list_to_runtime_properties(KEYPAIR_OPENSTACK_TYPE, keypairs,
+                                            max_items=max_items,
+                                            fields=fields)
 
 
 @with_compat_node
@@ -15,6 +15,7 @@
 
 # Standard imports
 import json
+from collections import OrderedDict
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_v1_5
 import base64
@@ -26,6 +27,9 @@ from cloudify.exceptions import (OperationRetry,
                                  NonRecoverableError)
 
 # Local imports
+from openstack_sdk.common import (ResourceLookup,
+                                  lookup_resources,
+                                  run_concurrently)
 from openstack_sdk.resources.compute import (OpenstackServer,
                                              OpenstackKeyPair,
                                              OpenstackFlavor)
@@ -52,6 +56,7 @@ from openstack_plugin.constants import (RESOURCE_ID,
                                         SERVER_TASK_STOP,
                                         SERVER_TASK_START,
                                         SERVER_TASK_RESTORE_STATE,
+                                        SERVER_CREATION_RECORDED,
                                         SERVER_TASK_BACKUP_DONE,
                                         SERVER_OPENSTACK_TYPE,
                                         SERVER_GROUP_NODE_TYPE,
@@ -64,6 +69,7 @@ from openstack_plugin.constants import (RESOURCE_ID,
                                         SERVER_TASK_STATE,
                                         SERVER_INTERFACE_IDS,
                                         SERVER_ADMIN_PASSWORD,
+                                        SERVER_PORT_SECURITY_GROUPS_FIELDS,
                                         IMAGE_UPLOADING_PENDING,
                                         IMAGE_STATUS_ACTIVE,
                                         IMAGE_UPLOADING,
@@ -93,7 +99,11 @@ from openstack_plugin.utils import \
     (handle_userdata,
      validate_resource_quota,
      wait_until_status,
+     wait_for_resource,
+     get_creation_retry_after,
+     record_creation_transition,
      add_resource_list_to_runtime_properties,
+     get_list_query,
      find_relationship_by_node_type,
      find_openstack_ids_of_connected_nodes_by_openstack_type,
      reset_dict_empty_keys,
@@ -115,7 +125,7 @@ def _stop_server(server):
     if server_resource.status != SERVER_STATUS_SHUTOFF:
         # Trigger stop server API only if it is not stopped before
         if SERVER_TASK_STOP not in ctx.instance.runtime_properties:
-            server.stop()
+            server.stop(server_resource)
             ctx.instance.runtime_properties[SERVER_TASK_STOP]\
                 = SERVER_ACTION_STATUS_PENDING
             # save flag as current state before external call
@@ -148,7 +158,7 @@ def _start_server(server):
     if server_resource.status != SERVER_STATUS_ACTIVE:
         # Trigger stop server API only if it is not stopped before
         if SERVER_TASK_START not in ctx.instance.runtime_properties:
-            server.start()
+            server.start(server_resource)
             ctx.instance.runtime_properties[SERVER_TASK_START]\
                 = SERVER_ACTION_STATUS_PENDING
             # save flag as current state before external call
@@ -475,10 +485,39 @@ def _get_boot_volume_targets():
     return targets
 
 
+def _lookup_resources(requests, client_config, resource_lookup=None):
+    """
+    This method will lookup batch of resources concurrently, resources
+    prefetched by the resource lookup are not requested again
+    :param list requests: List of (class_decl, name_or_id) tuples
+    :param dict client_config: Openstack configuration required to connect
+    to API
+    :param resource_lookup: Optional instance of ResourceLookup
+    :return list: Resources in the same order as the requests
+    """
+    if resource_lookup:
+        return resource_lookup.lookup(requests)
+    return lookup_resources(requests, client_config, logger=ctx.logger)
+
+
+def _get_flavor_or_image_value(openstack_resource, prop_name):
+    """
+    This method will get the flavor or image name or id configured for
+    server using "<prop_name>_id", "<prop_name>_name" or node property
+    :param openstack_resource: An instance of OpenstackServer
+    :param str prop_name: Property to evaluate for ("image | flavor")
+    :return str: Flavor or image name or id
+    """
+    return openstack_resource.config.get('{0}_id'.format(prop_name)) \
+        or openstack_resource.config.get('{0}_name'.format(prop_name)) \
+        or ctx.node.properties.get(prop_name)
+
+
 def _get_flavor_or_image_from_server(class_name,
                                      openstack_resource,
                                      prop_name,
-                                     has_bdm=False):
+                                     has_bdm=False,
+                                     resource_lookup=None):
     """
     This method will try to evaluate the flavor or image value for server
     which is needed in order to create and spin a server
@@ -489,6 +528,7 @@ def _get_flavor_or_image_from_server(class_name,
     because when adding support for bdm, it is not required to pass image
     information since server is going to boot from server, but it is
     possible to provide image alongside with bdm configuration
+    :param resource_lookup: Optional instance of ResourceLookup
     """
     prop_value = ctx.node.properties.get(prop_name)
     config_value_id = openstack_resource.config.get('{0}_id'.format(prop_name))
@@ -507,16 +547,12 @@ def _get_flavor_or_image_from_server(class_name,
         return None
     else:
         # Get the value from node property or from resource config
-        prop_value = config_value_id or config_value_name or prop_value
-        # Create instance from the class provided (OpenstackFlavor |
-        # OpenstackImage)
-        instance = class_name(
-            client_config=openstack_resource.client_config,
-            logger=ctx.logger)
-        # Prepare the method need to be invoked in order to check if the
-        # flavor or image provided is valid or not
-        remote_instance = \
-            getattr(instance, 'find_{0}'.format(prop_name))(prop_value)
+        prop_value = _get_flavor_or_image_value(openstack_resource, prop_name)
+        # Lookup the flavor or image provided in order to check if it is
+        # valid or not
+        remote_instance, = _lookup_resources([(class_name, prop_value)],
+                                             openstack_resource.client_config,
+                                             resource_lookup)
 
         if not remote_instance:
             # If config_value_id is not None, then we are reading
@@ -531,26 +567,31 @@ def _get_flavor_or_image_from_server(class_name,
         return remote_instance.id
 
 
-def _get_port_networks(client_config, port_ids):
+def _get_port_networks(client_config, port_ids, resource_lookup=None):
     """
     This method will return network associated with ports
     :param dict client_config: Openstack configuration required to connect
     to API
     :param (List) port_ids: List of uuid ports
+    :param resource_lookup: Optional instance of ResourceLookup
     :return: Dict networks: contains map between port_id & network_id
     """
-    def _get_network(port_id):
-        port = OpenstackPort(client_config=client_config, logger=ctx.logger)
-        port.resource_id = port_id
-        response = port.get()
-        return {
-            'uuid': response.network_id,
+    ports = _lookup_resources([(OpenstackPort, port_id)
+                               for port_id in port_ids],
+                              client_config,
+                              resource_lookup)
+    return [
+        {
+            'uuid': port.network_id,
             'port': port_id
         }
-    return [_get_network(port) for port in port_ids]
+        for port_id, port in zip(port_ids, ports)
+    ]
 
 
-def _remove_duplicated_nics_from_relationships(nics_from_rels, client_config):
+def _remove_duplicated_nics_from_relationships(nics_from_rels,
+                                               client_config,
+                                               resource_lookup=None):
 
     # Get the ports from relationships if they are existed
     port_ids = find_openstack_ids_of_connected_nodes_by_openstack_type(
@@ -565,7 +606,9 @@ def _remove_duplicated_nics_from_relationships(nics_from_rels, client_config):
     # 1. Get the associated network for port and update "nics_from_rels" list
     # 2. Clean the "nics_from_rels" to remove any duplicates entries that
     # have the same network object (maintains orders)
-    port_networks = _get_port_networks(client_config, port_ids)
+    port_networks = _get_port_networks(client_config,
+                                       port_ids,
+                                       resource_lookup)
     port_nic = {}
     inverted_port_nic = {}
     # Convert port related to networks
@@ -595,7 +638,10 @@ def _remove_duplicated_nics_from_relationships(nics_from_rels, client_config):
     return ordered_list or nics_from_rels
 
 
-def _clean_duplicate_networks(nics_from_rels, nics_from_node, client_config):
+def _clean_duplicate_networks(nics_from_rels,
+                              nics_from_node,
+                              client_config,
+                              resource_lookup=None):
     """
     This method will clean all duplicates network items before send the
     final request to the server when creating server instance
@@ -605,6 +651,7 @@ def _clean_duplicate_networks(nics_from_rels, nics_from_node, client_config):
     properties
     :param dict client_config: Openstack configuration required to connect
     to API
+    :param resource_lookup: Optional instance of ResourceLookup
     """
     for node_nic in nics_from_node:
         # Get the network/port config defined at node property level to be
@@ -628,7 +675,8 @@ def _clean_duplicate_networks(nics_from_rels, nics_from_node, client_config):
                 nics_from_rels.remove(node_nic)
 
     return _remove_duplicated_nics_from_relationships(nics_from_rels,
-                                                      client_config)
+                                                      client_config,
+                                                      resource_lookup)
 
 
 def _clean_duplicate_volumes(server_config):
@@ -643,19 +691,22 @@ def _clean_duplicate_volumes(server_config):
         server_config['block_device_mapping_v2'] = volumes
 
 
-def _update_flavor_and_image_config(openstack_resource):
+def _update_flavor_and_image_config(openstack_resource, resource_lookup=None):
     """
     This method will update flavor & image config for server based on the
     configuration provided via resource_config and node properties
     :param openstack_resource: An instance of OpenstackServer
+    :param resource_lookup: Optional instance of ResourceLookup
     """
     image_id = None
     bootable_volumes = _get_boot_volume_targets()
     if not bootable_volumes:
-        image_id = _get_flavor_or_image_from_server(OpenstackImage,
-                                                    openstack_resource,
-                                                    'image',
-                                                    has_bdm=True)
+        image_id = _get_flavor_or_image_from_server(
+            OpenstackImage,
+            openstack_resource,
+            'image',
+            has_bdm=True,
+            resource_lookup=resource_lookup)
         bdm_config = openstack_resource.config.get('block_device_mapping_v2')
         if bdm_config and image_id:
             bdm_dict = {
@@ -667,9 +718,11 @@ def _update_flavor_and_image_config(openstack_resource):
             }
             bdm_config.insert(0, bdm_dict)
 
-    flavor_id = _get_flavor_or_image_from_server(OpenstackFlavor,
-                                                 openstack_resource,
-                                                 'flavor')
+    flavor_id = _get_flavor_or_image_from_server(
+        OpenstackFlavor,
+        openstack_resource,
+        'flavor',
+        resource_lookup=resource_lookup)
     if flavor_id:
         openstack_resource.config['flavor_id'] = flavor_id
 
@@ -677,30 +730,49 @@ def _update_flavor_and_image_config(openstack_resource):
         openstack_resource.config['image_id'] = image_id
 
 
-def _get_network_name(nic_object, client_config):
-    # Set first network to connect to
-    net_name = ''
-    if nic_object.get('uuid'):
-        net = OpenstackNetwork(client_config=client_config, logger=ctx.logger)
-        net.resource_id = nic_object['uuid']
-        response = net.get()
-        net_name = response.name
-    elif nic_object.get('port'):
-        # Get the current network connected to the current port
-        port = OpenstackPort(client_config=client_config, logger=ctx.logger)
-        port.resource_id = nic_object['port']
-        response = port.get()
-        net_id = response.network_id
+def _get_networks_names(nic_objects, client_config, resource_lookup=None):
+    """
+    This method will lookup the names of the networks of nics, networks
+    and ports are resolved concurrently
+    :param list nic_objects: List of nics config, each one has "uuid" of the
+    network or "port" id
+    :param dict client_config: Openstack configuration required to connect
+    to API
+    :param resource_lookup: Optional instance of ResourceLookup
+    :return list: Networks names in the same order of the nics, empty name
+    for nics without network or port
+    """
+    # Get the current networks connected to the nics ports
+    port_ids = [nic.get('port') for nic in nic_objects
+                if not nic.get('uuid') and nic.get('port')]
+    ports = dict(zip(port_ids,
+                     _lookup_resources([(OpenstackPort, port_id)
+                                        for port_id in port_ids],
+                                       client_config,
+                                       resource_lookup)))
+
+    net_ids = []
+    for nic in nic_objects:
+        if nic.get('uuid'):
+            net_ids.append(nic['uuid'])
+        elif nic.get('port'):
+            net_ids.append(ports[nic['port']].network_id)
+        else:
+            net_ids.append(None)
 
-        # Lookup the name of the network using the net_id provided above
-        net = OpenstackNetwork(client_config=client_config, logger=ctx.logger)
-        net.resource_id = net_id
-        response = net.get()
-        net_name = response.name
-    return net_name
+    # Lookup the names of the networks using the net_ids provided above
+    networks = dict(zip(
+        [net_id for net_id in net_ids if net_id],
+        _lookup_resources([(OpenstackNetwork, net_id)
+                           for net_id in net_ids if net_id],
+                          client_config,
+                          resource_lookup)))
+    return [networks[net_id].name if net_id else '' for net_id in net_ids]
 
 
-def _get_security_groups_ids(security_groups, client_config):
+def _get_security_groups_ids(security_groups,
+                             client_config,
+                             resource_lookup=None):
     """
     This method will return all security groups ids so they can be used
     later on for attaching to servers and the reason for getting the ids
@@ -716,6 +788,7 @@ def _get_security_groups_ids(security_groups, client_config):
             ]
     :param dict client_config: Openstack configuration required to connect
     to API
+    :param resource_lookup: Optional instance of ResourceLookup
     :return: List of security groups
     [
         {
@@ -726,15 +799,11 @@ def _get_security_groups_ids(security_groups, client_config):
         }
     ]
     """
-    sg_list = []
-    security_group = OpenstackSecurityGroup(client_config=client_config,
-                                            logger=ctx.logger)
-    for sg in security_groups:
-        remote_sg = security_group.find_security_group(sg.get('name'))
-        sg_list.append({
-            'id': remote_sg.id
-        })
-    return sg_list
+    remote_sgs = _lookup_resources([(OpenstackSecurityGroup, sg.get('name'))
+                                    for sg in security_groups],
+                                   client_config,
+                                   resource_lookup)
+    return [{'id': remote_sg.id} for remote_sg in remote_sgs]
 
 
 @with_multiple_data_sources(clean_duplicates_handler=_clean_duplicate_volumes)
@@ -849,7 +918,10 @@ def _update_keypair_config(server_config, allow_multiple=False):
 
 
 @with_multiple_data_sources()
-def _update_nics_config(server_config, client_config, allow_multiple=False):
+def _update_nics_config(server_config,
+                        client_config,
+                        allow_multiple=False,
+                        resource_lookup=None):
     """
     This method will handle all the combinations for networks provided from
     relationships & networks config for server instance
@@ -860,6 +932,7 @@ def _update_nics_config(server_config, client_config, allow_multiple=False):
     :param boolean allow_multiple: This flag to set if it is allowed to have
     network configuration from multiple resources relationships + node
     properties
+    :param resource_lookup: Optional instance of ResourceLookup
     """
     # Check to see if the network dict is provided on the server config
     # properties
@@ -900,7 +973,8 @@ def _update_nics_config(server_config, client_config, allow_multiple=False):
     # Clean duplicated nics before send the request to the API server
     nics_from_rels = _clean_duplicate_networks(nics_from_rels,
                                                nics_from_node,
-                                               client_config)
+                                               client_config,
+                                               resource_lookup)
 
     # If server is not associated with any networks then we need to create
     # new networks object and attach network to it
@@ -915,10 +989,9 @@ def _update_nics_config(server_config, client_config, allow_multiple=False):
     # Set the nics configuration in the same order defined inside the
     # blueprint as runtime proprety so that we can select ip address from the
     # first network from the list
-    network_names = []
-    for network in server_config['networks']:
-        net_name = _get_network_name(network, client_config)
-        network_names.append(net_name)
+    network_names = _get_networks_names(server_config['networks'],
+                                        client_config,
+                                        resource_lookup)
     if network_names:
         ctx.instance.runtime_properties['networks'] = network_names
 
@@ -957,7 +1030,8 @@ def _update_server_group_config(server_config, allow_multiple=False):
 @with_multiple_data_sources()
 def _get_security_groups_config(server_config,
                                 client_config,
-                                allow_multiple=False):
+                                allow_multiple=False,
+                                resource_lookup=None):
     """
     This method will try to get security groups info connected with server
     node if there is any relationships or from the node properties under
@@ -969,12 +1043,15 @@ def _get_security_groups_config(server_config,
     :param boolean allow_multiple: This flag to set if it is allowed to have
     security groups configuration from multiple resources relationships + node
     properties
+    :param resource_lookup: Optional instance of ResourceLookup
     """
     # Check to see if the security_groups dict is provided on the server config
     # properties
     sgs_from_node = server_config.pop('security_groups', [])
     if sgs_from_node:
-        sgs_from_node = _get_security_groups_ids(sgs_from_node, client_config)
+        sgs_from_node = _get_security_groups_ids(sgs_from_node,
+                                                 client_config,
+                                                 resource_lookup)
     sgs_from_rel = get_security_groups_from_relationships(ctx)
 
     # if both are empty then server is not providing security groups neither
@@ -994,7 +1071,7 @@ def _get_security_groups_config(server_config,
     return security_groups
 
 
-def _update_server_config(server_config, client_config):
+def _update_server_config(server_config, client_config, resource_lookup=None):
     """
     This method will try to resolve if there are any nodes connected to the
     server node and try to use the configurations from nodes in order to
@@ -1003,9 +1080,12 @@ def _update_server_config(server_config, client_config):
     create the server instance using Openstack API
     :param dict client_config: Openstack configuration required to connect
     to API
+    :param resource_lookup: Optional instance of ResourceLookup
     """
     # Check if there are networks configuration found under "resource_config"
-    _update_nics_config(server_config, client_config=client_config)
+    _update_nics_config(server_config,
+                        client_config=client_config,
+                        resource_lookup=resource_lookup)
 
     # Check if there are some bootable volumes via relationships in order
     # update server config
@@ -1121,19 +1201,13 @@ def _connect_networks_to_external_server(openstack_resource):
             client_config
         )
 
-    # List networks associated with the current node
-    network_names = []
-    for network in nics_from_rels:
-        net_name = _get_network_name(network, client_config)
-        if net_name:
-            network_names.append(net_name)
-
-    # Check if there are some attached network to the current server
+    # List networks associated with the current node and the attached
+    # networks to the current server
     interfaces = openstack_resource.server_interfaces()
-    for interface in interfaces:
-        net_name = _get_network_name({'uuid': interface.net_id}, client_config)
-        if net_name:
-            network_names.append(net_name)
+    nics = nics_from_rels + [{'uuid': interface.net_id}
+                             for interface in interfaces]
+    network_names = [net_name for net_name in
+                     _get_networks_names(nics, client_config) if net_name]
 
     if network_names:
         ctx.instance.runtime_properties['networks'] = network_names
@@ -1317,54 +1391,138 @@ def _get_user_password(openstack_resource):
 
 
 def _disconnect_security_group_from_server_ports(client_config,
-                                                 server_payload,
-                                                 security_group_id):
+                                                 security_group_id,
+                                                 server_ports,
+                                                 port_ids=None):
     """
     This method will help to remove connection between port and security group
     Because when we attach security group to a server that has multiple
     ports connected to it, all the ports automatically are going to connect
-    to the security group
+    to the security group. Only the ports that still reference the security
+    group are updated concurrently
     :param dict client_config: Openstack configuration required to connect
     to API
-    :param dict server_payload: Server payload configuration from openstack
     :param str security_group_id: Security group ID
+    :param list server_ports: Ports attached to the server listed with
+    their id, security groups and revision number
+    :param list port_ids: IDs of server ports that may be already detached
+    from the server
+    """
+    port = OpenstackPort(client_config=client_config,
+                         logger=ctx.logger)
+    remote_ports = OrderedDict(
+        (remote_port.id, remote_port) for remote_port in server_ports)
+    missing_port_ids = [port_id for port_id in port_ids or []
+                        if port_id not in remote_ports]
+    if missing_port_ids:
+        for remote_port in port.list(
+                query={'id': missing_port_ids,
+                       'fields': SERVER_PORT_SECURITY_GROUPS_FIELDS}):
+            remote_ports[remote_port.id] = remote_port
+
+    server_ports = [
+        remote_port for remote_port in remote_ports.values()
+        if security_group_id in (remote_port.security_group_ids or [])
+    ]
+
+    def _get_port_security_groups(remote_port):
+        port_security_groups = remote_port.security_group_ids or []
+        if security_group_id not in port_security_groups:
+            return None
+        return {
+            'security_groups': [
+                port_security_group
+                for port_security_group in port_security_groups
+                if port_security_group != security_group_id
+            ]
+        }
+
+    run_concurrently(
+        lambda remote_port: port.update(_get_port_security_groups,
+                                        remote_port),
+        server_ports)
+
+
+def _get_security_groups_names(client_config, security_groups):
     """
-    if not server_payload:
-        return
+    This method will return the names of security groups using one list
+    call, since the security groups of server are only reported by name
+    :param dict client_config: Openstack configuration required to connect
+    to API
+    :param security_groups: List of security groups ids
+    :return dict: Security groups names mapped by their ids
+    """
+    if not security_groups:
+        return {}
+    security_group = OpenstackSecurityGroup(client_config=client_config,
+                                            logger=ctx.logger)
+    return {
+        remote_sg.id: remote_sg.name
+        for remote_sg in security_group.list(
+            query={'id': security_groups, 'fields': ['id', 'name']})
+    }
 
-    networks = server_payload.get('networks') or []
-    server_ports = \
-        [
-            network[PORT_OPENSTACK_TYPE]
-            for network in networks if network.get(PORT_OPENSTACK_TYPE)
-        ]
-    for port_id in server_ports:
-        port = OpenstackPort(client_config=client_config,
-                             logger=ctx.logger)
-        port.resource_id = port_id
-        remote_port = port.get()
-        port_security_groups = remote_port.security_group_ids
-        if security_group_id in remote_port.security_group_ids:
-            port_security_groups.remove(security_group_id)
 
-        port.update({
-            'security_groups': port_security_groups
-        })
+def _is_security_group_attached(security_group_id,
+                                attached_security_groups,
+                                security_groups_names):
+    """
+    This method will check if security group is attached to server, the
+    attached security groups are compared by id when the id is reported and
+    by name otherwise
+    :param str security_group_id: Security group id
+    :param list attached_security_groups: Security groups attached to the
+    server as reported by openstack
+    :param dict security_groups_names: Security groups names mapped by
+    their ids
+    :return bool: Flag to indicate whether security group is attached or not
+    """
+    for attached_sg in attached_security_groups:
+        if attached_sg.get('id'):
+            if attached_sg['id'] == security_group_id:
+                return True
+        elif attached_sg.get('name') and attached_sg['name'] \
+                == security_groups_names.get(security_group_id):
+            return True
+    return False
 
 
 def _attach_security_groups_to_server(openstack_resource,
-                                      security_groups):
+                                      security_groups,
+                                      server=None,
+                                      attached_security_groups=None,
+                                      security_groups_names=None):
     """
     This method will connect all security groups configured to server using
-    relationships or node properties to attach them to
+    relationships or node properties to attach them to, security groups that
+    are already attached are skipped and the rest are attached one by one,
+    since each attach updates all the ports of server
     :param openstack_resource: instance of openstack server resource
     :param security_groups: List of security groups which should be
     added to the server
+    :param server: Prefetched instance of openstack.compute.v2.server.Server
+    :param list attached_security_groups: Security groups already attached
+    to the server as reported by openstack
+    :param dict security_groups_names: Security groups names mapped by
+    their ids
     """
+    attached_security_groups = attached_security_groups or []
+    security_groups_names = security_groups_names or {}
+
+    attached_ids = []
     for security_group in security_groups or []:
-        openstack_resource.add_security_group_to_server(
-            security_group.get('id')
-        )
+        security_group_id = security_group.get('id')
+        if security_group_id in attached_ids or _is_security_group_attached(
+                security_group_id,
+                attached_security_groups,
+                security_groups_names):
+            ctx.logger.debug(
+                'Security group {0} is already attached to server {1}'
+                ''.format(security_group_id, openstack_resource.resource_id))
+            continue
+        openstack_resource.add_security_group_to_server(security_group_id,
+                                                        server)
+        attached_ids.append(security_group_id)
 
 
 def _handle_disconnect_external_ip_from_server():
@@ -1394,12 +1552,14 @@ def _handle_detach_external_volume_from_server():
                     'external volume and server are being used')
 
 
-def _handle_connect_security_groups_to_server(openstack_resource):
+def _handle_connect_security_groups_to_server(openstack_resource,
+                                              server=None):
     """
     This method will connect all security groups configured to server using
     relationships or node properties to attach them to
     :param openstack_resource: Instance Of OpenstackServer in order to
     use it
+    :param server: Prefetched instance of openstack.compute.v2.server.Server
     """
     # Get the security groups for the server so that we can attach them
     security_groups = ctx.instance.runtime_properties.get('security_groups')
@@ -1415,17 +1575,38 @@ def _handle_connect_security_groups_to_server(openstack_resource):
         # groups attached to port which already link to server.
         # "has_sg" give an indication if we should remove the "Default"
         # security group or not which will be attached in index "0"
-        remote_server = openstack_resource.get()
-        if not has_sg and remote_server.security_groups:
-            sg_name = remote_server.security_groups[0].get('name')
-            if sg_name:
-                openstack_resource.remove_security_group_from_server(sg_name)
+        remote_server = server or openstack_resource.get()
+        attached_security_groups = remote_server.security_groups or []
+        # Names are only needed to compare against the attached groups that
+        # are reported without their ids
+        security_groups_names = _get_security_groups_names(
+            openstack_resource.client_config,
+            [sg.get('id') for sg in security_groups]) \
+            if any(not sg.get('id') for sg in attached_security_groups) \
+            else {}
+
+        if not has_sg and attached_security_groups:
+            default_sg = attached_security_groups[0]
+            default_sg_id = default_sg.get('id') or default_sg.get('name')
+            # No need to remove it when it is one of the configured groups
+            if default_sg_id and not any(
+                    _is_security_group_attached(sg.get('id'),
+                                                [default_sg],
+                                                security_groups_names)
+                    for sg in security_groups):
+                openstack_resource.remove_security_group_from_server(
+                    default_sg_id, remote_server)
+                attached_security_groups = attached_security_groups[1:]
 
         # Since there is an issue with attaching security groups to server in
-        # creation, we added this method to use another api call to add each
-        # provided security groups one by one to the server
+        # creation, we added this method to use another api call to add the
+        # provided security groups which are not already attached to server
         _attach_security_groups_to_server(
-            openstack_resource, security_groups
+            openstack_resource,
+            security_groups,
+            remote_server,
+            attached_security_groups,
+            security_groups_names
         )
         # Update the server object with the attached security groups.
         ctx.instance.runtime_properties['server']['security_groups'] = \
@@ -1515,19 +1696,51 @@ def _validate_external_volume_connection(openstack_resource):
         'connected'.format(openstack_resource.resource_id, volume_id))
 
 
-def _validate_security_groups_on_ports(server_networks, client_config):
+def _validate_security_groups_on_ports(server_networks,
+                                       client_config,
+                                       resource_lookup=None):
     if not isinstance(server_networks, list):
         return
-    for net in server_networks:
-        if net.get('port'):
-            port = OpenstackPort(client_config=client_config,
-                                 logger=ctx.logger)
-            port.resource_id = net['port']
-            response = port.get()
-            # If at least on port has security group return
-            if response.security_group_ids:
-                return True
-    return False
+    ports = _lookup_resources([(OpenstackPort, net['port'])
+                               for net in server_networks if net.get('port')],
+                              client_config,
+                              resource_lookup)
+    # If at least on port has security group return
+    return any(port.security_group_ids for port in ports)
+
+
+def _prefetch_server_dependencies(openstack_resource, resource_lookup):
+    """
+    This method will lookup concurrently the flavor, image, security groups,
+    ports and networks needed to create the server, so that the server
+    config builders do not wait on these lookups one after another
+    :param openstack_resource: An instance of OpenstackServer
+    :param resource_lookup: Instance of ResourceLookup
+    """
+    config = openstack_resource.config
+    requests = []
+    flavor = _get_flavor_or_image_value(openstack_resource, 'flavor')
+    if flavor:
+        requests.append((OpenstackFlavor, flavor))
+    image = _get_flavor_or_image_value(openstack_resource, 'image')
+    if image and not _get_boot_volume_targets():
+        requests.append((OpenstackImage, image))
+
+    for sg in config.get('security_groups') or []:
+        if sg.get('name'):
+            requests.append((OpenstackSecurityGroup, sg['name']))
+
+    nics = list(get_networks_from_relationships(ctx))
+    if isinstance(config.get('networks'), list):
+        nics.extend(config['networks'])
+    port_ids = find_openstack_ids_of_connected_nodes_by_openstack_type(
+        ctx, PORT_OPENSTACK_TYPE)
+    port_ids.extend(nic['port'] for nic in nics if nic.get('port'))
+    requests.extend((OpenstackPort, port_id) for port_id in port_ids)
+    requests.extend((OpenstackNetwork, nic['uuid'])
+                    for nic in nics if nic.get('uuid'))
+
+    resource_lookup.prefetch(requests)
 
 
 @with_compat_node
@@ -1551,26 +1764,34 @@ def create(openstack_resource):
     if user_data:
         openstack_resource.config['user_data'] = user_data
 
+    # Lookup all the resources needed to create the server concurrently
+    # before they are used to build the server config
+    resource_lookup = ResourceLookup(client_config, logger=ctx.logger)
+    _prefetch_server_dependencies(openstack_resource, resource_lookup)
+
     # Update server config by depending on relationships
     _update_server_config(openstack_resource.config,
-                          openstack_resource.client_config)
+                          openstack_resource.client_config,
+                          resource_lookup=resource_lookup)
 
     # Update flavor and image for server
-    _update_flavor_and_image_config(openstack_resource)
+    _update_flavor_and_image_config(openstack_resource,
+                                    resource_lookup=resource_lookup)
 
     # Grab all the security groups to attach them to server in configure
     # operation because create server has issue and cannot attached security
     # groups to server when creating server
     security_groups = _get_security_groups_config(
         config,
-        client_config=client_config
+        client_config=client_config,
+        resource_lookup=resource_lookup
     )
     # Check to see if ports already atatched to server assoicated with
     # security groups or not. Will be useful to determine if its needed to
     # remove the "Default" security groups
     server_networks = config.get('networks') or []
     has_sg = _validate_security_groups_on_ports(
-        server_networks, client_config
+        server_networks, client_config, resource_lookup=resource_lookup
     )
     ctx.instance.runtime_properties['__security_groups_link_to_port'] = has_sg
 
@@ -1608,13 +1829,29 @@ def configure(openstack_resource):
     Populate required runtime properties for server when it is in active status
     :param openstack_resource: instance of openstack server resource
     """
-    # Get the details for the created servers instance
-    server = openstack_resource.get()
+    def _get_server_status():
+        # Get the details for the created servers instance
+        _server = openstack_resource.get()
+        if _server.status == SERVER_STATUS_ERROR:
+            raise NonRecoverableError(
+                'Server {0} cannot be started, '
+                'because it is on error state'.format(_server.id))
+        return _server, _server.status == SERVER_STATUS_ACTIVE
+
+    # Wait for the server to be active, until the wait budget runs out
+    server, active = wait_for_resource(_get_server_status)
 
     # Get the server status
     status = server.status
-    if status == SERVER_STATUS_ACTIVE:
+    if active:
         ctx.logger.info('Server {0} is already started'.format(server.id))
+        # Only the first time the created server is observed active is a
+        # creation transition, later runs would record its whole lifetime
+        if SERVER_CREATION_RECORDED not in ctx.instance.runtime_properties:
+            record_creation_transition(SERVER_OPENSTACK_TYPE,
+                                       server,
+                                       SERVER_STATUS_ACTIVE)
+            ctx.instance.runtime_properties[SERVER_CREATION_RECORDED] = True
         # Set ips for server as runtime properties
         _set_server_ips_runtime_properties(server)
 
@@ -1624,16 +1861,16 @@ def configure(openstack_resource):
         # Handle actual connection of security groups to server
         if '__security_groups_attached' not in \
                 ctx.instance.runtime_properties:
-            _handle_connect_security_groups_to_server(openstack_resource)
+            _handle_connect_security_groups_to_server(openstack_resource,
+                                                      server)
         return
-    elif status == SERVER_STATUS_ERROR:
-        raise NonRecoverableError(
-            'Server {0} cannot be started, '
-            'because it is on error state'.format(server.id))
     else:
         raise OperationRetry(
             message='Waiting for server to be in {0} state but is in {1} '
-                    'state. Retrying...'.format(SERVER_STATUS_ACTIVE, status))
+                    'state. Retrying...'.format(SERVER_STATUS_ACTIVE, status),
+            retry_after=get_creation_retry_after(SERVER_OPENSTACK_TYPE,
+                                                 server,
+                                                 SERVER_STATUS_ACTIVE))
 
 
 @with_compat_node
@@ -1658,8 +1895,23 @@ def delete(openstack_resource):
 
     # Check if delete operation triggered or not before
     if SERVER_TASK_DELETE not in ctx.instance.runtime_properties:
-        openstack_resource.delete()
+        openstack_resource.delete(server)
         ctx.instance.runtime_properties[SERVER_TASK_DELETE] = True
+        # save flag as current state before waiting for the server
+        ctx.instance.update()
+
+    def _is_server_deleted():
+        try:
+            return openstack_resource.get(), False
+        except exceptions.ResourceNotFound:
+            return None, True
+
+    # Wait for the server to be deleted, until the wait budget runs out
+    server, deleted = wait_for_resource(_is_server_deleted, (server, False))
+    if deleted:
+        ctx.logger.info('Server {0} is deleted successfully'
+                        .format(openstack_resource.resource_id))
+        return
 
     ctx.logger.info('Waiting for server "{0}" to be deleted.'
                     ' current status: {1}'.format(server.id, server.status))
@@ -2133,30 +2385,38 @@ def disconnect_security_group(openstack_resource, security_group_id):
     # and it will be enough to just remove security group from server ports
     # If server has ports then we should remove security group from server
     # and then remove security group from ports
+    # The server ports are listed once with only the fields required to
+    # update their security groups, the same list is used to clean them up
     port_resource = OpenstackPort(
         client_config=openstack_resource.client_config,
         logger=ctx.logger
     )
     server_ports = list(port_resource.list(
-        query={'device_id': openstack_resource.resource_id})
+        query={'device_id': openstack_resource.resource_id,
+               'fields': SERVER_PORT_SECURITY_GROUPS_FIELDS})
     )
     if server_ports:
         openstack_resource.remove_security_group_from_server(security_group_id)
 
-    # Get the payload for server from runtime properties in order to get the
-    # ports information attached to the server which will automatically
-    # reference the disconnected security group which will cause an issue
-    # when trying to delete security group, so we should break the
-    # connection between the ports attached to the server and the security
-    # group
+    # The ports of the server may still reference the disconnected security
+    # group which will cause an issue when trying to delete security group,
+    # so we should break the connection between the server ports and the
+    # security group. This also covers the ports from server payload that
+    # were detached from the server. Ports already updated by removing the
+    # security group from server are fetched again on revision conflict
     server_payload = \
-        ctx.source.instance.runtime_properties.get(SERVER_OPENSTACK_TYPE)
-    if server_payload:
-        _disconnect_security_group_from_server_ports(
-            openstack_resource.client_config,
-            server_payload,
-            security_group_id
-        )
+        ctx.source.instance.runtime_properties.get(SERVER_OPENSTACK_TYPE) \
+        or {}
+    port_ids = [network[PORT_OPENSTACK_TYPE]
+                for network in server_payload.get('networks') or []
+                if isinstance(network, dict)
+                and network.get(PORT_OPENSTACK_TYPE)]
+    _disconnect_security_group_from_server_ports(
+        openstack_resource.client_config,
+        security_group_id,
+        server_ports,
+        port_ids
+    )
 
 
 @with_compat_node
@@ -2181,7 +2441,11 @@ def update(openstack_resource, args):
 def list_servers(openstack_resource,
                  query=None,
                  all_projects=False,
-                 details=True):
+                 details=True,
+                 limit=None,
+                 marker=None,
+                 max_items=None,
+                 fields=None):
     """
     List openstack servers based on filters applied
     :param openstack_resource: Instance of current openstack server
@@ -2194,9 +2458,18 @@ def list_servers(openstack_resource,
                 will be returned. The default, ``True``, will cause
                 :class:`~openstack.compute.v2.server.ServerDetail`
                 instances to be returned.
-    """
-    servers = openstack_resource.list(details, all_projects, query)
-    add_resource_list_to_runtime_properties(SERVER_OPENSTACK_TYPE, servers)
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
+    """
+    servers = openstack_resource.list(details,
+                                      all_projects,
+                                      get_list_query(query, limit, marker))
+    add_resource_list_to_runtime_properties(SERVER_OPENSTACK_TYPE, servers,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
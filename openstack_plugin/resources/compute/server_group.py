@@ -25,7 +25,8 @@ from openstack_plugin.constants import (RESOURCE_ID,
                                         SERVER_GROUP_OPENSTACK_TYPE)
 
 from openstack_plugin.utils import (validate_resource_quota,
-                                    add_resource_list_to_runtime_properties)
+                                    add_resource_list_to_runtime_properties,
+                                    get_list_query)
 
 
 @with_compat_node
@@ -66,16 +67,29 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackServerGroup)
-def list_server_groups(openstack_resource, query=None):
+def list_server_groups(openstack_resource,
+                       query=None,
+                       limit=None,
+                       marker=None,
+                       max_items=None,
+                       fields=None):
     """
     List openstack server groups
     :param openstack_resource: Instance of openstack sever group.
     :param kwargs query: Optional query parameters to be sent to limit
         the server groups being returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
-    server_groups = openstack_resource.list(query)
+    server_groups = openstack_resource.list(
+        get_list_query(query, limit, marker))
     add_resource_list_to_runtime_properties(SERVER_GROUP_OPENSTACK_TYPE,
-                                            server_groups)
+                                            server_groups,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
@@ -63,12 +63,16 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackGroup)
-def list_groups(openstack_resource, query=None):
+def list_groups(openstack_resource, query=None, max_items=None, fields=None):
     """
     List openstack groups
     :param openstack_resource: Instance of openstack group.
     :param kwargs query: Optional query parameters to be sent to limit
                                  the resources being returned.
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
     groups = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(GROUP_OPENSTACK_TYPE, groups)
+    add_resource_list_to_runtime_properties(GROUP_OPENSTACK_TYPE, groups,
+                                            max_items=max_items,
+                                            fields=fields)
@@ -313,15 +313,19 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackProject)
-def list_projects(openstack_resource, query=None):
+def list_projects(openstack_resource, query=None, max_items=None, fields=None):
     """
     List openstack projects
     :param openstack_resource: Instance of openstack project.
     :param kwargs query: Optional query parameters to be sent to limit
                                  the resources being returned.
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
     projects = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(PROJECT_OPENSTACK_TYPE, projects)
+    add_resource_list_to_runtime_properties(PROJECT_OPENSTACK_TYPE, projects,
+                                            max_items=max_items,
+                                            fields=fields)
 
 
 @with_compat_node
@@ -63,12 +63,16 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackRole)
-def list_roles(openstack_resource, query=None):
+def list_roles(openstack_resource, query=None, max_items=None, fields=None):
     """
     List openstack roles
     :param openstack_resource: Instance of openstack role.
     :param kwargs query: Optional query parameters to be sent to limit
                                  the resources being returned.
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
     roles = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(ROLE_OPENSTACK_TYPE, roles)
+    add_resource_list_to_runtime_properties(ROLE_OPENSTACK_TYPE, roles,
+                                            max_items=max_items,
+                                            fields=fields)
@@ -25,7 +25,8 @@ from openstack_plugin.decorators import (with_openstack_resource,
 from openstack_plugin.constants import RESOURCE_ID
 from openstack_plugin.utils import (validate_resource_quota,
                                     reset_dict_empty_keys,
-                                    add_resource_list_to_runtime_properties)
+                                    add_resource_list_to_runtime_properties,
+                                    get_list_query)
 
 from openstack_plugin.constants import NETWORK_OPENSTACK_TYPE
 
@@ -81,15 +82,28 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackNetwork)
-def list_networks(openstack_resource, query=None):
+def list_networks(openstack_resource,
+                  query=None,
+                  limit=None,
+                  marker=None,
+                  max_items=None,
+                  fields=None):
     """
     List openstack networks based on filters applied
     :param openstack_resource: Instance of current openstack network
     :param kwargs query: Optional query parameters to be sent to limit
             the networks being returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
-    networks = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(NETWORK_OPENSTACK_TYPE, networks)
+    networks = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
+    add_resource_list_to_runtime_properties(NETWORK_OPENSTACK_TYPE, networks,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
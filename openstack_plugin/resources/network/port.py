@@ -34,6 +34,7 @@ from openstack_plugin.utils import (
     reset_dict_empty_keys,
     validate_resource_quota,
     add_resource_list_to_runtime_properties,
+    get_list_query,
     find_openstack_ids_of_connected_nodes_by_openstack_type)
 
 
@@ -207,14 +208,12 @@ def _clean_addresses_from_external_port(openstack_resource):
     while the port node created at install workflow
     :param openstack_resource:
     """
-    # Get the external port using the resource id provided via port node
-    external_port = openstack_resource.get()
     # Check if the current port node has allowed_address_pairs as part of
     # resource_config
     addresses_to_remove = openstack_resource.config.get(
         'allowed_address_pairs')
 
-    if addresses_to_remove:
+    def _get_updated_pairs(external_port):
         remote_addresses = external_port.allowed_address_pairs or []
         # Get the remote ips from the each pair
         remote_ips = \
@@ -239,9 +238,12 @@ def _clean_addresses_from_external_port(openstack_resource):
         updated_pairs = []
         for ip_address in diff_ips:
             updated_pairs.append({'ip_address': ip_address})
+        return {'allowed_address_pairs': updated_pairs}
 
-        # Update port for allowed paris
-        openstack_resource.update({'allowed_address_pairs':  updated_pairs})
+    if addresses_to_remove:
+        # Update port for allowed paris, the pairs are computed again from
+        # the external port if it was changed by another update
+        openstack_resource.update(_get_updated_pairs)
 
 
 def _update_port_association(client_config, port_id, device_id=''):
@@ -498,15 +500,28 @@ def detach_from_server(openstack_resource, device_id):
 
 @with_compat_node
 @with_openstack_resource(OpenstackPort)
-def list_ports(openstack_resource, query=None):
+def list_ports(openstack_resource,
+               query=None,
+               limit=None,
+               marker=None,
+               max_items=None,
+               fields=None):
     """
     List openstack ports based on filters applied
     :param openstack_resource: Instance of current openstack port
     :param kwargs query: Optional query parameters to be sent to limit
             the ports being returned.
-    """
-    ports = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(PORT_OPENSTACK_TYPE, ports)
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
+    """
+    ports = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
+    add_resource_list_to_runtime_properties(PORT_OPENSTACK_TYPE, ports,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
@@ -37,6 +37,7 @@ from openstack_plugin.utils import (reset_dict_empty_keys,
                                     merge_resource_config,
                                     validate_resource_quota,
                                     add_resource_list_to_runtime_properties,
+                                    get_list_query,
                                     find_relationships_by_relationship_type)
 
 
@@ -304,17 +305,30 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackRBACPolicy)
-def list_rbac_policies(openstack_resource, query=None):
+def list_rbac_policies(openstack_resource,
+                       query=None,
+                       limit=None,
+                       marker=None,
+                       max_items=None,
+                       fields=None):
     """
     List openstack rbac policies based on filters applied
     :param openstack_resource: Instance of current openstack rbac policy
     :param kwargs query: Optional query parameters to be sent to limit
             the rbac policies being returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
 
-    rbac_policies = openstack_resource.list(query)
+    rbac_policies = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
     add_resource_list_to_runtime_properties(RBAC_POLICY_OPENSTACK_TYPE,
-                                            rbac_policies)
+                                            rbac_policies,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
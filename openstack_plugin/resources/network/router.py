@@ -32,6 +32,7 @@ from openstack_plugin.utils import (
     reset_dict_empty_keys,
     validate_resource_quota,
     add_resource_list_to_runtime_properties,
+    get_list_query,
     find_openstack_ids_of_connected_nodes_by_openstack_type)
 
 
@@ -231,15 +232,28 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackRouter)
-def list_routers(openstack_resource, query=None):
+def list_routers(openstack_resource,
+                 query=None,
+                 limit=None,
+                 marker=None,
+                 max_items=None,
+                 fields=None):
     """
     List openstack routers based on filters applied
     :param openstack_resource: Instance of current openstack router
     :param kwargs query: Optional query parameters to be sent to limit
             the routers being returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
-    routers = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(ROUTER_OPENSTACK_TYPE, routers)
+    routers = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
+    add_resource_list_to_runtime_properties(ROUTER_OPENSTACK_TYPE, routers,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
@@ -295,9 +309,9 @@ def start(openstack_resource, **kwargs):
         # Store routes in order to use them later on in order to remove them
         # when the stop operation for router trigger
         ctx.instance.runtime_properties['routes'] = kwargs['routes']
-        routes = dict()
-        routes['routes'] = kwargs['routes']
-        openstack_resource.update(routes)
+        # All routes of the node are added in one call without touching
+        # the routes added by other nodes
+        openstack_resource.add_routes(kwargs['routes'])
 
 
 @with_compat_node
@@ -314,15 +328,5 @@ def stop(openstack_resource):
         # Routes need to be removed
         routes_to_delete = ctx.instance.runtime_properties['routes']
 
-        # Get the remote router info
-        router = openstack_resource.get()
-
-        updated_routes = []
-        remote_routes = router['routes'] or {}
-        for remote_route in remote_routes:
-            if remote_route not in routes_to_delete:
-                updated_routes.append(remote_route)
-
-        routes = dict()
-        routes['routes'] = updated_routes
-        openstack_resource.update(routes)
+        # Only the routes added by this node are removed from the router
+        openstack_resource.remove_routes(routes_to_delete)
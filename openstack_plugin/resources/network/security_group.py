@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Standard imports
+from collections import OrderedDict
+
 # Third party imports
 from cloudify import ctx
 
@@ -28,7 +31,10 @@ from openstack_plugin.constants import (RESOURCE_ID,
 from openstack_plugin.utils import (reset_dict_empty_keys,
                                     validate_resource_quota,
                                     add_resource_list_to_runtime_properties,
-                                    validate_ip_or_range_syntax)
+                                    get_list_query,
+                                    validate_ip_or_range_syntax,
+                                    compact_security_group_rules,
+                                    get_security_group_rule_key)
 
 
 def security_group_creation_validation(openstack_resource):
@@ -59,12 +65,19 @@ def create(openstack_resource):
 
 @with_compat_node
 @with_openstack_resource(OpenstackSecurityGroup)
-def configure(openstack_resource, security_group_rules=None):
+def configure(openstack_resource,
+              security_group_rules=None,
+              rules_chunk_size=None,
+              compact_rules=False):
     """
     This task will allow to add security group rules and attach them to
     created security group if they provided on the node configuration
     :param openstack_resource: security group instance
     :param security_group_rules: List of security group rules
+    :param int rules_chunk_size: Maximum number of rules created by each
+    bulk create request
+    :param bool compact_rules: Merge rules with contiguous port ranges and
+    adjacent CIDRs before creating them
     """
     client_config = ctx.node.properties.get('client_config')
     security_group_id = openstack_resource.resource_id
@@ -77,24 +90,28 @@ def configure(openstack_resource, security_group_rules=None):
     # Check if the "disable_default_egress_rules" is enabled or not so that
     # we can remove default egress rules for current security group
     if ctx.node.properties.get('disable_default_egress_rules'):
-        for sg_rule in security_group_rule.list(
-                query={'security_group_id': security_group_id}):
-
-            security_group_rule.resource_id = sg_rule.id
-            security_group_rule.delete()
+        sg_rules = security_group_rule.list(
+            query={'security_group_id': security_group_id})
+        security_group_rule.bulk_delete([sg_rule.id for sg_rule in sg_rules])
 
-    security_group_rule.resource_id = None
     # Check the existing rules attached to current security groups
     # in order to apply them to that group
-    for rule_config in security_group_rules:
+    for rule_config in security_group_rules or []:
         # Check if the config contains the security group id or not
         if not rule_config.get('security_group_id'):
             rule_config['security_group_id'] = security_group_id
 
-        # Create new instance for each security group id
-        security_group_rule.config = rule_config
-        # Create security group rule
-        security_group_rule.create()
+    if compact_rules and security_group_rules:
+        security_group_rules, removed = \
+            compact_security_group_rules(security_group_rules)
+        ctx.logger.info(
+            'Compacted security group rules, {0} rules were removed'.format(
+                removed))
+
+    # Create security group rules in chunks
+    if security_group_rules:
+        security_group_rule.bulk_create(security_group_rules,
+                                        chunk_size=rules_chunk_size)
 
 
 @with_compat_node
@@ -107,32 +124,146 @@ def delete(openstack_resource):
     openstack_resource.delete()
 
 
+def _get_default_egress_rules_keys():
+    """
+    This method will return the normalized default egress rules that are
+    added by openstack to every new security group
+    :return list: Normalized default egress rules
+    """
+    return [get_security_group_rule_key({'direction': 'egress',
+                                         'ethertype': ethertype})
+            for ethertype in ['IPv4', 'IPv6']]
+
+
+def _reconcile_security_group_rules(openstack_resource,
+                                    security_group_rules,
+                                    compact_rules=False):
+    """
+    This method will only create the missing rules and delete the rules
+    that are not desired anymore, the current rules of security group are
+    listed once and compared with the desired rules after normalizing them.
+    The default egress rules are kept unless "disable_default_egress_rules"
+    is enabled
+    :param openstack_resource: instance of openstack security group resource
+    :param list security_group_rules: Desired security group rules
+    :param bool compact_rules: Merge desired rules with contiguous port
+    ranges and adjacent CIDRs before comparing them with the current rules
+    """
+    security_group_id = openstack_resource.resource_id
+    security_group_rule = \
+        OpenstackSecurityGroupRule(
+            client_config=openstack_resource.client_config,
+            logger=ctx.logger)
+
+    rules = []
+    for rule_config in security_group_rules:
+        rule_config = dict(rule_config)
+        if not rule_config.get('security_group_id'):
+            rule_config['security_group_id'] = security_group_id
+        rules.append(rule_config)
+
+    if compact_rules and rules:
+        rules, removed = compact_security_group_rules(rules)
+        ctx.logger.info(
+            'Compacted security group rules, {0} rules were removed'.format(
+                removed))
+
+    desired_rules = OrderedDict()
+    for rule_config in rules:
+        desired_rules.setdefault(get_security_group_rule_key(rule_config),
+                                 rule_config)
+
+    # Default egress rules are not part of the desired rules, so they are
+    # only deleted when they are disabled for the security group
+    kept_rules = [] \
+        if ctx.node.properties.get('disable_default_egress_rules') \
+        else _get_default_egress_rules_keys()
+
+    current_rules = set()
+    rules_to_delete = []
+    for sg_rule in security_group_rule.list(
+            query={'security_group_id': security_group_id}):
+        rule_key = get_security_group_rule_key({
+            'direction': sg_rule.direction,
+            'ethertype': sg_rule.ether_type,
+            'protocol': sg_rule.protocol,
+            'port_range_min': sg_rule.port_range_min,
+            'port_range_max': sg_rule.port_range_max,
+            'remote_ip_prefix': sg_rule.remote_ip_prefix,
+            'remote_group_id': sg_rule.remote_group_id,
+        })
+        # Duplicate rules are also deleted
+        if rule_key in current_rules or \
+                (rule_key not in desired_rules and rule_key not in kept_rules):
+            rules_to_delete.append(sg_rule.id)
+        current_rules.add(rule_key)
+
+    rules_to_create = [rule for rule_key, rule in desired_rules.items()
+                       if rule_key not in current_rules]
+
+    ctx.logger.info(
+        'Updating security group {0} rules, {1} rules will be created and '
+        '{2} rules will be deleted'.format(security_group_id,
+                                           len(rules_to_create),
+                                           len(rules_to_delete)))
+    # Missing rules are created first, so that traffic allowed by both the
+    # current & the desired rules is not blocked while updating the rules
+    if rules_to_create:
+        security_group_rule.bulk_create(rules_to_create)
+    if rules_to_delete:
+        security_group_rule.bulk_delete(rules_to_delete)
+
+
 @with_compat_node
 @with_openstack_resource(OpenstackSecurityGroup)
-def update(openstack_resource, args):
+def update(openstack_resource,
+           args,
+           security_group_rules=None,
+           compact_rules=False):
     """
     Update openstack security group by passing args dict that contains
     the info that need to be updated
     :param openstack_resource: instance of openstack security group resource
     :param args: dict of information need to be updated
+    :param list security_group_rules: Desired security group rules, when
+    provided the rules of security group are updated to match them
+    :param bool compact_rules: Merge rules with contiguous port ranges and
+    adjacent CIDRs before updating the rules
     """
     args = reset_dict_empty_keys(args)
     openstack_resource.update(args)
+    if security_group_rules is not None:
+        _reconcile_security_group_rules(openstack_resource,
+                                        security_group_rules,
+                                        compact_rules=compact_rules)
 
 
 @with_compat_node
 @with_openstack_resource(OpenstackSecurityGroup)
-def list_security_groups(openstack_resource, query=None):
+def list_security_groups(openstack_resource,
+                         query=None,
+                         limit=None,
+                         marker=None,
+                         max_items=None,
+                         fields=None):
     """
     List openstack security groups based on filters applied
     :param openstack_resource: Instance of current openstack security group
     :param kwargs query: Optional query parameters to be sent to limit
             the security groups being returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
 
-    security_groups = openstack_resource.list(query)
+    security_groups = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
     add_resource_list_to_runtime_properties(SECURITY_GROUP_OPENSTACK_TYPE,
-                                            security_groups)
+                                            security_groups,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
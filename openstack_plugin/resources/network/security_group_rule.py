@@ -22,7 +22,8 @@ from openstack_plugin.decorators import with_openstack_resource
 from openstack_plugin.constants import (RESOURCE_ID,
                                         SECURITY_GROUP_RULE_OPENSTACK_TYPE)
 from openstack_plugin.utils import (validate_resource_quota,
-                                    add_resource_list_to_runtime_properties)
+                                    add_resource_list_to_runtime_properties,
+                                    get_list_query)
 
 
 @with_openstack_resource(OpenstackSecurityGroupRule)
@@ -47,18 +48,31 @@ def delete(openstack_resource):
 
 
 @with_openstack_resource(OpenstackSecurityGroupRule)
-def list_security_group_rules(openstack_resource, query=None):
+def list_security_group_rules(openstack_resource,
+                              query=None,
+                              limit=None,
+                              marker=None,
+                              max_items=None,
+                              fields=None):
     """
     List openstack security group rules based on filters applied
     :param openstack_resource: Instance of current openstack security group
     rule
     :param kwargs query: Optional query parameters to be sent to limit
     the security group rules being returned.
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
     """
 
-    security_group_rules = openstack_resource.list(query)
+    security_group_rules = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
     add_resource_list_to_runtime_properties(SECURITY_GROUP_RULE_OPENSTACK_TYPE,
-                                            security_group_rules)
+                                            security_group_rules,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_openstack_resource(OpenstackSecurityGroupRule)
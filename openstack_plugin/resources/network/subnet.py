@@ -30,6 +30,7 @@ from openstack_plugin.utils import (
     reset_dict_empty_keys,
     validate_resource_quota,
     add_resource_list_to_runtime_properties,
+    get_list_query,
     find_openstack_ids_of_connected_nodes_by_openstack_type,
     validate_ip_or_range_syntax)
 
@@ -134,15 +135,28 @@ def update(openstack_resource, args):
 
 @with_compat_node
 @with_openstack_resource(OpenstackSubnet)
-def list_subnets(openstack_resource, query=None):
+def list_subnets(openstack_resource,
+                 query=None,
+                 limit=None,
+                 marker=None,
+                 max_items=None,
+                 fields=None):
     """
     List openstack subnets based on filters applied
     :param openstack_resource: Instance of current openstack network
     :param kwargs query: Optional query parameters to be sent to limit
             the networks being returned.
-    """
-    subnets = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(SUBNET_OPENSTACK_TYPE, subnets)
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
+    """
+    subnets = openstack_resource.list(
+        get_list_query(query, limit, marker, fields))
+    add_resource_list_to_runtime_properties(SUBNET_OPENSTACK_TYPE, subnets,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
@@ -22,6 +22,9 @@ from cloudify.exceptions import (OperationRetry, NonRecoverableError)
 import openstack.exceptions
 
 # Local imports
+from openstack_sdk.common import (ResourceStatusPoller,
+                                  STATUS_MISSING,
+                                  run_concurrently)
 from openstack_sdk.resources.volume import (OpenstackVolume,
                                             OpenstackVolumeBackup,
                                             OpenstackVolumeSnapshot)
@@ -39,6 +42,8 @@ from openstack_plugin.constants import (RESOURCE_ID,
                                         VOLUME_BACKUP_TASK,
                                         VOLUME_SNAPSHOT_TASK,
                                         VOLUME_BACKUP_ID,
+                                        VOLUME_BACKUP_DELETE_IDS,
+                                        VOLUME_BACKUP_DELETE_STARTED_AT,
                                         VOLUME_SNAPSHOT_ID,
                                         VOLUME_BOOTABLE,
                                         VOLUME_BACKUP_OPENSTACK_TYPE,
@@ -48,8 +53,14 @@ from openstack_plugin.utils import (
     merge_resource_config,
     get_ready_resource_status,
     wait_until_status,
+    wait_for_resource,
+    get_creation_retry_after,
+    record_creation_transition,
+    get_deletion_retry_after,
+    record_deletion_transition,
     get_snapshot_name,
     add_resource_list_to_runtime_properties,
+    get_list_query,
     find_openstack_ids_of_connected_nodes_by_openstack_type)
 
 
@@ -184,16 +195,23 @@ def _create_volume_backup(volume_resource, backup_name):
         # save flag as current state before external call
         ctx.instance.update()
 
-    backup_resource, ready = \
-        get_ready_resource_status(backup,
-                                  VOLUME_BACKUP_OPENSTACK_TYPE,
-                                  VOLUME_STATUS_AVAILABLE,
-                                  VOLUME_ERROR_STATUSES)
+    backup_resource, ready = wait_for_resource(
+        lambda: get_ready_resource_status(backup,
+                                          VOLUME_BACKUP_OPENSTACK_TYPE,
+                                          VOLUME_STATUS_AVAILABLE,
+                                          VOLUME_ERROR_STATUSES))
 
     if not ready:
-        raise OperationRetry('Volume backup is still in {0} status'.format(
-            backup_resource.status))
+        raise OperationRetry(
+            'Volume backup is still in {0} status'.format(
+                backup_resource.status),
+            retry_after=get_creation_retry_after(VOLUME_BACKUP_OPENSTACK_TYPE,
+                                                 backup_resource,
+                                                 VOLUME_STATUS_AVAILABLE))
     else:
+        record_creation_transition(VOLUME_BACKUP_OPENSTACK_TYPE,
+                                   backup_resource,
+                                   VOLUME_STATUS_AVAILABLE)
         del ctx.instance.runtime_properties[VOLUME_BACKUP_TASK]
         del ctx.instance.runtime_properties[VOLUME_BACKUP_ID]
 
@@ -241,16 +259,24 @@ def _create_volume_snapshot(volume_resource, snapshot_name, snapshot_type):
         ctx.instance.update()
 
     # Check the status of the snapshot process
-    snapshot_resource, ready = \
-        get_ready_resource_status(snapshot,
-                                  VOLUME_SNAPSHOT_OPENSTACK_TYPE,
-                                  VOLUME_STATUS_AVAILABLE,
-                                  VOLUME_ERROR_STATUSES)
+    snapshot_resource, ready = wait_for_resource(
+        lambda: get_ready_resource_status(snapshot,
+                                          VOLUME_SNAPSHOT_OPENSTACK_TYPE,
+                                          VOLUME_STATUS_AVAILABLE,
+                                          VOLUME_ERROR_STATUSES))
 
     if not ready:
-        raise OperationRetry('Volume snapshot is still in {0} status'.format(
-            snapshot_resource.status))
+        raise OperationRetry(
+            'Volume snapshot is still in {0} status'.format(
+                snapshot_resource.status),
+            retry_after=get_creation_retry_after(
+                VOLUME_SNAPSHOT_OPENSTACK_TYPE,
+                snapshot_resource,
+                VOLUME_STATUS_AVAILABLE))
     else:
+        record_creation_transition(VOLUME_SNAPSHOT_OPENSTACK_TYPE,
+                                   snapshot_resource,
+                                   VOLUME_STATUS_AVAILABLE)
         # Once the snapshot is ready to user, we should clear volume
         # snapshot task & snapshot volume id from runtime properties in order
         # to allow trigger the operation multiple times
@@ -258,6 +284,22 @@ def _create_volume_snapshot(volume_resource, snapshot_name, snapshot_type):
         del ctx.instance.runtime_properties[VOLUME_SNAPSHOT_ID]
 
 
+def _get_backup_instance(backup_instance, backup_id):
+    """
+    This method will prepare new instance of volume backup | snapshot, so
+    that backups can be handled concurrently
+    :param backup_instance: This is an instance of volume backup or
+    volume snapshot (OpenstackVolumeBackup | OpenstackVolumeSnapshot)
+    :param str backup_id: The backup | snapshot id
+    :return: Instance of OpenstackVolumeBackup | OpenstackVolumeSnapshot
+    """
+    backup = type(backup_instance)(
+        client_config=backup_instance.client_config,
+        logger=backup_instance.logger)
+    backup.resource_id = backup_id
+    return backup
+
+
 def _clean_volume_backups(backup_instance, backup_type, search_opts):
     """
     This method will clean all backups | snapshots volume based on provided
@@ -272,38 +314,66 @@ def _clean_volume_backups(backup_instance, backup_type, search_opts):
     if all([search_opts, backup_instance]):
         name = search_opts.get('name')
         volume_id = search_opts.get('volume_id')
-        # Since list backups volume does not support query filters for volume
-        # id & name, then we need to take that into consideration since
-        # passing volume_id & name to the backups api will raise
-        # InvalidResourceQuery error
-        search_query = {}
-        if backup_type == VOLUME_SNAPSHOT_OPENSTACK_TYPE:
-            search_query = search_opts
-
-        # Right now list volume backup does not support to list backups
-        # using backup name and volume id, so that we need to list all
-        # volumes backups and then just do a compare to match the one we
-        # need to delete
-        for backup in backup_instance.list(query=search_query):
-            if _is_volume_backup_matched(backup, volume_id, name):
+        # The name & volume id filters are applied by the API only when the
+        # block storage microversion supports them, otherwise all backups
+        # are listed, so the listed backups are always matched locally too.
+        # The backups are listed and deleted only once, then the deleted
+        # backups are tracked using their ids
+        delete_ids_key = VOLUME_BACKUP_DELETE_IDS.format(backup_type)
+        started_at_key = VOLUME_BACKUP_DELETE_STARTED_AT.format(backup_type)
+        backup_ids = ctx.instance.runtime_properties.get(delete_ids_key)
+        if backup_ids is None:
+            backup_ids = []
+            for backup in backup_instance.list(query=search_opts):
+                if _is_volume_backup_matched(backup, volume_id, name):
+                    ctx.logger.debug(
+                        'Check {0} before delete: {1}:{2}'
+                        ' with state {3}'.format(backup_type, backup.id,
+                                                 backup.name, backup.status))
+                    backup_ids.append(backup.id)
+
+            ctx.instance.runtime_properties[started_at_key] = time.time()
+            run_concurrently(
+                lambda backup: backup.delete(),
+                [_get_backup_instance(backup_instance, backup_id)
+                 for backup_id in backup_ids])
+            ctx.instance.runtime_properties[delete_ids_key] = backup_ids
+            # save deleted ids as current state before waiting for them
+            ctx.instance.update()
+
+        # The deleted backups are polled together using one list call with
+        # the same search criteria, instead of getting each backup
+        status_poller = ResourceStatusPoller(backup_instance,
+                                             backup_ids,
+                                             query=search_opts)
+
+        def _get_remaining_backups():
+            # Only backups that still exist are checked on the next poll
+            status_poller.unwatch(status_poller.poll()[STATUS_MISSING])
+            remaining_ids = status_poller.resource_ids
+            for backup_id in remaining_ids:
                 ctx.logger.debug(
-                    'Check {0} before delete: {1}:{2}'
-                    ' with state {3}'.format(backup_type, backup.id,
-                                             backup.name, backup.status))
-                backup_instance.resource_id = backup.id
-                backup_instance.delete()
-
-        # wait 10 seconds before next check
-        time.sleep(10)
-
-        for backup in backup_instance.list(query=search_query):
-            ctx.logger.debug('Check {0} after delete: {1}:{2} with state {3}'
-                             .format(backup_type, backup.id,
-                                     backup.name, backup.status))
-            if _is_volume_backup_matched(backup, volume_id, name):
-                return ctx.operation.retry(
-                    message='{0} is still alive'.format(backup.name),
-                    retry_after=30)
+                    'Check {0} after delete: {1}'.format(backup_type,
+                                                         backup_id))
+            return remaining_ids, not remaining_ids
+
+        remaining_ids, deleted = wait_for_resource(_get_remaining_backups)
+        # The retry interval is computed from the observed durations of
+        # deleting backups of the same type
+        started_at = ctx.instance.runtime_properties.get(started_at_key)
+        if not deleted:
+            ctx.instance.runtime_properties[delete_ids_key] = remaining_ids
+            return ctx.operation.retry(
+                message='{0} {1} is still alive'.format(
+                    backup_type, ', '.join(remaining_ids)),
+                retry_after=get_deletion_retry_after(backup_type,
+                                                     started_at,
+                                                     default=30))
+        # Only deletions that actually waited for backups are observed
+        if backup_ids:
+            record_deletion_transition(backup_type, started_at)
+        del ctx.instance.runtime_properties[delete_ids_key]
+        ctx.instance.runtime_properties.pop(started_at_key, None)
     else:
         raise NonRecoverableError('volume_id, name, backup_instance '
                                   'variables cannot all set to None')
@@ -394,7 +464,8 @@ def start(openstack_resource, **kwargs):
     volume = wait_until_status(openstack_resource,
                                VOLUME_OPENSTACK_TYPE,
                                VOLUME_STATUS_AVAILABLE,
-                               VOLUME_ERROR_STATUSES)
+                               VOLUME_ERROR_STATUSES,
+                               track_creation=True)
 
     # Set volume runtime properties needed when attach bootable volume to
     # server
@@ -520,15 +591,28 @@ def delete(openstack_resource):
 
 @with_compat_node
 @with_openstack_resource(OpenstackVolume)
-def list_volumes(openstack_resource, query=None):
+def list_volumes(openstack_resource,
+                 query=None,
+                 limit=None,
+                 marker=None,
+                 max_items=None,
+                 fields=None):
     """
     List openstack volumes based on filters applied
     :param openstack_resource: Instance of current openstack volume
     :param kwargs query: Optional query parameters to be sent to limit
             the volumes being returned.
-    """
-    volumes = openstack_resource.list(query)
-    add_resource_list_to_runtime_properties(VOLUME_OPENSTACK_TYPE, volumes)
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the resource to start listing after
+    :param int max_items: Maximum number of resources to store
+    :param list fields: Resource attributes to store
+    """
+    volumes = openstack_resource.list(
+        get_list_query(query, limit, marker))
+    add_resource_list_to_runtime_properties(VOLUME_OPENSTACK_TYPE, volumes,
+                                            max_items=max_items,
+                                            fields=fields,
+                                            paginated=True)
 
 
 @with_compat_node
@@ -30,6 +30,9 @@ from cloudify.mocks import (
     MockRelationshipSubjectContext,
 )
 
+# Local imports
+from openstack_sdk.common import connection_pool
+
 
 class CustomMockCloudifyContext(MockCloudifyContext):
     def __init__(self, *args, **kwargs):
@@ -64,6 +67,8 @@ class OpenStackTestBase(unittest.TestCase):
 
     def setUp(self):
         super(OpenStackTestBase, self).setUp()
+        # Make sure connections created by previous tests are not re-used
+        connection_pool.clear()
 
     def tearDown(self):
         current_ctx.clear()
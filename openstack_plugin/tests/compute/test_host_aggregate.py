@@ -155,6 +155,8 @@ class HostAggregateTestCase(OpenStackTestBase):
         # Mock get aggregate response
         mock_connection().compute.get_aggregate = \
             mock.MagicMock(return_value=old_aggregate_instance)
+        mock_connection().compute.aggregates = \
+            mock.MagicMock(return_value=[old_aggregate_instance])
 
         # Mock add host aggregate response
         mock_connection().compute.update = \
@@ -195,6 +197,8 @@ class HostAggregateTestCase(OpenStackTestBase):
         # Mock get aggregate response
         mock_connection().compute.get_aggregate = \
             mock.MagicMock(return_value=old_aggregate_instance)
+        mock_connection().compute.aggregates = \
+            mock.MagicMock(return_value=[old_aggregate_instance])
 
         # Mock add host aggregate response
         mock_connection().compute.set_metadata = \
@@ -147,6 +147,37 @@ class KeyPairTestCase(OpenStackTestBase):
         self.assertEqual(
             len(self._ctx.instance.runtime_properties['key_pair_list']), 2)
 
+    def test_list_keypairs_with_max_items(self, mock_connection):
+        # Prepare the context for list keypairs operation
+        self._prepare_context_for_operation(
+            test_name='KeyPairTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.list')
+
+        keypair_list = [
+            openstack.compute.v2.keypair.Keypair(**{
+                'name': 'test_key_pair_{0}'.format(index),
+                'fingerprint': 'test_fingerprint_{0}'.format(index),
+                'public_key': 'test_public_key_{0}'.format(index)
+            }) for index in range(3)
+        ]
+        # Mock list keypairs
+        mock_connection().compute.keypairs = \
+            mock.MagicMock(return_value=keypair_list)
+
+        # Mock find project response
+        mock_connection().identity.find_project = \
+            mock.MagicMock(return_value=self.project_resource)
+
+        # Call list keypair
+        keypair.list_keypairs(openstack_resource=None, max_items=2)
+
+        # Keypairs do not support marker, so only max items are saved
+        self.assertEqual(
+            len(self._ctx.instance.runtime_properties['key_pair_list']), 2)
+        self.assertNotIn(
+            'key_pair_list_marker',
+            self._ctx.instance.runtime_properties)
+
     @mock.patch('openstack_sdk.common.OpenstackResource.get_quota_sets')
     def test_creation_validation(self, mock_quota_sets, mock_connection):
         # Prepare the context for creation validation keypairs operation
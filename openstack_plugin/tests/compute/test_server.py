@@ -13,6 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Standard imports
+import os
+import time
+import shutil
+import tempfile
+
 # Third party imports
 import mock
 import openstack.compute.v2.server
@@ -34,11 +40,13 @@ from cloudify.mocks import (
 
 
 # Local imports
+from openstack_sdk.common import get_fields_resource
 from openstack_plugin.tests.base import OpenStackTestBase
 from openstack_plugin.resources.compute import server
 from openstack_plugin.resources.network import port
 from openstack_plugin.utils import (get_snapshot_name,
-                                    generate_attachment_volume_key)
+                                    generate_attachment_volume_key,
+                                    TransitionStats)
 from openstack_plugin.constants import (RESOURCE_ID,
                                         OPENSTACK_NAME_PROPERTY,
                                         OPENSTACK_TYPE_PROPERTY,
@@ -81,6 +89,12 @@ class CustomMockContext(MockContext):
         return 'workflow'
 
 
+# Resource classes used to list resources with only the requested fields
+FIELDS_PORT = get_fields_resource(openstack.network.v2.port.Port)
+FIELDS_SECURITY_GROUP = get_fields_resource(
+    openstack.network.v2.security_group.SecurityGroup)
+
+
 @mock.patch('openstack.connect')
 class ServerTestCase(OpenStackTestBase):
 
@@ -278,6 +292,12 @@ class ServerTestCase(OpenStackTestBase):
 
         })
 
+        port_instance = openstack.network.v2.port.Port(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe2',
+            'name': 'test-port',
+            'network_id': 'a95b5509-c122-4c2f-823e-884bb559afe3',
+        })
+
         mock_validate_security_groups_on_ports.return_value = True
         # Mock get flavor response
         mock_connection().compute.find_flavor = \
@@ -287,6 +307,10 @@ class ServerTestCase(OpenStackTestBase):
         mock_connection().image.find_image = \
             mock.MagicMock(return_value=image_instance)
 
+        # Mock get port response
+        mock_connection().network.get_port = \
+            mock.MagicMock(return_value=port_instance)
+
         mock_connection().compute.create_server = \
             mock.MagicMock(return_value=server_instance)
         server.create(openstack_resource=None)
@@ -296,6 +320,10 @@ class ServerTestCase(OpenStackTestBase):
             RESOURCE_ID,
             self._ctx.instance.runtime_properties)
 
+        # Check that the prefetched flavor is not requested again
+        mock_connection().compute.find_flavor.assert_called_once_with(
+            '4', ignore_missing=False)
+
         # Check if the server payload is assigned for the created server
         self.assertIn(
             SERVER_OPENSTACK_TYPE,
@@ -408,7 +436,7 @@ class ServerTestCase(OpenStackTestBase):
         self.assertEqual(len(security_groups), 2)
 
     @mock.patch(
-        'openstack_plugin.resources.compute.server._get_network_name')
+        'openstack_plugin.resources.compute.server._get_networks_names')
     def test_create_external_resource(self,
                                       mock_network_name,
                                       mock_connection):
@@ -779,6 +807,127 @@ class ServerTestCase(OpenStackTestBase):
             ]
         )
 
+    @mock.patch.object(FIELDS_SECURITY_GROUP, 'list')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._get_user_password')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._set_server_ips_runtime_properties')
+    def test_configure_with_attached_security_groups(
+            self,
+            mock_ips_runtime_properties,
+            mock_user_password,
+            mock_list_security_groups,
+            mock_connection
+    ):
+        # Prepare the context for configure operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            test_runtime_properties={
+                'security_groups': [
+                    {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt7'},
+                    {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt8'},
+                ],
+                '__security_groups_link_to_port': False,
+                'server': {}
+            },
+            ctx_operation_name='cloudify.interfaces.lifecycle.configure',
+            type_hierarchy=self.type_hierarchy)
+        server_instance = openstack.compute.v2.server.Server(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+            'status': 'ACTIVE',
+            'security_groups': [
+                {'name': 'default'},
+                {'name': 'test_security_group_1'},
+            ]
+        })
+        security_groups = [
+            openstack.network.v2.security_group.SecurityGroup(**{
+                'id': 'a95b5509-c143-3d3g-642k-543cc448sdt7',
+                'name': 'test_security_group_1',
+            }),
+            openstack.network.v2.security_group.SecurityGroup(**{
+                'id': 'a95b5509-c143-3d3g-642k-543cc448sdt8',
+                'name': 'test_security_group_2',
+            }),
+        ]
+        mock_connection().compute.find_server = \
+            mock.MagicMock(return_value=server_instance)
+        mock_list_security_groups.return_value = security_groups
+        mock_connection().compute.add_security_group_to_server = \
+            mock.MagicMock(return_value=None)
+        mock_connection().compute.remove_security_group_from_server = \
+            mock.MagicMock(return_value=None)
+
+        server.configure(openstack_resource=None)
+
+        # Server is fetched once and the names are listed once
+        mock_connection().compute.find_server.assert_called_once()
+        mock_list_security_groups.assert_called_once()
+        mock_connection().compute.remove_security_group_from_server.\
+            assert_called_once_with(server_instance, 'default')
+        # Only the missing security group is attached
+        mock_connection().compute.add_security_group_to_server.\
+            assert_called_once_with(server_instance,
+                                    'a95b5509-c143-3d3g-642k-543cc448sdt8')
+        self.assertTrue(self._ctx.instance.runtime_properties[
+            '__security_groups_attached'])
+
+    @mock.patch.object(FIELDS_SECURITY_GROUP, 'list')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._get_user_password')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._set_server_ips_runtime_properties')
+    def test_configure_with_attached_security_groups_ids(
+            self,
+            mock_ips_runtime_properties,
+            mock_user_password,
+            mock_list_security_groups,
+            mock_connection
+    ):
+        # Prepare the context for configure operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            test_runtime_properties={
+                'security_groups': [
+                    {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt7'},
+                    {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt8'},
+                    {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt9'},
+                ],
+                '__security_groups_link_to_port': True,
+                'server': {}
+            },
+            ctx_operation_name='cloudify.interfaces.lifecycle.configure',
+            type_hierarchy=self.type_hierarchy)
+        # Attached security group shares the name of a configured one
+        server_instance = openstack.compute.v2.server.Server(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+            'status': 'ACTIVE',
+            'security_groups': [
+                {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt7',
+                 'name': 'test_security_group'},
+                {'id': 'a95b5509-c143-3d3g-642k-543cc448sdt6',
+                 'name': 'test_security_group_2'},
+            ]
+        })
+        attached_security_groups = []
+        mock_connection().compute.find_server = \
+            mock.MagicMock(return_value=server_instance)
+        mock_connection().compute.add_security_group_to_server = \
+            mock.MagicMock(
+                side_effect=lambda _, security_group_id:
+                attached_security_groups.append(security_group_id))
+
+        server.configure(openstack_resource=None)
+
+        # Names are not needed when the attached ids are reported
+        mock_list_security_groups.assert_not_called()
+        # Missing security groups are attached one by one
+        self.assertEqual(attached_security_groups,
+                         ['a95b5509-c143-3d3g-642k-543cc448sdt8',
+                          'a95b5509-c143-3d3g-642k-543cc448sdt9'])
+
     @mock.patch('openstack_plugin.resources.compute.server'
                 '._get_user_password')
     @mock.patch('openstack_plugin.resources.compute.server'
@@ -819,6 +968,132 @@ class ServerTestCase(OpenStackTestBase):
             mock_user_password.assert_not_called()
             mock_handle_security_groups_connection.assert_not_called()
 
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '.record_creation_transition')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._get_user_password')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._set_server_ips_runtime_properties')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._handle_connect_security_groups_to_server')
+    def test_configure_records_creation_once(self,
+                                             _,
+                                             mock_ips_runtime_properties,
+                                             mock_user_password,
+                                             mock_record_creation,
+                                             mock_connection):
+        # Prepare the context for configure operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            ctx_operation_name='cloudify.interfaces.lifecycle.configure',
+            type_hierarchy=self.type_hierarchy)
+        server_instance = openstack.compute.v2.server.Server(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+            'created': '2015-03-09T12:14:57.233772',
+            'status': 'ACTIVE'
+        })
+        mock_connection().compute.find_server = \
+            mock.MagicMock(return_value=server_instance)
+
+        # Only the first run that sees the server active records it
+        server.configure(openstack_resource=None)
+        server.configure(openstack_resource=None)
+        mock_record_creation.assert_called_once_with('server',
+                                                     server_instance,
+                                                     'ACTIVE')
+        self.assertEqual(mock_ips_runtime_properties.call_count, 2)
+        self.assertEqual(mock_user_password.call_count, 2)
+
+    @mock.patch('openstack_plugin.utils.get_transition_stats')
+    def test_configure_with_adaptive_retry(self,
+                                           mock_transition_stats,
+                                           mock_connection):
+        # Prepare the context for configure operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            ctx_operation_name='cloudify.interfaces.lifecycle.configure',
+            type_hierarchy=self.type_hierarchy)
+        stats_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, stats_dir)
+        stats = TransitionStats(os.path.join(stats_dir, 'stats.json'))
+        mock_transition_stats.return_value = stats
+        # Servers usually take 100-300 seconds to be active
+        for duration in [100, 200, 300, 7200]:
+            stats.record('server:ACTIVE', duration)
+        self.assertEqual(stats.get_samples('server:ACTIVE'),
+                         [100, 200, 300, 7200])
+
+        created_at = time.strftime('%Y-%m-%dT%H:%M:%S.000000',
+                                   time.gmtime(time.time() - 150))
+        server_instance = openstack.compute.v2.server.Server(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+            'created': created_at,
+            'status': 'BUILD'
+        })
+        mock_connection().compute.find_server = \
+            mock.MagicMock(return_value=server_instance)
+
+        # The retry interval is the median remaining time, capped
+        with self.assertRaises(OperationRetry) as error:
+            server.configure(openstack_resource=None)
+        self.assertEqual(error.exception.retry_after, 60)
+
+        # Servers that are slower than all observed servers use the default
+        server_instance.created_at = '2015-03-09T12:14:57.233772'
+        with self.assertRaises(OperationRetry) as error:
+            server.configure(openstack_resource=None)
+        self.assertIsNone(error.exception.retry_after)
+
+    @mock.patch('openstack_plugin.utils.time.sleep')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._get_user_password')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._set_server_ips_runtime_properties')
+    @mock.patch('openstack_plugin.resources.compute.server'
+                '._handle_connect_security_groups_to_server')
+    def test_configure_with_resource_wait(
+            self,
+            mock_handle_security_groups_connection,
+            mock_ips_runtime_properties,
+            mock_user_password,
+            mock_sleep,
+            mock_connection):
+        # Prepare the context for configure operation
+        node_properties = self.node_properties
+        node_properties['client_config']['resource_wait'] = {
+            'timeout': 60,
+            'initial_interval': 2,
+            'max_interval': 3,
+        }
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            test_properties=node_properties,
+            ctx_operation_name='cloudify.interfaces.lifecycle.configure',
+            type_hierarchy=self.type_hierarchy)
+        server_instances = [
+            openstack.compute.v2.server.Server(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'name': 'test_server',
+                'status': status
+            }) for status in ['BUILD', 'BUILD', 'BUILD', 'ACTIVE']
+        ]
+        mock_connection().compute.find_server = \
+            mock.MagicMock(side_effect=server_instances)
+
+        # The server is polled in the same operation until it is active
+        server.configure(openstack_resource=None)
+        self.assertEqual(mock_connection().compute.find_server.call_count, 4)
+        mock_ips_runtime_properties.assert_called_once()
+        mock_user_password.assert_called_once()
+
+        # Polls are spaced using exponential backoff with jitter
+        sleeps = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(sleeps), 3)
+        self.assertTrue(1 <= sleeps[0] <= 2)
+        self.assertTrue(all(1.5 <= value <= 3 for value in sleeps[1:]))
+
     @mock.patch('openstack_plugin.resources.compute.server'
                 '._get_user_password')
     @mock.patch('openstack_plugin.resources.compute.server'
@@ -981,22 +1256,6 @@ class ServerTestCase(OpenStackTestBase):
             test_runtime_properties={
                 'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
             })
-        server_instance = openstack.compute.v2.server.Server(**{
-            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
-            'name': 'test_server',
-            'access_ipv4': '1',
-            'access_ipv6': '2',
-            'addresses': {},
-            'config_drive': True,
-            'created': '2015-03-09T12:14:57.233772',
-            'flavor_id': '2',
-            'image_id': '3',
-            'availability_zone': 'test_availability_zone',
-            'key_name': 'test_key_name',
-            'status': 'ACTIVE',
-
-        })
-
         rebooted_server_instance = openstack.compute.v2.server.Server(**{
             'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_server',
@@ -1017,10 +1276,9 @@ class ServerTestCase(OpenStackTestBase):
         mock_connection().compute.reboot_server = \
             mock.MagicMock(return_value=None)
 
-        # Mock get operation
+        # Mock get operation, the server is only fetched after the reboot
         mock_connection().compute.find_server = \
-            mock.MagicMock(side_effect=[server_instance,
-                                        rebooted_server_instance])
+            mock.MagicMock(side_effect=[rebooted_server_instance])
 
         self._ctx.operation.retry = mock.Mock(side_effect=OperationRetry())
 
@@ -1029,6 +1287,8 @@ class ServerTestCase(OpenStackTestBase):
             server.reboot(openstack_resource=None)
         self._ctx.operation.retry.assert_called_with(
             message='Server has REBOOT state. Waiting.', retry_after=30)
+        mock_connection().compute.reboot_server.assert_called_once_with(
+            'a95b5509-c122-4c2f-823e-884bb559afe8', 'SOFT')
 
     def test_suspend(self, mock_connection):
         # Prepare the context for suspend operation
@@ -2240,6 +2500,82 @@ class ServerTestCase(OpenStackTestBase):
         )
         mock_add_sg.assert_not_called()
 
+    @mock.patch.object(FIELDS_PORT, 'list')
+    def test_disconnect_security_group_from_server_ports(self,
+                                                         mock_list_ports,
+                                                         mock_connection):
+        # Prepare the context for operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            ctx_operation_name='cloudify.interfaces.lifecycle.delete',
+            type_hierarchy=self.type_hierarchy)
+        ports = [
+            openstack.network.v2.port.Port(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(index),
+                'revision_number': index,
+                'security_groups': security_groups,
+            }) for index, security_groups in enumerate([
+                ['a95b5509-c122-4c2f-823e-884bb559afe7',
+                 'a95b5509-c122-4c2f-823e-884bb559afe4'],
+                ['a95b5509-c122-4c2f-823e-884bb559afe4'],
+                ['a95b5509-c122-4c2f-823e-884bb559afe7'],
+            ])
+        ]
+        mock_connection().network.update_port = \
+            mock.MagicMock(return_value=None)
+
+        server._disconnect_security_group_from_server_ports(
+            self.client_config,
+            'a95b5509-c122-4c2f-823e-884bb559afe7',
+            ports)
+
+        # Server ports are already listed by the caller
+        mock_list_ports.assert_not_called()
+        # Only ports with the security group are updated
+        self.assertEqual(mock_connection().network.update_port.call_count, 2)
+        mock_connection().network.update_port.assert_any_call(
+            ports[0],
+            if_revision=0,
+            security_groups=['a95b5509-c122-4c2f-823e-884bb559afe4'])
+        mock_connection().network.update_port.assert_any_call(
+            ports[2], if_revision=2, security_groups=[])
+
+    @mock.patch.object(FIELDS_PORT, 'list')
+    def test_disconnect_security_group_from_detached_server_ports(
+            self, mock_list_ports, mock_connection):
+        # Prepare the context for operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            ctx_operation_name='cloudify.interfaces.lifecycle.delete',
+            type_hierarchy=self.type_hierarchy)
+        detached_port = openstack.network.v2.port.Port(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe1',
+            'revision_number': 1,
+            'security_groups': ['a95b5509-c122-4c2f-823e-884bb559afe7'],
+        })
+        mock_list_ports.return_value = [detached_port]
+        mock_connection().network.update_port = \
+            mock.MagicMock(return_value=None)
+
+        # Server has no attached ports, so only the detached ports from
+        # server payload are listed
+        server._disconnect_security_group_from_server_ports(
+            self.client_config,
+            'a95b5509-c122-4c2f-823e-884bb559afe7',
+            [],
+            ['a95b5509-c122-4c2f-823e-884bb559afe1'])
+
+        mock_list_ports.assert_called_once()
+        self.assertEqual(
+            mock_list_ports.call_args[1],
+            {
+                'id': ['a95b5509-c122-4c2f-823e-884bb559afe1'],
+                'fields': ['id', 'security_groups', 'revision_number']
+            })
+        mock_connection().network.update_port.assert_called_once_with(
+            detached_port, if_revision=1, security_groups=[])
+
+    @mock.patch.object(FIELDS_PORT, 'list')
     @mock.patch(
         'openstack_plugin.resources.compute.'
         'server._disconnect_security_group_from_server_ports')
@@ -2249,6 +2585,7 @@ class ServerTestCase(OpenStackTestBase):
     def test_disconnect_security_group(self,
                                        mock_remove_security_group,
                                        mock_clean_ports,
+                                       mock_list_ports,
                                        mock_connection):
         target = CustomMockContext({
             'instance': MockNodeInstanceContext(
@@ -2351,7 +2688,7 @@ class ServerTestCase(OpenStackTestBase):
         ]
 
         # Mock list port response
-        mock_connection().network.ports = mock.MagicMock(return_value=ports)
+        mock_list_ports.return_value = ports
 
         # Mock find server operation
         mock_connection().compute.find_server = \
@@ -2368,7 +2705,17 @@ class ServerTestCase(OpenStackTestBase):
         server.disconnect_security_group(
             security_group_id='a95b5509-c122-4c2f-823e-884bb559afe7',
             openstack_resource=None)
-        mock_clean_ports.assert_called()
+        # Server ports are listed once and passed to the clean up
+        mock_list_ports.assert_called_once()
+        self.assertEqual(
+            mock_list_ports.call_args[1],
+            {
+                'device_id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'fields': ['id', 'security_groups', 'revision_number']
+            })
+        mock_clean_ports.assert_called_once()
+        self.assertEqual(mock_clean_ports.call_args[0][1:],
+                         ('a95b5509-c122-4c2f-823e-884bb559afe7', ports, []))
         mock_remove_security_group.assert_called()
 
     @mock.patch(
@@ -2836,7 +3183,7 @@ class ServerTestCase(OpenStackTestBase):
             'addresses': {},
             'config_drive': True,
             'created': '2015-03-09T12:14:57.233772',
-            'flavor_id': '2',
+            'flavor': {'id': '2', 'name': 'test_flavor'},
             'image_id': '3',
             'availability_zone': 'test_availability_zone',
             'key_name': 'test_key_name',
@@ -2858,6 +3205,52 @@ class ServerTestCase(OpenStackTestBase):
             self._ctx.instance.runtime_properties[SERVER_OPENSTACK_TYPE][
                 'name'], old_server.name)
 
+        # Large server fields are not stored by default, the flavor is
+        # replaced by its id
+        for attr in ['addresses', 'flavor']:
+            self.assertNotIn(
+                attr,
+                self._ctx.instance.runtime_properties[SERVER_OPENSTACK_TYPE])
+        self.assertEqual(
+            self._ctx.instance.runtime_properties[SERVER_OPENSTACK_TYPE][
+                'flavor_id'], '2')
+
+    def test_update_with_payload_fields(self, mock_connection):
+        # Prepare the context for update operation
+        node_properties = dict(self.node_properties, payload_fields=['name'])
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.update',
+            type_hierarchy=self.type_hierarchy,
+            test_properties=node_properties,
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            })
+        old_server = openstack.compute.v2.server.Server(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+        })
+        new_server = openstack.compute.v2.server.Server(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'update_test_server',
+            'addresses': {},
+            'flavor_id': '2',
+            'image_id': '3',
+        })
+        mock_connection().compute.find_server = \
+            mock.MagicMock(return_value=old_server)
+        mock_connection().compute.update_server = \
+            mock.MagicMock(return_value=new_server)
+
+        server.update(args={'name': 'update_test_server'},
+                      openstack_resource=None)
+
+        # Only the requested fields & the id are stored
+        self.assertEqual(
+            self._ctx.instance.runtime_properties[SERVER_OPENSTACK_TYPE],
+            {'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+             'name': 'update_test_server'})
+
     def test_list_servers(self, mock_connection):
         # Prepare the context for list servers operation
         self._prepare_context_for_operation(
@@ -2908,6 +3301,37 @@ class ServerTestCase(OpenStackTestBase):
         self.assertEqual(
             len(self._ctx.instance.runtime_properties['server_list']), 2)
 
+    def test_list_servers_with_fields(self, mock_connection):
+        # Prepare the context for list servers operation
+        self._prepare_context_for_operation(
+            test_name='ServerTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.list',
+            type_hierarchy=self.type_hierarchy)
+        server_list = [
+            openstack.compute.v2.server.ServerDetail(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'name': 'test_server_1',
+                'addresses': {'region': '3'},
+                'flavor_id': '2',
+                'image_id': '3',
+            }),
+        ]
+
+        mock_connection().compute.servers = \
+            mock.MagicMock(return_value=server_list)
+
+        # Call list servers
+        server.list_servers(openstack_resource=None, fields=['name'])
+
+        # Compute API does not support fields so it is not sent
+        self.assertEqual(mock_connection().compute.servers.call_args[1], {})
+
+        # Only the requested fields & the id are saved
+        self.assertEqual(
+            self._ctx.instance.runtime_properties['server_list'],
+            [{'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+              'name': 'test_server_1'}])
+
     @mock.patch('openstack_plugin.resources.compute.server'
                 '._get_flavor_or_image_from_server')
     @mock.patch('openstack_sdk.common.OpenstackResource.get_quota_sets')
@@ -129,6 +129,8 @@ class GroupTestCase(OpenStackTestBase):
         # Mock get group response
         mock_connection().identity.get_group = \
             mock.MagicMock(return_value=old_group_instance)
+        mock_connection().identity.groups = \
+            mock.MagicMock(return_value=[old_group_instance])
 
         # Mock update group response
         mock_connection().identity.update_group = \
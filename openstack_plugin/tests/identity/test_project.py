@@ -185,6 +185,8 @@ class ProjectTestCase(OpenStackTestBase):
         # Mock get project response
         mock_connection().identity.get_project = \
             mock.MagicMock(return_value=old_project_instance)
+        mock_connection().identity.projects = \
+            mock.MagicMock(return_value=[old_project_instance])
 
         # Mock update project response
         mock_connection().identity.update_project = \
@@ -457,15 +459,15 @@ class ProjectTestCase(OpenStackTestBase):
             'description': 'Testing Role 3',
             'is_enabled': True
         })
-        # Mock find user response
-        mock_connection().identity.find_user = \
-            mock.MagicMock(return_value=user_instance_1)
+        # Mock list users response
+        mock_connection().identity.users = \
+            mock.MagicMock(return_value=[user_instance_1])
 
-        # Mock find role response
-        mock_connection().identity.find_role = \
-            mock.MagicMock(side_effect=[role_instance_1,
-                                        role_instance_2,
-                                        role_instance_3])
+        # Mock list roles response
+        mock_connection().identity.roles = \
+            mock.MagicMock(return_value=[role_instance_1,
+                                         role_instance_2,
+                                         role_instance_3])
 
         # Call start project
         project._validate_users(self.client_config, self.users)
@@ -502,15 +504,15 @@ class ProjectTestCase(OpenStackTestBase):
             'description': 'Testing Role 3',
             'is_enabled': True
         })
-        # Mock find user response
-        mock_connection().identity.find_user = \
-            mock.MagicMock(return_value=user_instance_1)
+        # Mock list users response
+        mock_connection().identity.users = \
+            mock.MagicMock(return_value=[user_instance_1])
 
-        # Mock find role response
-        mock_connection().identity.find_role = \
-            mock.MagicMock(side_effect=[role_instance_1,
-                                        role_instance_2,
-                                        role_instance_3])
+        # Mock list roles response
+        mock_connection().identity.roles = \
+            mock.MagicMock(return_value=[role_instance_1,
+                                         role_instance_2,
+                                         role_instance_3])
 
         project_instance = OpenstackProject(client_config=self.client_config)
         project_instance.resource_id = 'a95b5509-c122-4c2f-823e-884bb559afe9'
@@ -549,15 +551,15 @@ class ProjectTestCase(OpenStackTestBase):
             'description': 'Testing Role 3',
             'is_enabled': True
         })
-        # Mock find group response
-        mock_connection().identity.find_group = \
-            mock.MagicMock(return_value=group_instance_1)
+        # Mock list groups response
+        mock_connection().identity.groups = \
+            mock.MagicMock(return_value=[group_instance_1])
 
-        # Mock find role response
-        mock_connection().identity.find_role = \
-            mock.MagicMock(side_effect=[role_instance_1,
-                                        role_instance_2,
-                                        role_instance_3])
+        # Mock list roles response
+        mock_connection().identity.roles = \
+            mock.MagicMock(return_value=[role_instance_1,
+                                         role_instance_2,
+                                         role_instance_3])
 
         # Call start project
         project._validate_groups(self.client_config, self.groups)
@@ -593,15 +595,15 @@ class ProjectTestCase(OpenStackTestBase):
             'description': 'Testing Role 3',
             'is_enabled': True
         })
-        # Mock find group response
-        mock_connection().identity.find_group = \
-            mock.MagicMock(return_value=group_instance_1)
-
-        # Mock find role response
-        mock_connection().identity.find_role = \
-            mock.MagicMock(side_effect=[role_instance_1,
-                                        role_instance_2,
-                                        role_instance_3])
+        # Mock list groups response
+        mock_connection().identity.groups = \
+            mock.MagicMock(return_value=[group_instance_1])
+
+        # Mock list roles response
+        mock_connection().identity.roles = \
+            mock.MagicMock(return_value=[role_instance_1,
+                                         role_instance_2,
+                                         role_instance_3])
 
         project_instance = OpenstackProject(client_config=self.client_config)
         project_instance.resource_id = 'a95b5509-c122-4c2f-823e-884bb559afe9'
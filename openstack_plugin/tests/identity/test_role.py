@@ -129,6 +129,8 @@ class RoleTestCase(OpenStackTestBase):
         # Mock get role response
         mock_connection().identity.get_role = \
             mock.MagicMock(return_value=old_role_instance)
+        mock_connection().identity.roles = \
+            mock.MagicMock(return_value=[old_role_instance])
 
         # Mock update role response
         mock_connection().identity.update_role = \
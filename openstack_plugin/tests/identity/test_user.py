@@ -129,6 +129,8 @@ class UserTestCase(OpenStackTestBase):
         # Mock get user response
         mock_connection().identity.get_user = \
             mock.MagicMock(return_value=old_user_instance)
+        mock_connection().identity.users = \
+            mock.MagicMock(return_value=[old_user_instance])
 
         # Mock update user response
         mock_connection().identity.update_user = \
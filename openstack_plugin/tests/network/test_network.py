@@ -145,6 +145,18 @@ class NetworkTestCase(OpenStackTestBase):
                      OPENSTACK_TYPE_PROPERTY]:
             self.assertNotIn(attr, self._ctx.instance.runtime_properties)
 
+    def test_delete_uninitialized(self, mock_connection):
+        # Prepare the context for delete operation
+        self._prepare_context_for_operation(
+            test_name='NetworkTestCase',
+            ctx_operation_name='cloudify.interfaces.lifecycle.delete')
+
+        # Call delete network
+        network.delete(openstack_resource=None)
+
+        # No connection should be opened when there is nothing to delete
+        mock_connection.assert_not_called()
+
     def test_update(self, mock_connection):
         # Prepare the context for update operation
         self._prepare_context_for_operation(
@@ -219,6 +231,8 @@ class NetworkTestCase(OpenStackTestBase):
         # Mock get network response
         mock_connection().network.get_network = \
             mock.MagicMock(return_value=old_network_instance)
+        mock_connection().network.networks = \
+            mock.MagicMock(return_value=[old_network_instance])
 
         # Mock update network response
         mock_connection().network.update_network = \
@@ -315,6 +329,48 @@ class NetworkTestCase(OpenStackTestBase):
         self.assertEqual(
             len(self._ctx.instance.runtime_properties['network_list']), 2)
 
+    def test_list_networks_with_pagination(self, mock_connection):
+        # Prepare the context for list networks operation
+        self._prepare_context_for_operation(
+            test_name='NetworkTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.list')
+
+        def networks(**_):
+            for index in range(5):
+                yield openstack.network.v2.network.Network(**{
+                    'id': 'a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(
+                        index),
+                    'name': 'test_network_{0}'.format(index),
+                })
+            raise AssertionError('Networks should not be listed any more')
+
+        # Mock list networks response
+        mock_connection().network.networks = \
+            mock.MagicMock(side_effect=networks)
+
+        # Mock find project response
+        mock_connection().identity.find_project = \
+            mock.MagicMock(return_value=self.project_resource)
+
+        # Call list networks
+        network.list_networks(openstack_resource=None,
+                              query={'name': 'test_network'},
+                              limit=2,
+                              marker='a95b5509-c122-4c2f-823e-884bb559afe0',
+                              max_items=3)
+
+        mock_connection().network.networks.assert_called_once_with(
+            name='test_network',
+            limit=2,
+            marker='a95b5509-c122-4c2f-823e-884bb559afe0')
+
+        # Only max items are saved with marker to the next networks
+        self.assertEqual(
+            len(self._ctx.instance.runtime_properties['network_list']), 3)
+        self.assertEqual(
+            self._ctx.instance.runtime_properties['network_list_marker'],
+            'a95b5509-c122-4c2f-823e-884bb559afe2')
+
     @mock.patch('openstack_sdk.common.OpenstackResource.get_quota_sets')
     def test_creation_validation(self, mock_quota_sets, mock_connection):
         # Prepare the context for creation validation operation
@@ -337,6 +337,8 @@ class PortTestCase(OpenStackTestBase):
         # Mock get port response
         mock_connection().network.get_port = \
             mock.MagicMock(return_value=old_port_instance)
+        mock_connection().network.ports = \
+            mock.MagicMock(return_value=[old_port_instance])
 
         # Mock update port response
         mock_connection().network.update_port = \
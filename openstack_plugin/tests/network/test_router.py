@@ -248,6 +248,8 @@ class RouterTestCase(OpenStackTestBase):
         # Mock get router response
         mock_connection().network.get_router = \
             mock.MagicMock(return_value=old_router_instance)
+        mock_connection().network.routers = \
+            mock.MagicMock(return_value=[old_router_instance])
 
         # Mock update router response
         mock_connection().network.update_router = \
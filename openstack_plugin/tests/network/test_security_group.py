@@ -75,7 +75,9 @@ class SecurityGroupTestCase(OpenStackTestBase):
             self._ctx.instance.runtime_properties[OPENSTACK_TYPE_PROPERTY],
             SECURITY_GROUP_OPENSTACK_TYPE)
 
-    def test_configure(self, mock_connection):
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_configure(self, mock_bulk_create, mock_connection):
         # Prepare the context for configure operation
         self._prepare_context_for_operation(
             test_name='SecurityGroupTestCase',
@@ -118,9 +120,8 @@ class SecurityGroupTestCase(OpenStackTestBase):
                 'updated_at': '12'
             })
         ]
-        # Mock get security group response
-        mock_connection().network.create_security_group_rule = \
-            mock.MagicMock(side_effect=security_group_rules)
+        # Mock bulk create security group rules response
+        mock_bulk_create.return_value = iter(security_group_rules)
 
         # Call configure in order to add security group rules
         security_group.configure(security_group_rules=[
@@ -140,7 +141,19 @@ class SecurityGroupTestCase(OpenStackTestBase):
             }
         ], openstack_resource=None)
 
-    def test_disable_default_egress_rules(self, mock_connection):
+        # All rules are created using one request
+        mock_bulk_create.assert_called_once()
+        _, rules = mock_bulk_create.call_args[0]
+        self.assertEqual(len(rules), 2)
+        for rule in rules:
+            self.assertEqual(rule['security_group_id'],
+                             'a95b5509-c122-4c2f-823e-884bb559afe8')
+
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_disable_default_egress_rules(self,
+                                          mock_bulk_create,
+                                          mock_connection):
         # Prepare the context for configure operation
         properties = dict()
         properties['disable_default_egress_rules'] = True
@@ -223,9 +236,8 @@ class SecurityGroupTestCase(OpenStackTestBase):
                 'updated_at': '12'
             })
         ]
-        # Mock create security group rule response
-        mock_connection().network.create_security_group_rule = \
-            mock.MagicMock(side_effect=security_group_rules)
+        # Mock bulk create security group rules response
+        mock_bulk_create.return_value = iter(security_group_rules)
 
         # Mock delete security group rule response
         mock_connection().network.delete_security_group_rule = \
@@ -253,6 +265,85 @@ class SecurityGroupTestCase(OpenStackTestBase):
             }
         ], openstack_resource=None)
 
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_configure_compact_rules(self,
+                                     mock_bulk_create,
+                                     mock_connection):
+        # Prepare the context for configure operation
+        self._prepare_context_for_operation(
+            test_name='SecurityGroupTestCase',
+            ctx_operation_name='cloudify.interfaces.lifecycle.configure',
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            })
+
+        # Mock bulk create security group rules response
+        mock_bulk_create.return_value = iter([])
+
+        # Call configure in order to add compacted security group rules
+        security_group.configure(security_group_rules=[
+            {
+                'remote_ip_prefix': '10.0.0.0/25',
+                'port_range_max': '80',
+                'port_range_min': '80',
+                'direction': 'ingress',
+                'protocol': 'tcp'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.0/25',
+                'port_range_max': '90',
+                'port_range_min': '81',
+                'direction': 'ingress',
+                'protocol': 'tcp'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.128/25',
+                'port_range_max': '90',
+                'port_range_min': '80',
+                'direction': 'ingress',
+                'protocol': 'tcp'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.128/25',
+                'direction': 'ingress',
+                'protocol': 'icmp'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.0/25',
+                'port_range_max': '80',
+                'port_range_min': '80',
+                'direction': 'egress',
+                'protocol': 'tcp'
+            }
+        ], compact_rules=True, openstack_resource=None)
+
+        _, rules = mock_bulk_create.call_args[0]
+        self.assertEqual(rules, [
+            {
+                'remote_ip_prefix': '10.0.0.0/24',
+                'port_range_max': 90,
+                'port_range_min': 80,
+                'direction': 'ingress',
+                'protocol': 'tcp',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.128/25',
+                'direction': 'ingress',
+                'protocol': 'icmp',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.0/25',
+                'port_range_max': '80',
+                'port_range_min': '80',
+                'direction': 'egress',
+                'protocol': 'tcp',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }
+        ])
+
     def test_delete(self, mock_connection):
         # Prepare the context for delete operation
         self._prepare_context_for_operation(
@@ -323,6 +414,8 @@ class SecurityGroupTestCase(OpenStackTestBase):
         # Mock get security group response
         mock_connection().network.get_security_group = \
             mock.MagicMock(return_value=old_security_group_instance)
+        mock_connection().network.security_groups = \
+            mock.MagicMock(return_value=[old_security_group_instance])
 
         # Mock update security group response
         mock_connection().network.update_security_group = \
@@ -332,6 +425,235 @@ class SecurityGroupTestCase(OpenStackTestBase):
         security_group.update(args=new_config,
                               openstack_resource=None)
 
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_update_security_group_rules(self,
+                                         mock_bulk_create,
+                                         mock_connection):
+        # Prepare the context for update operation
+        self._prepare_context_for_operation(
+            test_name='SecurityGroupTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.update',
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            })
+
+        security_group_instance = \
+            openstack.network.v2.security_group.SecurityGroup(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'name': 'test_security_group',
+            })
+        current_rules = [
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'rule-1',
+                'direction': 'ingress',
+                'ethertype': 'IPv4',
+                'protocol': 'tcp',
+                'port_range_min': 22,
+                'port_range_max': 22,
+                'remote_ip_prefix': '10.0.0.0/24',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }),
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'rule-2',
+                'direction': 'ingress',
+                'ethertype': 'IPv4',
+                'protocol': 'tcp',
+                'port_range_min': 8080,
+                'port_range_max': 8080,
+                'remote_ip_prefix': '10.0.0.0/24',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }),
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'rule-3',
+                'direction': 'ingress',
+                'ethertype': 'IPv4',
+                'protocol': 'tcp',
+                'port_range_min': 22,
+                'port_range_max': 22,
+                'remote_ip_prefix': '10.0.0.0/24',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }),
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'default-egress-ipv4',
+                'direction': 'egress',
+                'ethertype': 'IPv4',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }),
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'default-egress-ipv6',
+                'direction': 'egress',
+                'ethertype': 'IPv6',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }),
+        ]
+
+        # Mock security group & rules responses
+        calls = []
+        mock_connection().network.update_security_group = \
+            mock.MagicMock(return_value=security_group_instance)
+        mock_connection().network.security_group_rules = \
+            mock.MagicMock(return_value=iter(current_rules))
+        mock_bulk_create.side_effect = \
+            lambda *_: calls.append('create') or iter([])
+        mock_connection().network.delete_security_group_rule = \
+            mock.MagicMock(side_effect=lambda *_, **__: calls.append(
+                'delete'))
+
+        # Call update security group with the desired rules
+        security_group.update(args={}, security_group_rules=[
+            {
+                'direction': 'ingress',
+                'protocol': 'TCP',
+                'port_range_min': '22',
+                'port_range_max': '22',
+                'remote_ip_prefix': '10.0.0.1/24'
+            },
+            {
+                'direction': 'ingress',
+                'protocol': 'tcp',
+                'port_range_min': 443,
+                'port_range_max': 443,
+                'remote_ip_prefix': '10.0.0.0/24'
+            },
+        ])
+
+        # Current rules are listed once
+        mock_connection().network.security_group_rules.assert_called_once_with(
+            security_group_id='a95b5509-c122-4c2f-823e-884bb559afe8')
+
+        # Only the missing rule is created
+        _, rules = mock_bulk_create.call_args[0]
+        self.assertEqual(len(rules), 1)
+        self.assertEqual(rules[0]['port_range_min'], 443)
+        self.assertEqual(rules[0]['security_group_id'],
+                         'a95b5509-c122-4c2f-823e-884bb559afe8')
+
+        # The removed rule & the duplicated rule are deleted
+        delete_rule = mock_connection().network.delete_security_group_rule
+        deleted_rules = sorted(
+            call[0][0] for call in delete_rule.call_args_list)
+        self.assertEqual(deleted_rules, ['rule-2', 'rule-3'])
+
+        # Missing rules are created before deleting the stale rules
+        self.assertEqual(calls, ['create', 'delete', 'delete'])
+
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_update_security_group_compact_rules(self,
+                                                 mock_bulk_create,
+                                                 mock_connection):
+        # Prepare the context for update operation
+        self._prepare_context_for_operation(
+            test_name='SecurityGroupTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.update',
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            })
+
+        security_group_instance = \
+            openstack.network.v2.security_group.SecurityGroup(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'name': 'test_security_group',
+            })
+        # The current rule is the compacted form of the desired rules
+        current_rules = [
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'rule-1',
+                'direction': 'ingress',
+                'protocol': 'tcp',
+                'port_range_min': 80,
+                'port_range_max': 90,
+                'remote_ip_prefix': '10.0.0.0/24',
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }),
+        ]
+        mock_connection().network.update_security_group = \
+            mock.MagicMock(return_value=security_group_instance)
+        mock_connection().network.security_group_rules = \
+            mock.MagicMock(return_value=iter(current_rules))
+        mock_connection().network.delete_security_group_rule = \
+            mock.MagicMock(return_value=None)
+
+        # Call update security group with rules that can be compacted
+        security_group.update(args={}, security_group_rules=[
+            {
+                'remote_ip_prefix': '10.0.0.0/25',
+                'port_range_max': '85',
+                'port_range_min': '80',
+                'direction': 'ingress',
+                'protocol': 'tcp'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.0/25',
+                'port_range_max': '90',
+                'port_range_min': '86',
+                'direction': 'ingress',
+                'protocol': 'tcp'
+            },
+            {
+                'remote_ip_prefix': '10.0.0.128/25',
+                'port_range_max': '90',
+                'port_range_min': '80',
+                'direction': 'ingress',
+                'protocol': 'tcp'
+            }
+        ], compact_rules=True)
+
+        # The compacted rules match the current rule, nothing is changed
+        mock_bulk_create.assert_not_called()
+        mock_connection().network.delete_security_group_rule \
+            .assert_not_called()
+
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_update_security_group_rules_disable_default_egress_rules(
+            self, mock_bulk_create, mock_connection):
+        # Prepare the context for update operation
+        node_properties = dict(self.node_properties,
+                               disable_default_egress_rules=True)
+        self._prepare_context_for_operation(
+            test_name='SecurityGroupTestCase',
+            ctx_operation_name='cloudify.interfaces.operations.update',
+            test_properties=node_properties,
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            })
+
+        security_group_instance = \
+            openstack.network.v2.security_group.SecurityGroup(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'name': 'test_security_group',
+            })
+        current_rules = [
+            openstack.network.v2.security_group_rule.SecurityGroupRule(**{
+                'id': 'default-egress-{0}'.format(ethertype),
+                'direction': 'egress',
+                'ethertype': ethertype,
+                'security_group_id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            }) for ethertype in ['IPv4', 'IPv6']
+        ]
+
+        # Mock security group & rules responses
+        mock_connection().network.update_security_group = \
+            mock.MagicMock(return_value=security_group_instance)
+        mock_connection().network.security_group_rules = \
+            mock.MagicMock(return_value=iter(current_rules))
+        mock_bulk_create.return_value = iter([])
+        mock_connection().network.delete_security_group_rule = \
+            mock.MagicMock(return_value=None)
+
+        # Call update security group without any rules
+        security_group.update(args={}, security_group_rules=[])
+
+        # The default egress rules are deleted
+        mock_bulk_create.assert_not_called()
+        delete_rule = mock_connection().network.delete_security_group_rule
+        deleted_rules = sorted(
+            call[0][0] for call in delete_rule.call_args_list)
+        self.assertEqual(deleted_rules,
+                         ['default-egress-IPv4', 'default-egress-IPv6'])
+
     def test_list_security_groups(self, mock_connection):
         # Prepare the context for list security groups operation
         self._prepare_context_for_operation(
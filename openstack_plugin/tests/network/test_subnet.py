@@ -223,6 +223,8 @@ class SubnetTestCase(OpenStackTestBase):
         # Mock get subnet response
         mock_connection().network.get_subnet = \
             mock.MagicMock(return_value=old_subnet_instance)
+        mock_connection().network.subnets = \
+            mock.MagicMock(return_value=[old_subnet_instance])
 
         # Mock update subnet response
         mock_connection().network.update_subnet = \
@@ -727,6 +727,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock get image response
         mock_connection().image.get_image = \
             mock.MagicMock(return_value=image_instance)
+        mock_connection().image.images = \
+            mock.MagicMock(return_value=[image_instance])
 
         current_ctx.set(context)
         kwargs = {
@@ -802,6 +804,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock get image response
         mock_connection().image.get_image = \
             mock.MagicMock(return_value=image_instance)
+        mock_connection().image.images = \
+            mock.MagicMock(return_value=[image_instance])
 
         current_ctx.set(context)
         kwargs = {
@@ -881,6 +885,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock find project response
         mock_connection().identity.get_project = \
             mock.MagicMock(return_value=project_instance)
+        mock_connection().identity.projects = \
+            mock.MagicMock(return_value=[project_instance])
 
         domain_instance = openstack.identity.v3.domain.Domain(**{
             'id': 'c84q3312-d233-5e3a-823e-884bb559afe8',
@@ -959,6 +965,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock get user response
         mock_connection().identity.get_user = \
             mock.MagicMock(return_value=user_instance)
+        mock_connection().identity.users = \
+            mock.MagicMock(return_value=[user_instance])
 
         project_instance = openstack.identity.v3.project.Project(**{
             'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
@@ -974,6 +982,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock find project response
         mock_connection().identity.get_project = \
             mock.MagicMock(return_value=project_instance)
+        mock_connection().identity.projects = \
+            mock.MagicMock(return_value=[project_instance])
 
         compat_node = Compat(context=context, **kwargs)
         response = compat_node.transform()
@@ -1079,6 +1089,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock find project response
         mock_connection().identity.get_project = \
             mock.MagicMock(return_value=project_instance)
+        mock_connection().identity.projects = \
+            mock.MagicMock(return_value=[project_instance])
 
         domain_instance = openstack.identity.v3.domain.Domain(**{
             'id': 'c84q3312-d233-5e3a-823e-884bb559afe8',
@@ -1144,6 +1156,8 @@ class CompatTestCase(OpenStackTestBase):
         # Mock find project response
         mock_connection().identity.get_project = \
             mock.MagicMock(return_value=project_instance)
+        mock_connection().identity.projects = \
+            mock.MagicMock(return_value=[project_instance])
 
         compat_node = Compat(context=context, **kwargs)
         response = compat_node.transform()
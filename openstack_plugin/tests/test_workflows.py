@@ -0,0 +1,178 @@
+# #######
+# Copyright (c) 2021 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third party imports
+import mock
+from cloudify.exceptions import NonRecoverableError
+
+# Local imports
+from openstack_plugin import workflows
+from openstack_plugin.tests.base import OpenStackTestBase
+from openstack_plugin.constants import (SERVER_NODE_TYPE,
+                                        PORT_NODE_TYPE,
+                                        FLOATING_IP_NODE_TYPE,
+                                        VOLUME_NODE_TYPE)
+
+
+@mock.patch('openstack.connect')
+class WorkflowsTestCase(OpenStackTestBase):
+
+    def setUp(self):
+        super(WorkflowsTestCase, self).setUp()
+
+    def _get_workflow_node(self,
+                           node_id,
+                           node_type,
+                           number_of_instances=1,
+                           resource_config=None,
+                           use_external_resource=False):
+        node = mock.MagicMock()
+        node.id = node_id
+        node.type_hierarchy = ['cloudify.nodes.Root', node_type]
+        node.number_of_instances = number_of_instances
+        node.properties = {
+            'client_config': self.client_config,
+            'resource_config': resource_config or {},
+            'use_external_resource': use_external_resource,
+        }
+        return node
+
+    def _get_workflow_ctx(self, nodes):
+        ctx = mock.MagicMock()
+        ctx.nodes = nodes
+        return ctx
+
+    def _mock_quota_details(self, mock_connection, service, quota):
+        response = mock.MagicMock(ok=True)
+        response.json.return_value = quota
+        getattr(mock_connection(), service).get = \
+            mock.MagicMock(return_value=response)
+
+    def test_validate_quota(self, mock_connection):
+        self._mock_quota_details(mock_connection, 'compute', {
+            'quota_set': {
+                'instances': {'limit': 10, 'in_use': 4, 'reserved': 0}
+            }
+        })
+        self._mock_quota_details(mock_connection, 'block_storage', {
+            'quota_set': {
+                'volumes': {'limit': 10, 'in_use': 2, 'reserved': 0},
+                'gigabytes': {'limit': 100, 'in_use': 20, 'reserved': 0},
+            }
+        })
+        ctx = self._get_workflow_ctx([
+            self._get_workflow_node('server_1', SERVER_NODE_TYPE, 3),
+            self._get_workflow_node('server_2', SERVER_NODE_TYPE, 3),
+            self._get_workflow_node('volume', VOLUME_NODE_TYPE, 2,
+                                    resource_config={'size': 40}),
+            self._get_workflow_node('port', PORT_NODE_TYPE, 50,
+                                    use_external_resource=True),
+        ])
+
+        workflows.validate_quota(ctx=ctx)
+
+        # Quota is fetched once per project & service
+        mock_connection().compute.get.assert_called_once()
+        mock_connection().block_storage.get.assert_called_once()
+        mock_connection().network.get.assert_not_called()
+
+    def test_validate_quota_same_project(self, mock_connection):
+        self._mock_quota_details(mock_connection, 'compute', {
+            'quota_set': {
+                'instances': {'limit': 10, 'in_use': 4, 'reserved': 0}
+            }
+        })
+        server_1 = self._get_workflow_node('server_1', SERVER_NODE_TYPE, 3)
+        # Another user of the same project with its own client settings
+        server_2 = self._get_workflow_node('server_2', SERVER_NODE_TYPE, 4)
+        server_2.properties['client_config'] = dict(
+            self.client_config,
+            username='bar',
+            password='bar',
+            kwargs={'api_timeout': 30})
+        ctx = self._get_workflow_ctx([server_1, server_2])
+
+        with self.assertRaises(NonRecoverableError) as error:
+            workflows.validate_quota(ctx=ctx)
+
+        # Both nodes consume the quota of the same project, which is fetched
+        # once for all of them
+        mock_connection().compute.get.assert_called_once()
+        self.assertIn('requested: 7', str(error.exception))
+        self.assertIn('server_1, server_2', str(error.exception))
+
+    def test_validate_quota_shortfalls(self, mock_connection):
+        self._mock_quota_details(mock_connection, 'compute', {
+            'quota_set': {
+                'instances': {'limit': 10, 'in_use': 5, 'reserved': 0}
+            }
+        })
+        self._mock_quota_details(mock_connection, 'block_storage', {
+            'quota_set': {
+                'volumes': {'limit': 10, 'in_use': 2, 'reserved': 0},
+                'gigabytes': {'limit': 100, 'in_use': 20, 'reserved': 0},
+            }
+        })
+        ctx = self._get_workflow_ctx([
+            self._get_workflow_node('server_1', SERVER_NODE_TYPE, 3),
+            self._get_workflow_node('server_2', SERVER_NODE_TYPE, 3),
+            self._get_workflow_node('volume', VOLUME_NODE_TYPE, 3,
+                                    resource_config={'size': 40}),
+        ])
+
+        with self.assertRaises(NonRecoverableError) as error:
+            workflows.validate_quota(ctx=ctx)
+
+        # Both shortfalls are reported together
+        self.assertIn('instances', str(error.exception))
+        self.assertIn('server_1, server_2', str(error.exception))
+        self.assertIn('gigabytes', str(error.exception))
+        self.assertNotIn('volumes', str(error.exception))
+
+    def test_validate_quota_server_implicit_ports(self, mock_connection):
+        self._mock_quota_details(mock_connection, 'compute', {
+            'quota_set': {
+                'instances': {'limit': 10, 'in_use': 4, 'reserved': 0}
+            }
+        })
+        self._mock_quota_details(mock_connection, 'network', {
+            'quota': {
+                'port': {'limit': 6, 'used': 2, 'reserved': 0},
+                'floatingip': {'limit': 10, 'used': 0, 'reserved': 0},
+            }
+        })
+        ctx = self._get_workflow_ctx([
+            self._get_workflow_node('port', PORT_NODE_TYPE, 2),
+            self._get_workflow_node('floating_ip', FLOATING_IP_NODE_TYPE),
+            self._get_workflow_node(
+                'server', SERVER_NODE_TYPE, 3,
+                resource_config={
+                    'networks': [
+                        {'uuid': 'a95b5509-c122-4c2f-823e-884bb559afe3'},
+                        {'port': 'a95b5509-c122-4c2f-823e-884bb559afe8'},
+                    ]
+                }),
+        ])
+
+        with self.assertRaises(NonRecoverableError) as error:
+            workflows.validate_quota(ctx=ctx)
+
+        # Ports created by the servers are counted alongside port nodes
+        self.assertIn('requested: 5', str(error.exception))
+        self.assertIn('port, server', str(error.exception))
+        self.assertNotIn('floatingip', str(error.exception))
+        self.assertNotIn('instance', str(error.exception))
+        # Network quota is fetched once for both ports & floating ips
+        mock_connection().network.get.assert_called_once()
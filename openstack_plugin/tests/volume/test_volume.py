@@ -13,6 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Standard imports
+import os
+import time
+import shutil
+import tempfile
+
 # Third party imports
 import mock
 import openstack.block_storage.v2.volume
@@ -25,7 +31,7 @@ from cloudify.exceptions import (OperationRetry,
 # Local imports
 from openstack_plugin.tests.base import OpenStackTestBase
 from openstack_plugin.resources.volume import volume
-from openstack_plugin.utils import get_snapshot_name
+from openstack_plugin.utils import get_snapshot_name, TransitionStats
 from openstack_plugin.constants import (RESOURCE_ID,
                                         IMAGE_NODE_TYPE,
                                         OPENSTACK_NAME_PROPERTY,
@@ -149,11 +155,13 @@ class VolumeTestCase(OpenStackTestBase):
         # Prepare the context for start operation
         self._prepare_context_for_operation(
             test_name='VolumeTestCase',
-            test_runtime_properties={'id': '1'},
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            },
             ctx_operation_name='cloudify.interfaces.lifecycle.delete')
 
         volume_instance = openstack.block_storage.v2.volume.Volume(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_volume',
             'description': 'volume_description',
             'availability_zone': 'test_availability_zone',
@@ -186,11 +194,13 @@ class VolumeTestCase(OpenStackTestBase):
         # Prepare the context for delete operation
         self._prepare_context_for_operation(
             test_name='VolumeTestCase',
-            test_runtime_properties={'id': '1'},
+            test_runtime_properties={
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8'
+            },
             ctx_operation_name='cloudify.interfaces.lifecycle.delete')
 
         volume_instance = openstack.block_storage.v2.volume.Volume(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_volume',
             'description': 'volume_description',
             'availability_zone': 'test_availability_zone',
@@ -200,7 +210,7 @@ class VolumeTestCase(OpenStackTestBase):
         })
 
         volume_instance_deleting = openstack.block_storage.v2.volume.Volume(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_volume',
             'description': 'volume_description',
             'availability_zone': 'test_availability_zone',
@@ -528,6 +538,97 @@ class VolumeTestCase(OpenStackTestBase):
         # Call delete backup volume
         volume.snapshot_delete(**snapshot_params)
 
+        # Backups are listed once to delete them and once to poll the
+        # deleted backups, which are tracked by id
+        self.assertEqual(
+            mock_connection().block_storage.backups.call_count, 2)
+        mock_connection().block_storage.get_backup.assert_called_once()
+        mock_connection().block_storage.delete_backup.assert_called_once_with(
+            volume_backup_to_delete)
+        self.assertNotIn('backup_ids_to_delete',
+                         self._ctx.instance.runtime_properties)
+
+    def test_delete_volume_backup_with_retry(self, mock_connection):
+        # Prepare the context for delete snapshot operation
+        self._prepare_context_for_operation(
+            test_name='VolumeTestCase',
+            ctx_operation_name='cloudify.interfaces.snapshot.delete',
+            test_runtime_properties={
+                'id': '1',
+                'backup_ids_to_delete': ['1', '2']
+            })
+
+        snapshot_name = \
+            get_snapshot_name('volume', 'test_volume_backup', False)
+
+        volume_backup_deleting = openstack.block_storage.v2.backup.Backup(**{
+            'id': '2',
+            'name': snapshot_name,
+            'status': VOLUME_STATUS_DELETING
+        })
+
+        # Only the backup that is still deleting is listed
+        mock_connection().block_storage.backups = \
+            mock.MagicMock(return_value=iter([volume_backup_deleting]))
+        mock_connection().block_storage.delete_backup = mock.MagicMock()
+        mock_connection().block_storage.get_backup = mock.MagicMock()
+
+        # Call delete backup volume
+        volume.snapshot_delete(snapshot_name='test_volume_backup',
+                               snapshot_incremental=False)
+
+        # The backups being deleted are polled using one list call
+        mock_connection().block_storage.backups.assert_called_once()
+        mock_connection().block_storage.delete_backup.assert_not_called()
+        mock_connection().block_storage.get_backup.assert_not_called()
+        self.assertEqual(
+            self._ctx.instance.runtime_properties['backup_ids_to_delete'],
+            ['2'])
+
+    @mock.patch('openstack_plugin.utils.get_transition_stats')
+    def test_delete_volume_backup_with_adaptive_retry(self,
+                                                      mock_transition_stats,
+                                                      mock_connection):
+        # Prepare the context for delete snapshot operation
+        self._prepare_context_for_operation(
+            test_name='VolumeTestCase',
+            ctx_operation_name='cloudify.interfaces.snapshot.delete',
+            test_runtime_properties={
+                'id': '1',
+                'backup_ids_to_delete': ['1'],
+                'backup_delete_started_at': time.time() - 100
+            })
+        stats_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, stats_dir)
+        stats = TransitionStats(os.path.join(stats_dir, 'stats.json'))
+        mock_transition_stats.return_value = stats
+        # Backups usually take 110-130 seconds to be deleted
+        for duration in [110, 120, 130]:
+            stats.record('backup:deleted', duration)
+
+        volume_backup_deleting = openstack.block_storage.v2.backup.Backup(**{
+            'id': '1',
+            'name': get_snapshot_name('volume', 'test_volume_backup', False),
+            'status': VOLUME_STATUS_DELETING
+        })
+        mock_connection().block_storage.backups = \
+            mock.MagicMock(return_value=iter([volume_backup_deleting]))
+
+        # The retry interval is the median remaining deletion time
+        volume.snapshot_delete(snapshot_name='test_volume_backup',
+                               snapshot_incremental=False)
+        self.assertAlmostEqual(
+            self._ctx.operation._operation_retry.retry_after, 20, delta=1)
+
+        # Once the backup is deleted the deletion duration is recorded
+        mock_connection().block_storage.backups = \
+            mock.MagicMock(return_value=iter([]))
+        volume.snapshot_delete(snapshot_name='test_volume_backup',
+                               snapshot_incremental=False)
+        self.assertEqual(len(stats.get_samples('backup:deleted')), 4)
+        self.assertNotIn('backup_delete_started_at',
+                         self._ctx.instance.runtime_properties)
+
     def test_delete_volume_snapshot(self, mock_connection):
         # Prepare the context for delete snapshot operation
         self._prepare_context_for_operation(
@@ -576,9 +677,12 @@ class VolumeTestCase(OpenStackTestBase):
             mock.MagicMock(side_effect=[all_volume_snapshots,
                                         remaining_volume_snapshots])
 
-        # Mock get volume snapshot response
+        # Mock get volume snapshot response, the snapshot is not found once
+        # it is deleted
         mock_connection().block_storage.get_snapshot = \
-            mock.MagicMock(return_value=volume_snapshot_to_delete)
+            mock.MagicMock(side_effect=[
+                volume_snapshot_to_delete,
+                openstack.exceptions.ResourceNotFound])
 
         # Mock delete volume snapshot response
         mock_connection().block_storage.delete_snapshot = \
@@ -672,3 +776,22 @@ class VolumeTestCase(OpenStackTestBase):
 
         # Call creation validation
         volume.creation_validation(openstack_resource=None)
+
+    @mock.patch('openstack_sdk.common.OpenstackResource.get_quota_details')
+    def test_creation_validation_quota_details(self,
+                                               mock_quota_details,
+                                               mock_connection):
+        # Prepare the context for creation validation operation
+        self._prepare_context_for_operation(
+            test_name='VolumeTestCase',
+            ctx_operation_name='cloudify.interfaces.validation.creation')
+
+        # Mock the detailed quota response
+        mock_quota_details.return_value = {'limit': 20, 'in_use': 20}
+
+        # Call creation validation
+        with self.assertRaises(NonRecoverableError):
+            volume.creation_validation(openstack_resource=None)
+
+        # Volumes are not listed when the usage is reported by the quota
+        mock_connection().block_storage.volumes.assert_not_called()
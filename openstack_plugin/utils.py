@@ -14,12 +14,20 @@
 # limitations under the License.
 
 # Standard imports
+import os
 import sys
 import copy
 import logging
 import base64
 import inspect
 import re
+import json
+import time
+import random
+import calendar
+import tempfile
+import ipaddress
+from collections import OrderedDict
 
 
 # Third part imports
@@ -30,10 +38,13 @@ from cloudify import compute
 from cloudify import ctx
 from cloudify.exceptions import (NonRecoverableError, OperationRetry)
 from cloudify.utils import exception_to_error_cause
-from cloudify.constants import NODE_INSTANCE, RELATIONSHIP_INSTANCE
+from cloudify.constants import (NODE_INSTANCE,
+                                RELATIONSHIP_INSTANCE,
+                                AGENT_WORK_DIR_KEY)
 
 # Py2/3 compatibility
 from openstack_sdk._compat import text_type
+from openstack_sdk.common import (AuthCache, connection_pool)
 
 
 # Local imports
@@ -43,6 +54,9 @@ from openstack_plugin.constants import (
     QUOTA_VALID_MSG,
     QUOTA_INVALID_MSG,
     INFINITE_RESOURCE_QUOTA,
+    SECURITY_GROUP_RULE_PORT_PROTOCOLS,
+    RESOURCE_PAYLOAD_EXCLUDED_FIELDS,
+    RESOURCE_PAYLOAD_SENSITIVE_FIELDS,
     RESOURCE_ID,
     CONDITIONALLY_CREATED,
     USE_EXTERNAL_RESOURCE_PROPERTY,
@@ -60,6 +74,18 @@ from openstack_plugin.constants import (
     KEY_USE_CFY_LOGGER,
     KEY_GROUPS,
     KEY_LOGGERS,
+    KEY_CONNECTION_POOL,
+    KEY_RESOURCE_WAIT,
+    DEFAULT_RESOURCE_WAIT_CONFIG,
+    KEY_AUTH_CACHE,
+    AUTH_CACHE_DIR,
+    TRANSITION_STATS_FILE,
+    TRANSITION_STATS_MAX_SAMPLES,
+    TRANSITION_STATS_MIN_SAMPLES,
+    TRANSITION_MAX_DURATION,
+    TRANSITION_DELETED,
+    MIN_RETRY_AFTER,
+    MAX_RETRY_AFTER,
     DEFAULT_LOGGING_CONFIG,
     LOGGING_GROUPS
 )
@@ -67,6 +93,9 @@ from openstack_plugin.constants import (
 
 NODE_NAME_RE = re.compile('^(.*)_.*$')  # Anything before last underscore
 
+# In-operation wait budget, configured from client config of each operation
+resource_wait_config = dict(DEFAULT_RESOURCE_WAIT_CONFIG)
+
 
 class CloudifyLogHandler(logging.Handler):
     """
@@ -92,6 +121,76 @@ class CloudifyLogHandler(logging.Handler):
         self.cfy_logger.log(record.levelno, message)
 
 
+class TransitionStats(object):
+    """
+    Local store for the observed durations of resources status transitions,
+    so that operations waiting for the same transition can retry close to
+    the time the resource is usually ready instead of using fixed interval
+    """
+    def __init__(self,
+                 path,
+                 max_samples=TRANSITION_STATS_MAX_SAMPLES,
+                 min_samples=TRANSITION_STATS_MIN_SAMPLES):
+        self.path = path
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+
+    def _load(self):
+        try:
+            with open(self.path) as stats_file:
+                stats = json.load(stats_file)
+        except (EnvironmentError, ValueError):
+            return {}
+        return stats if isinstance(stats, dict) else {}
+
+    def get_samples(self, key):
+        """
+        Lookup the observed durations of transition
+        :param str key: Transition key
+        :return list: Observed durations in seconds, oldest first
+        """
+        return self._load().get(key) or []
+
+    def record(self, key, duration):
+        """
+        Add observed duration of transition, only the latest samples are
+        kept for each transition
+        :param str key: Transition key
+        :param float duration: Transition duration in seconds
+        """
+        stats = self._load()
+        samples = (stats.get(key) or []) + [round(duration, 1)]
+        stats[key] = samples[-self.max_samples:]
+
+        stats_dir = os.path.dirname(self.path)
+        if stats_dir and not os.path.isdir(stats_dir):
+            os.makedirs(stats_dir)
+        # Write the stats to a temporary file and then rename it so readers
+        # never see partial content
+        tmp_path = '{0}.{1}.tmp'.format(self.path, os.getpid())
+        with open(tmp_path, 'w') as stats_file:
+            json.dump(stats, stats_file)
+        os.rename(tmp_path, self.path)
+
+    def get_retry_after(self, key, elapsed, default=None):
+        """
+        Compute the retry interval as the median remaining time of the
+        observed transitions that took longer than the elapsed time
+        :param str key: Transition key
+        :param float elapsed: Seconds since the transition started
+        :param default: Retry interval to use when there are not enough
+        observed transitions
+        :return: Retry interval in seconds
+        """
+        samples = self.get_samples(key)
+        remaining = sorted(sample - elapsed for sample in samples
+                           if sample > elapsed)
+        if len(samples) < self.min_samples or not remaining:
+            return default
+        retry_after = remaining[len(remaining) // 2]
+        return int(min(max(retry_after, MIN_RETRY_AFTER), MAX_RETRY_AFTER))
+
+
 def find_relationships_by_node_type_hierarchy(ctx_node_instance, node_type):
     """
     Finds all specified relationships of the Cloudify
@@ -339,27 +438,134 @@ def update_runtime_properties(properties=None):
         ctx.instance.runtime_properties[key] = value
 
 
-def add_resource_list_to_runtime_properties(openstack_type_name, object_list):
+def get_resource_fields(fields):
+    """
+    Get the list of resource attributes to fetch & store, the id is always
+    included so that the resources can still be referenced
+    :param list fields: Names of the resource attributes
+    :return list: Names of the resource attributes including the id
+    """
+    if not fields:
+        return None
+    return ['id'] + [field for field in fields if field != 'id']
+
+
+def project_resource_fields(resource, fields=None):
+    """
+    Keep only the requested attributes of resource
+    :param dict resource: Resource attributes
+    :param list fields: Names of the resource attributes to keep, all
+    attributes are kept when not provided
+    :return dict: Resource attributes
+    """
+    fields = get_resource_fields(fields)
+    if not fields or not isinstance(resource, dict):
+        return resource
+    return {field: resource[field] for field in fields if field in resource}
+
+
+def get_list_query(query=None, limit=None, marker=None, fields=None):
+    """
+    Prepare the query used to list resources with the pagination params so
+    that the resources are fetched from openstack page by page
+    :param dict query: Optional query parameters to filter the resources
+    :param int limit: Maximum number of resources returned for each page
+    :param str marker: Id of the last resource returned by previous list
+    :param list fields: Resource attributes to be returned by openstack, only
+    for services that support fields filter
+    :return dict: Query parameters for the list request
+    """
+    query = dict(query or {})
+    if limit:
+        query['limit'] = limit
+    if marker:
+        query['marker'] = marker
+    if fields:
+        query['fields'] = get_resource_fields(fields)
+    return query
+
+
+def add_resource_list_to_runtime_properties(openstack_type_name,
+                                            object_list,
+                                            max_items=None,
+                                            fields=None,
+                                            paginated=False):
     """
     Update runtime properties for node instance with list of available
     resources on openstack for certain openstack type
     :param openstack_type_name: openstack resource name type
     :param object_list: list of all available resources on openstack
+    :param int max_items: Maximum number of resources to store, all
+    resources are stored when not provided
+    :param list fields: Resource attributes to store, all attributes are
+    stored when not provided
+    :param bool paginated: Whether the openstack type supports listing
+    with marker, so that when there are more than max_items resources the id
+    of the last stored one is saved as marker to list the next resources
     """
     objects = []
+    marker = None
+    last_id = None
+    # Resources are consumed lazily, so that openstack is only requested
+    # for the pages needed to fill max_items
     for obj in object_list:
+        if max_items and len(objects) >= max_items:
+            marker = last_id if paginated else None
+            break
         if type(obj) not in [str, dict]:
             obj = obj.to_dict()
+        obj = project_resource_fields(obj, fields)
+        last_id = obj.get('id') if isinstance(obj, dict) else obj
         objects.append(obj)
 
     key_list = '{0}_list'.format(openstack_type_name)
+    key_marker = '{0}_list_marker'.format(openstack_type_name)
 
     # if the key already exists then we need to re-generate new data and
     # omits the old one if the list command multiple times
-    if ctx.instance.runtime_properties.get(key_list):
-        del ctx.instance.runtime_properties[key_list]
+    for key in [key_list, key_marker]:
+        if ctx.instance.runtime_properties.get(key):
+            del ctx.instance.runtime_properties[key]
 
     ctx.instance.runtime_properties[key_list] = objects
+    if marker:
+        ctx.instance.runtime_properties[key_marker] = marker
+
+
+def get_resource_quota_usage(resource,
+                             quota_type,
+                             count_usage=None,
+                             quota_resource=None):
+    """
+    Lookup the quota of the resource type alongside the amount of resources
+    already in use
+    :param resource: openstack resource instance
+    :param str quota_type: Quota key of the resource i.e. "volumes"
+    :param count_usage: Callable that calculates the usage from resources
+    list when the service does not report the usage, default to the number
+    of resources
+    :param quota_resource: openstack resource instance of the same service
+    used to lookup the quota, so that the quota fetched by it is shared,
+    default to the resource
+    :return tuple: Quota limit & Amount of resources in use
+    """
+    quota_resource = quota_resource or resource
+    # Detailed quota reports the amount of resources in use alongside the
+    # quota, so there is no need to list all the resources
+    quota_details = quota_resource.get_quota_details(quota_type)
+    if quota_details:
+        return quota_details['limit'], quota_details['in_use']
+
+    # This represent the quota for the provided resource openstack type
+    resource_quota = quota_resource.get_quota_sets(quota_type)
+
+    # This is the available quota for provisioning the resource, there
+    # is no need to count resources when the quota is not limited
+    if resource_quota == INFINITE_RESOURCE_QUOTA:
+        return resource_quota, 0
+
+    count_usage = count_usage or (lambda items: len(list(items)))
+    return resource_quota, count_usage(resource.list())
 
 
 def validate_resource_quota(resource, openstack_type):
@@ -378,11 +584,6 @@ def validate_resource_quota(resource, openstack_type):
     else:
         openstack_type_plural = openstack_type
 
-    resource_list = list(resource.list())
-
-    # This is the available quota for provisioning the resource
-    resource_amount = len(resource_list)
-
     # Log message to give an indication to the caller that there will be a
     # call trigger to fetch the quota for current resource
     ctx.logger.info(
@@ -390,8 +591,8 @@ def validate_resource_quota(resource, openstack_type):
         ''.format(openstack_type, ctx.node.id)
     )
 
-    # This represent the quota for the provided resource openstack type
-    resource_quota = resource.get_quota_sets(openstack_type_plural)
+    resource_quota, resource_amount = \
+        get_resource_quota_usage(resource, openstack_type_plural)
     ctx.logger.debug(
         'Comparing resource_amount {0} to resource_quota {1}'.format(
             resource_amount, resource_quota))
@@ -446,6 +647,30 @@ def unset_runtime_properties_from_instance(_ctx):
         del _ctx.instance.runtime_properties[key]
 
 
+def prepare_client_config(client_config, logger):
+    """
+    This method will prepare the client config of a node before it is used
+    to connect to openstack, the plugin settings are applied and removed
+    from it since they are not part of openstack configuration
+    :param dict client_config: Client config of the node
+    :param logger: Cloudify logger used for the openstack logs
+    :return dict: Openstack client configuration
+    """
+    # If this arg is exist, that means user
+    # provide extra/optional client configuration for the defined node
+    extra_client_config = client_config.pop('kwargs', None)
+    if extra_client_config:
+        client_config.update(extra_client_config)
+
+    # Setup logging before init the Cloud resource
+    setup_openstack_logging(client_config, logger)
+    # Setup the shared connections limits before init the Cloud resource
+    setup_openstack_connection_pool(client_config)
+    # Setup the in-operation wait budget used while waiting for resources
+    setup_resource_wait(client_config)
+    return client_config
+
+
 def prepare_resource_instance(class_decl, _ctx, kwargs):
     """
     This method used to prepare and instantiate instance of openstack resource
@@ -497,20 +722,13 @@ def prepare_resource_instance(class_decl, _ctx, kwargs):
     if name:
         resource_config['name'] = name
 
-    # If this arg is exist, that means user
-    # provide extra/optional client configuration for the defined node
-    extra_client_config = client_config.pop('kwargs', None)
-    if extra_client_config:
-        client_config.update(extra_client_config)
-
     # Check if resource_id is part of runtime properties so that we
     # can add it to the resource_config
     if RESOURCE_ID in _ctx.instance.runtime_properties:
         resource_config['id'] = \
             _ctx.instance.runtime_properties[RESOURCE_ID]
 
-    # Setup logging before init the Cloud resource
-    setup_openstack_logging(client_config, ctx.logger)
+    client_config = prepare_client_config(client_config, ctx.logger)
     resource = class_decl(client_config=client_config,
                           resource_config=resource_config,
                           logger=ctx.logger)
@@ -825,6 +1043,32 @@ def get_current_operation():
     return ctx.operation.name
 
 
+def wait_for_resource(check, result=None):
+    """
+    This method will call check in the same process until it reports that
+    the resource is done or the wait budget runs out, the calls are spaced
+    using exponential backoff with jitter so that resources that are ready
+    after few seconds do not wait for the operation retry interval
+    :param check: Callable that return tuple of the resource and boolean
+    flag to mark it as done or not
+    :param tuple result: Result of check that is already known, check is
+    called first when it is not provided
+    :return: The resource & the flag returned by the last call of check
+    """
+    deadline = time.time() + float(resource_wait_config['timeout'] or 0)
+    interval = float(resource_wait_config['initial_interval'])
+    resource, done = result or check()
+    while not done and time.time() < deadline:
+        # Sleep between half & full interval so that operations waiting
+        # at the same time do not poll the API together
+        time.sleep(min(random.uniform(interval / 2, interval),
+                       max(deadline - time.time(), 0)))
+        interval = min(interval * 2,
+                       float(resource_wait_config['max_interval']))
+        resource, done = check()
+    return resource, done
+
+
 def get_ready_resource_status(resource,
                               resource_type,
                               status,
@@ -864,7 +1108,8 @@ def get_ready_resource_status(resource,
 def wait_until_status(resource,
                       resource_type,
                       status,
-                      error_statuses):
+                      error_statuses,
+                      track_creation=False):
     """
     This method is build in order to check the status of the openstack
     resource and whether is is ready to be used or not
@@ -873,15 +1118,23 @@ def wait_until_status(resource,
     :param str status: desired status need to check the resource on
     :param list error_statuses: List of error statuses that we should raise
      error about if the remote openstack resource matches them
+    :param bool track_creation: Flag to record how long the created resource
+    took to reach the status and to use it to compute the retry interval
     :return: Instance of the current openstack object contains the updated
     status
     """
-    # Check the openstack resource status
-    openstack_resource, ready = get_ready_resource_status(resource,
-                                                          resource_type,
-                                                          status,
-                                                          error_statuses)
+    # Check the openstack resource status, until it is ready or the wait
+    # budget runs out
+    openstack_resource, ready = wait_for_resource(
+        lambda: get_ready_resource_status(resource,
+                                          resource_type,
+                                          status,
+                                          error_statuses))
     if ready and openstack_resource:
+        if track_creation:
+            record_creation_transition(resource_type,
+                                       openstack_resource,
+                                       status)
         return openstack_resource
     else:
         message = '{0} {1} current state not ready: {2}'\
@@ -889,7 +1142,12 @@ def wait_until_status(resource,
                         openstack_resource.id,
                         openstack_resource.status)
 
-        raise OperationRetry(message)
+        retry_after = None
+        if track_creation:
+            retry_after = get_creation_retry_after(resource_type,
+                                                   openstack_resource,
+                                                   status)
+        raise OperationRetry(message, retry_after=retry_after)
 
 
 def merge_resource_config(resource_config, config):
@@ -924,20 +1182,43 @@ def generate_attachment_volume_key(prefix, volume_id, server_id):
 
 def assign_resource_payload_as_runtime_properties(_ctx,
                                                   payload,
-                                                  resource_type):
+                                                  resource_type,
+                                                  fields=None):
     """
     Store resource configuration in the runtime
     properties and cleans any potentially sensitive data.
     :param _ctx: Cloudify context cloudify.context.CloudifyContext
     :param dict payload: The payload object for resource
     :param str resource_type: Resource openstack type
+    :param list fields: Resource attributes to store, default to the
+    "payload_fields" node property, when both are not provided all
+    attributes are stored except the default excluded attributes of the
+    resource type
     """
     if all([getattr(ctx, 'instance'), payload, resource_type]):
+        fields = get_resource_fields(
+            fields or ctx.node.properties.get('payload_fields'))
+        excluded_fields = [] if fields \
+            else RESOURCE_PAYLOAD_EXCLUDED_FIELDS.get(resource_type, [])
         if resource_type not in ctx.instance.runtime_properties:
             ctx.instance.runtime_properties[resource_type] = {}
+        resource_payload = ctx.instance.runtime_properties[resource_type]
         for key, value in payload.items():
-            if key not in ['user_data', 'adminPass']:
-                ctx.instance.runtime_properties[resource_type][key] = value
+            if fields and key not in fields:
+                continue
+            if key in RESOURCE_PAYLOAD_SENSITIVE_FIELDS \
+                    or key in excluded_fields:
+                continue
+            resource_payload[key] = value
+
+        # Excluded sub-objects are replaced by their ids, which are the only
+        # attributes of them that are used later (i.e. flavor & image)
+        for key in excluded_fields:
+            value = payload.get(key)
+            id_key = '{0}_id'.format(key)
+            if isinstance(value, dict) and value.get('id') \
+                    and not resource_payload.get(id_key):
+                resource_payload[id_key] = value['id']
 
 
 def allow_to_run_operation_for_external_node(operation_name):
@@ -978,6 +1259,165 @@ def validate_ip_or_range_syntax(_ctx, address):
         raise NonRecoverableError(err)
 
 
+def _get_rule_port_range(rule):
+    """
+    Get the port range of security group rule as integers
+    :param dict rule: Security group rule config
+    :return tuple: (port_range_min, port_range_max), None when the rule
+    applies to all ports
+    """
+    port_min = rule.get('port_range_min')
+    port_max = rule.get('port_range_max')
+    if port_min is None and port_max is None:
+        return None
+    port_min = int(port_min if port_min is not None else port_max)
+    port_max = int(port_max if port_max is not None else port_min)
+    return port_min, port_max
+
+
+def _merge_rules_port_ranges(rules):
+    """
+    Merge the overlapping & contiguous port ranges of rules that only differ
+    by their port range
+    :param list rules: List of security group rules config
+    :return list: List of security group rules config
+    """
+    ranges = []
+    for rule in rules:
+        port_range = _get_rule_port_range(rule)
+        # Rule without port range already allows all ports
+        if port_range is None:
+            return [rule]
+        ranges.append((port_range, rule))
+
+    merged = []
+    for (port_min, port_max), rule in sorted(ranges, key=lambda r: r[0]):
+        if merged and port_min <= merged[-1][1] + 1:
+            last_min, last_max, last_rules = merged[-1]
+            merged[-1] = \
+                (last_min, max(last_max, port_max), last_rules + [rule])
+        else:
+            merged.append((port_min, port_max, [rule]))
+
+    compacted = []
+    for port_min, port_max, merged_rules in merged:
+        rule = merged_rules[0]
+        if len(merged_rules) > 1:
+            rule = dict(rule, port_range_min=port_min, port_range_max=port_max)
+        compacted.append(rule)
+    return compacted
+
+
+def _collapse_rules_cidrs(rules):
+    """
+    Collapse the adjacent & overlapping CIDRs of rules that only differ by
+    their remote ip prefix
+    :param list rules: List of security group rules config
+    :return list: List of security group rules config
+    """
+    compacted = []
+    networks = OrderedDict()
+    for rule in rules:
+        try:
+            network = ipaddress.ip_network(
+                text_type(rule['remote_ip_prefix']), strict=False)
+        except ValueError:
+            # Address ranges cannot be collapsed
+            compacted.append(rule)
+            continue
+        networks.setdefault(network.version, []).append((network, rule))
+
+    for version_networks in networks.values():
+        collapsed = list(ipaddress.collapse_addresses(
+            network for network, _ in version_networks))
+        # Keep the original rules when there is nothing to collapse
+        if len(collapsed) == len(version_networks):
+            compacted.extend(rule for _, rule in version_networks)
+            continue
+        rule = version_networks[0][1]
+        compacted.extend(dict(rule, remote_ip_prefix=text_type(network))
+                         for network in collapsed)
+    return compacted
+
+
+def compact_security_group_rules(rules):
+    """
+    This method will merge security group rules that have identical
+    protocol, direction, ethertype and remote fields, contiguous port ranges
+    are merged then adjacent CIDRs are collapsed
+    :param list rules: List of security group rules config
+    :return tuple: Compacted list of security group rules config and the
+    number of removed rules
+    """
+    groups = OrderedDict()
+    for rule in rules:
+        protocol = text_type(rule.get('protocol') or '').lower()
+        mergeable_ports = protocol in SECURITY_GROUP_RULE_PORT_PROTOCOLS
+        key = {k: v for k, v in rule.items()
+               if k not in ['port_range_min', 'port_range_max',
+                            'remote_ip_prefix']}
+        # Port ranges of protocols like icmp are types & codes that cannot
+        # be merged
+        if not mergeable_ports:
+            key['port_range'] = _get_rule_port_range(rule)
+        key = json.dumps(key, sort_keys=True, default=text_type)
+        groups.setdefault(key, (mergeable_ports, []))[1].append(rule)
+
+    compacted = []
+    for mergeable_ports, group_rules in groups.values():
+        # Merge the port ranges of rules with the same remote ip prefix
+        by_prefix = OrderedDict()
+        for rule in group_rules:
+            by_prefix.setdefault(rule.get('remote_ip_prefix'), []).append(rule)
+        port_rules = []
+        for prefix_rules in by_prefix.values():
+            if mergeable_ports:
+                port_rules.extend(_merge_rules_port_ranges(prefix_rules))
+            else:
+                port_rules.append(prefix_rules[0])
+
+        # Collapse the CIDRs of rules with the same port range
+        by_ports = OrderedDict()
+        for rule in port_rules:
+            if rule.get('remote_ip_prefix') is None:
+                compacted.append(rule)
+                continue
+            by_ports.setdefault(_get_rule_port_range(rule), []).append(rule)
+        for ports_rules in by_ports.values():
+            compacted.extend(_collapse_rules_cidrs(ports_rules))
+
+    return compacted, len(rules) - len(compacted)
+
+
+def get_security_group_rule_key(rule):
+    """
+    This method will normalize security group rule config so that rules
+    that have the same effect are equal regardless of the way they are
+    written (i.e. ports as strings, protocol case, CIDRs host bits)
+    :param dict rule: Security group rule config
+    :return tuple: Normalized security group rule
+    """
+    remote_ip_prefix = rule.get('remote_ip_prefix')
+    if remote_ip_prefix:
+        try:
+            network = ipaddress.ip_network(text_type(remote_ip_prefix),
+                                           strict=False)
+            # Any address prefix is the same as not setting the prefix
+            remote_ip_prefix = \
+                text_type(network) if network.prefixlen else None
+        except ValueError:
+            remote_ip_prefix = text_type(remote_ip_prefix)
+    protocol = rule.get('protocol')
+    protocol = text_type(protocol).lower() \
+        if protocol not in [None, '', 'any'] else None
+    return (rule.get('direction') or 'ingress',
+            rule.get('ethertype') or 'IPv4',
+            protocol,
+            _get_rule_port_range(rule),
+            remote_ip_prefix or None,
+            rule.get('remote_group_id') or None)
+
+
 def get_target_node_from_capabilities(node_name):
     """
     This method will use cloudify context capabilities in order to find
@@ -1174,3 +1614,175 @@ def setup_openstack_logging(client_config, logger):
         if is_str:
             logger_level = logger_level.upper()
         setup_logging(logger_name, [ctx_log_handler], logger_level)
+
+
+def setup_openstack_connection_pool(client_config):
+    """
+    Configure the process wide connection pool limits and the auth cache
+    from client config so that all resources created from the same
+    credentials share one authenticated connection
+    :param dict client_config: Openstack client configuration
+    """
+    # Get the connection pool object, it must be removed from client config
+    # since it is not part of openstack configuration
+    pool_config = client_config.pop(KEY_CONNECTION_POOL, None) or {}
+    connection_pool.configure(max_size=pool_config.get('max_size'),
+                              max_age=pool_config.get('max_age'))
+
+    # The auth cache is opt-in, when it is enabled the token and its service
+    # catalog are shared between operations processes
+    if client_config.pop(KEY_AUTH_CACHE, False):
+        connection_pool.auth_cache = AuthCache(get_auth_cache_dir())
+    else:
+        connection_pool.auth_cache = None
+
+
+def setup_resource_wait(client_config):
+    """
+    Configure the in-operation wait budget from client config, resources
+    that are not ready are polled in the same process until the budget runs
+    out before raising operation retry
+    :param dict client_config: Openstack client configuration
+    """
+    # Get the wait config object, it must be removed from client config
+    # since it is not part of openstack configuration
+    wait_config = client_config.pop(KEY_RESOURCE_WAIT, None) or {}
+    resource_wait_config.clear()
+    resource_wait_config.update(DEFAULT_RESOURCE_WAIT_CONFIG)
+    resource_wait_config.update(
+        (key, value) for key, value in wait_config.items()
+        if key in DEFAULT_RESOURCE_WAIT_CONFIG and value is not None)
+
+
+def get_transition_stats():
+    """
+    This method will return the transition stats store, which is located
+    under the agent work dir if it is available
+    :return: Instance of TransitionStats
+    """
+    work_dir = os.environ.get(AGENT_WORK_DIR_KEY) or tempfile.gettempdir()
+    return TransitionStats(os.path.join(work_dir, TRANSITION_STATS_FILE))
+
+
+def _get_timestamp(value):
+    """
+    Convert openstack UTC date time string into unix timestamp
+    :param str value: Date time i.e. 2016-03-09T12:14:57.233772
+    :return float: Unix timestamp or None if the value is not date time
+    """
+    try:
+        return float(calendar.timegm(
+            time.strptime(text_type(value)[:19], '%Y-%m-%dT%H:%M:%S')))
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_transition_retry_after(key, elapsed, default=None):
+    """
+    Compute the retry interval for a transition from its observed durations
+    :param str key: Transition key
+    :param float elapsed: Seconds since the transition started
+    :param default: Retry interval to use when it cannot be computed
+    :return: Retry interval in seconds
+    """
+    try:
+        return get_transition_stats().get_retry_after(key, elapsed, default)
+    except Exception as error:
+        ctx.logger.debug(
+            'Unable to compute retry interval: {0}'.format(error))
+        return default
+
+
+def _record_transition(key, duration):
+    """
+    Record observed duration of a transition, durations that are out of
+    bounds are ignored
+    :param str key: Transition key
+    :param float duration: Transition duration in seconds
+    """
+    if not 0 <= duration <= TRANSITION_MAX_DURATION:
+        return
+    try:
+        get_transition_stats().record(key, duration)
+    except Exception as error:
+        ctx.logger.debug(
+            'Unable to record transition duration: {0}'.format(error))
+
+
+def get_creation_retry_after(resource_type, resource, status, default=None):
+    """
+    This method will compute the retry interval for resource that is still
+    being created, using the observed durations of creating resources of the
+    same type until they reach the desired status
+    :param str resource_type: Resource type
+    :param resource: Instance that extend openstack.resource.Resource
+    :param str status: Desired status of the resource
+    :param default: Retry interval to use when it cannot be computed
+    :return: Retry interval in seconds
+    """
+    created_at = _get_timestamp(getattr(resource, 'created_at', None))
+    if created_at is None:
+        return default
+    return _get_transition_retry_after(
+        '{0}:{1}'.format(resource_type, status),
+        time.time() - created_at,
+        default)
+
+
+def record_creation_transition(resource_type, resource, status):
+    """
+    This method will record the duration it took the created resource to
+    reach the desired status, according to the resource timestamps or the
+    time it is observed in the desired status if the last update time of
+    the resource is not available
+    :param str resource_type: Resource type
+    :param resource: Instance that extend openstack.resource.Resource
+    :param str status: Desired status of the resource
+    """
+    created_at = _get_timestamp(getattr(resource, 'created_at', None))
+    if created_at is None:
+        return
+    updated_at = _get_timestamp(getattr(resource, 'updated_at', None))
+    _record_transition('{0}:{1}'.format(resource_type, status),
+                       (updated_at or time.time()) - created_at)
+
+
+def get_deletion_retry_after(resource_type, started_at, default=None):
+    """
+    This method will compute the retry interval for resources that are
+    still being deleted, using the observed durations of deleting resources
+    of the same type
+    :param str resource_type: Resource type
+    :param float started_at: Unix timestamp the deletion was requested at
+    :param default: Retry interval to use when it cannot be computed
+    :return: Retry interval in seconds
+    """
+    if started_at is None:
+        return default
+    return _get_transition_retry_after(
+        '{0}:{1}'.format(resource_type, TRANSITION_DELETED),
+        time.time() - started_at,
+        default)
+
+
+def record_deletion_transition(resource_type, started_at):
+    """
+    This method will record the duration it took to delete resources, from
+    the time the deletion was requested until they are observed as deleted
+    :param str resource_type: Resource type
+    :param float started_at: Unix timestamp the deletion was requested at
+    """
+    if started_at is None:
+        return
+    _record_transition('{0}:{1}'.format(resource_type, TRANSITION_DELETED),
+                       time.time() - started_at)
+
+
+def get_auth_cache_dir():
+    """
+    This method will return the directory used to store the authentication
+    cache, which is located under the agent work dir if it is available
+    :return str: Auth cache directory path
+    """
+    work_dir = os.environ.get(AGENT_WORK_DIR_KEY) or tempfile.gettempdir()
+    return os.path.join(work_dir, AUTH_CACHE_DIR)
@@ -0,0 +1,233 @@
+# #######
+# Copyright (c) 2021 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard imports
+import copy
+from collections import OrderedDict
+
+# Third party imports
+from cloudify.decorators import workflow
+from cloudify.exceptions import NonRecoverableError
+
+# Local imports
+from openstack_sdk.resources.compute import OpenstackServer
+from openstack_sdk.resources.networks import (OpenstackPort,
+                                              OpenstackFloatingIP)
+from openstack_sdk.resources.volume import OpenstackVolume
+from openstack_plugin.constants import (SERVER_NODE_TYPE,
+                                        PORT_NODE_TYPE,
+                                        NETWORK_NODE_TYPE,
+                                        FLOATING_IP_NODE_TYPE,
+                                        VOLUME_NODE_TYPE,
+                                        INSTANCE_OPENSTACK_TYPE,
+                                        PORT_OPENSTACK_TYPE,
+                                        FLOATING_IP_OPENSTACK_TYPE,
+                                        VOLUME_OPENSTACK_TYPE,
+                                        VOLUME_GIGABYTES_QUOTA,
+                                        INFINITE_RESOURCE_QUOTA,
+                                        QUOTA_VALID_MSG,
+                                        DEPLOYMENT_QUOTA_INVALID_MSG)
+from openstack_plugin.utils import (get_resource_quota_usage,
+                                    prepare_client_config)
+
+
+def _get_volume_gigabytes(volumes):
+    return sum(volume.size or 0 for volume in volumes)
+
+
+# Node types that consume project quota mapped to the openstack type of the
+# resource
+QUOTA_NODE_TYPES = OrderedDict([
+    (SERVER_NODE_TYPE, INSTANCE_OPENSTACK_TYPE),
+    (PORT_NODE_TYPE, PORT_OPENSTACK_TYPE),
+    (FLOATING_IP_NODE_TYPE, FLOATING_IP_OPENSTACK_TYPE),
+    (VOLUME_NODE_TYPE, VOLUME_OPENSTACK_TYPE),
+])
+
+# Quota types mapped to the resource class used to lookup the quota, the
+# quota of resources from the same service is fetched once per project
+QUOTA_RESOURCES = {
+    INSTANCE_OPENSTACK_TYPE: OpenstackServer,
+    PORT_OPENSTACK_TYPE: OpenstackPort,
+    FLOATING_IP_OPENSTACK_TYPE: OpenstackFloatingIP,
+    VOLUME_OPENSTACK_TYPE: OpenstackVolume,
+    VOLUME_GIGABYTES_QUOTA: OpenstackVolume,
+}
+
+# Callables used to calculate quota usage from resources list when the
+# service does not report it, default to the number of resources
+QUOTA_USAGE_COUNTERS = {
+    VOLUME_GIGABYTES_QUOTA: _get_volume_gigabytes
+}
+
+
+def _get_quota_project_key(client_config):
+    """
+    This method will generate the key of the project that owns the quota
+    consumed using client config, so that nodes using different credentials
+    or settings for the same project are validated together
+    :param dict client_config: Openstack client configuration
+    :return tuple: Auth url and project id or name
+    """
+    auth = client_config.get('auth') or {}
+    auth_url = auth.get('auth_url') or client_config.get('auth_url')
+    project = auth.get('project_id') or client_config.get('project_id') \
+        or auth.get('project_name') or client_config.get('project_name')
+    return auth_url, project
+
+
+def _get_server_implicit_ports(node, resource_config):
+    """
+    This method will count the ports created implicitly for each server
+    instance, which are the networks provided without a port either via
+    node properties or relationships
+    :param node: Cloudify workflow node
+    :param dict resource_config: Server resource configuration
+    :return int: Number of ports created for each server instance
+    """
+    networks = resource_config.get('networks')
+    nics = [nic for nic in networks
+            if isinstance(nic, dict) and not nic.get(PORT_OPENSTACK_TYPE)] \
+        if isinstance(networks, list) else []
+    rel_networks = [rel for rel in node.relationships or []
+                    if NETWORK_NODE_TYPE in rel.target_node.type_hierarchy]
+    return len(nics) + len(rel_networks)
+
+
+def _get_node_quota_demand(node, openstack_type):
+    """
+    This method will calculate the quota requested by all node instances
+    :param node: Cloudify workflow node
+    :param str openstack_type: Openstack type of the node resource
+    :return dict: Requested amount for each quota type
+    """
+    instances = node.number_of_instances
+    resource_config = copy.deepcopy(node.properties.get('resource_config')
+                                    or {})
+    resource_config.update(resource_config.pop('kwargs', None) or {})
+
+    demand = {openstack_type: instances}
+    if openstack_type == VOLUME_OPENSTACK_TYPE:
+        demand[VOLUME_GIGABYTES_QUOTA] = \
+            instances * int(resource_config.get('size') or 0)
+    elif openstack_type == INSTANCE_OPENSTACK_TYPE:
+        implicit_ports = _get_server_implicit_ports(node, resource_config)
+        if implicit_ports:
+            demand[PORT_OPENSTACK_TYPE] = instances * implicit_ports
+    return demand
+
+
+def _collect_quota_demands(nodes, logger, node_ids=None):
+    """
+    This method will sum the quota requested by nodes, grouped by the
+    project and the service of the quota
+    :param nodes: List of cloudify workflow nodes
+    :param logger: Cloudify workflow logger
+    :param list node_ids: Node ids to include, all nodes when empty
+    :return OrderedDict: Demands grouped by project and service
+    """
+    demands = OrderedDict()
+    for node in nodes:
+        if node_ids and node.id not in node_ids:
+            continue
+        # Existing resources do not consume any more quota
+        if node.properties.get('use_external_resource'):
+            continue
+
+        node_type = next((node_type for node_type in QUOTA_NODE_TYPES
+                          if node_type in node.type_hierarchy), None)
+        if not node_type:
+            continue
+
+        client_config = prepare_client_config(
+            copy.deepcopy(node.properties.get('client_config') or {}), logger)
+        auth_url, project = _get_quota_project_key(client_config)
+        for quota_type, amount in _get_node_quota_demand(
+                node, QUOTA_NODE_TYPES[node_type]).items():
+            class_decl = QUOTA_RESOURCES[quota_type]
+            key = (auth_url, project, class_decl.service_type)
+            if key not in demands:
+                demands[key] = {
+                    'client_config': client_config,
+                    'quota': OrderedDict(),
+                }
+            requested = demands[key]['quota'].setdefault(
+                quota_type, {'amount': 0, 'nodes': []})
+            requested['amount'] += amount
+            if node.id not in requested['nodes']:
+                requested['nodes'].append(node.id)
+    return demands
+
+
+@workflow
+def validate_quota(ctx, node_ids=None, **_):
+    """
+    This workflow will validate that the project quota can accommodate all
+    the resources requested by the deployment nodes, the quota of each
+    project is fetched once and all shortfalls are reported together
+    :param ctx: Cloudify workflow context
+    :param list node_ids: Node ids to validate, all nodes when empty
+    """
+    errors = []
+    demands = _collect_quota_demands(ctx.nodes, ctx.logger, node_ids)
+    for demand in demands.values():
+        # The quota of the service is fetched once by the first resource and
+        # the other resources are only used to count the usage when the
+        # service does not report it
+        resources = OrderedDict()
+        for quota_type, requested in demand['quota'].items():
+            class_decl = QUOTA_RESOURCES[quota_type]
+            if class_decl not in resources:
+                resources[class_decl] = class_decl(
+                    client_config=demand['client_config'],
+                    logger=ctx.logger)
+            resource = resources[class_decl]
+            openstack_type_plural = \
+                resource.resource_plural(quota_type) \
+                if quota_type != VOLUME_GIGABYTES_QUOTA else quota_type
+            resource_quota, resource_amount = get_resource_quota_usage(
+                resource,
+                openstack_type_plural,
+                QUOTA_USAGE_COUNTERS.get(quota_type),
+                quota_resource=next(iter(resources.values())))
+
+            if resource_quota == INFINITE_RESOURCE_QUOTA \
+                    or resource_amount + requested['amount'] <= \
+                    resource_quota:
+                ctx.logger.debug(
+                    QUOTA_VALID_MSG.format(
+                        quota_type,
+                        ', '.join(requested['nodes']),
+                        openstack_type_plural,
+                        resource_amount,
+                        resource_quota)
+                )
+                continue
+
+            errors.append(
+                DEPLOYMENT_QUOTA_INVALID_MSG.format(
+                    openstack_type_plural,
+                    resource_amount,
+                    requested['amount'],
+                    ', '.join(requested['nodes']),
+                    resource_quota))
+
+    if errors:
+        for error in errors:
+            ctx.logger.error('VALIDATION ERROR: {0}'.format(error))
+        raise NonRecoverableError(
+            'Deployment quota validation failed: {0}'.format(
+                '; '.join(errors)))
+    ctx.logger.info('Deployment quota validation passed')
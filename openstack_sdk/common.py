@@ -14,15 +14,64 @@
 # limitations under the License.
 
 # Standard imports
+import os
+import json
+import time
 import uuid
+import hashlib
+import calendar
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Third party imports
 import openstack
+import openstack.resource
 import openstack.exceptions
+from keystoneauth1 import discover as ks_discover
+from keystoneauth1 import exceptions as ks_exceptions
+from keystoneauth1 import session as ks_session
 
 # Py2/3 compatibility
 from openstack_sdk._compat import text_type
 
+# Maximum number of connections kept alive by the connection pool
+DEFAULT_POOL_MAX_SIZE = 10
+# Maximum age (in seconds) of a pooled connection before it is re-created
+DEFAULT_POOL_MAX_AGE = 3600
+# Cached tokens that expire within this margin (in seconds) are not re-used
+DEFAULT_AUTH_CACHE_EXPIRY_MARGIN = 300
+
+# Page size used while streaming resources list to lookup resource by name
+DEFAULT_LOOKUP_PAGE_SIZE = 100
+# Maximum number of requests running concurrently for a batch of resources
+DEFAULT_MAX_WORKERS = 8
+# Maximum number of resources sent in one bulk create request
+DEFAULT_BULK_CHUNK_SIZE = 50
+
+# Quota endpoints that report the resources in use alongside the limits,
+# mapped to the response key and the key of the in use count
+QUOTA_DETAILS = {
+    'compute': ('/os-quota-sets/{0}/detail', 'quota_set', 'in_use'),
+    'network': ('/quotas/{0}/details.json', 'quota', 'used'),
+    'block_storage': ('/os-quota-sets/{0}?usage=true', 'quota_set', 'in_use'),
+}
+
+# Query parameter used to request only some attributes of listed resources
+FIELDS_QUERY_PARAM = 'fields'
+
+# Status groups reported by the status poller
+STATUS_READY = 'ready'
+STATUS_FAILED = 'failed'
+STATUS_PENDING = 'pending'
+STATUS_MISSING = 'missing'
+
+# Kinds of resource identifiers used to pick the lookup request
+IDENTIFIER_UUID = 'uuid'
+IDENTIFIER_NUMERIC = 'numeric'
+IDENTIFIER_NAME = 'name'
+
 
 class QuotaException(Exception):
     pass
@@ -36,15 +85,393 @@ class InvalidINSecureValue(Exception):
     pass
 
 
+def get_identifier_type(name_or_id):
+    """
+    Classify resource identifier so that it can be looked up using the
+    cheapest request
+    :param name_or_id: The name or id of the resource
+    :return str: One of IDENTIFIER_UUID, IDENTIFIER_NUMERIC, IDENTIFIER_NAME
+    """
+    try:
+        uuid.UUID(text_type(name_or_id))
+        return IDENTIFIER_UUID
+    except ValueError:
+        # If it's a value error, then the string
+        # is not a valid hex code for a UUID.
+        pass
+    try:
+        int(name_or_id)
+        return IDENTIFIER_NUMERIC
+    except (TypeError, ValueError):
+        return IDENTIFIER_NAME
+
+
+_fields_resources = {}
+
+
+def get_fields_resource(resource_class):
+    """
+    Get a subclass of the SDK resource that also accepts the "fields" query
+    parameter, so that the API only returns the requested attributes
+    :param resource_class: Class that extend openstack.resource.Resource
+    :return: Class that extend resource_class
+    """
+    if resource_class not in _fields_resources:
+        query_mapping = openstack.resource.QueryParameters(
+            FIELDS_QUERY_PARAM, **resource_class._query_mapping._mapping)
+        _fields_resources[resource_class] = type(
+            resource_class.__name__,
+            (resource_class,),
+            {'_query_mapping': query_mapping})
+    return _fields_resources[resource_class]
+
+
+_microversion_resources = {}
+
+
+def get_microversion_resource(resource_class, microversion):
+    """
+    Get a subclass of the SDK resource that requests the microversion when
+    it is supported by the API, so that newer API features can be used
+    :param resource_class: Class that extend openstack.resource.Resource
+    :param str microversion: Maximum microversion to request
+    :return: Class that extend resource_class
+    """
+    key = (resource_class, microversion)
+    if key not in _microversion_resources:
+        _microversion_resources[key] = type(
+            resource_class.__name__,
+            (resource_class,),
+            {'_max_microversion': microversion})
+    return _microversion_resources[key]
+
+
+class _ReplayResponse(object):
+    def __init__(self, version_data):
+        self.version_data = version_data
+
+    def json(self):
+        return {'versions': self.version_data}
+
+
+class _ReplaySession(object):
+    """
+    Minimal session answering discovery requests from stored version data,
+    it is used to rebuild keystoneauth discovery objects without any HTTP
+    request
+    """
+    def __init__(self, version_data):
+        self.version_data = version_data
+
+    def get(self, url, **kwargs):
+        return _ReplayResponse(self.version_data)
+
+
+class DiscoveryCache(dict):
+    """
+    Keystoneauth discovery cache which calls on_update each time a new
+    endpoint is discovered, so that discovery results can be stored
+    alongside the cached auth state
+    """
+    def __init__(self, on_update=None):
+        super(DiscoveryCache, self).__init__()
+        self.on_update = on_update
+
+    def __setitem__(self, url, discovery):
+        discovered = url not in self
+        super(DiscoveryCache, self).__setitem__(url, discovery)
+        if discovered and self.on_update:
+            self.on_update()
+
+    def get_version_data(self):
+        """
+        Dump the raw version data of all discovered endpoints
+        :return dict: Version data for each discovered url
+        """
+        return dict(
+            (url, discovery.raw_version_data(allow_experimental=True,
+                                             allow_deprecated=True,
+                                             allow_unknown=True))
+            for url, discovery in list(self.items()))
+
+    def set_version_data(self, version_data):
+        """
+        Restore discovered endpoints from raw version data, the on_update
+        callback is not invoked for the restored endpoints
+        :param dict version_data: Version data for each discovered url
+        """
+        for url, data in version_data.items():
+            discovery = ks_discover.Discover(_ReplaySession(data), url)
+            super(DiscoveryCache, self).__setitem__(url, discovery)
+
+    def get_session_constructor(self):
+        """
+        Generate keystoneauth session constructor which uses this cache for
+        endpoint discovery
+        :return: Callable used by the cloud region to create the session
+        """
+        def _session_constructor(**kwargs):
+            kwargs['discovery_cache'] = self
+            return ks_session.Session(**kwargs)
+        return _session_constructor
+
+
+class AuthCache(object):
+    """
+    On disk cache for keystone tokens alongside their service catalog, so
+    that new operation processes using the same credentials can skip
+    authentication. Only the public auth state API of keystoneauth plugins
+    is used to store and restore the token, the endpoint discovery results
+    are stored alongside it through the public discovery cache of the
+    keystoneauth session
+    """
+    def __init__(self,
+                 cache_dir,
+                 expiry_margin=DEFAULT_AUTH_CACHE_EXPIRY_MARGIN):
+        self.cache_dir = cache_dir
+        self.expiry_margin = expiry_margin
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, '{0}.json'.format(key))
+
+    def load(self, key, connection, discovery_cache=None):
+        """
+        Install cached authentication state on connection if there is a
+        valid one for the key
+        :param str key: Client config key generated by the connection pool
+        :param connection: Instance of openstack.connection.Connection
+        :param discovery_cache: Instance of DiscoveryCache used by the
+        connection session
+        :return bool: Flag to indicate if the cached state was used or not
+        """
+        path = self._get_path(key)
+        try:
+            with open(path) as cache_file:
+                state = json.load(cache_file)
+        except (EnvironmentError, ValueError):
+            return False
+
+        # Do not use tokens that are about to expire, keystone will issue a
+        # new one on the first request
+        if state.get('expires_at', 0) - self.expiry_margin < time.time():
+            self.invalidate(key)
+            return False
+
+        try:
+            connection.session.auth.set_auth_state(state['auth_state'])
+        except (KeyError, TypeError, ValueError):
+            self.invalidate(key)
+            return False
+
+        if discovery_cache is not None:
+            try:
+                discovery_cache.set_version_data(state.get('discovery', {}))
+            except (AttributeError, TypeError, ValueError,
+                    ks_exceptions.DiscoveryFailure):
+                # Endpoints are discovered again if the stored data is not
+                # usable, the token itself is still valid
+                discovery_cache.clear()
+        return True
+
+    def save(self, key, connection, discovery_cache=None):
+        """
+        Store the authentication state of connection so that it can be used
+        by other processes
+        :param str key: Client config key generated by the connection pool
+        :param connection: Instance of openstack.connection.Connection
+        :param discovery_cache: Instance of DiscoveryCache used by the
+        connection session
+        """
+        auth = connection.session.auth
+        auth_state = auth.get_auth_state()
+        # Connection is not authenticated yet
+        if not auth_state:
+            return
+
+        state = {
+            'auth_state': auth_state,
+            'expires_at': calendar.timegm(
+                auth.auth_ref.expires.utctimetuple()),
+        }
+        if discovery_cache:
+            state['discovery'] = discovery_cache.get_version_data()
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+        # Write the state to a temporary file readable only by the current
+        # user and then rename it so readers never see partial content
+        path = self._get_path(key)
+        tmp_path = '{0}.{1}.{2}.tmp'.format(
+            path, os.getpid(), threading.current_thread().ident)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as cache_file:
+            json.dump(state, cache_file)
+        os.rename(tmp_path, path)
+
+    def invalidate(self, key):
+        """
+        Remove cached authentication state for the key
+        :param str key: Client config key generated by the connection pool
+        """
+        try:
+            os.remove(self._get_path(key))
+        except EnvironmentError:
+            pass
+
+
+class ConnectionPool(object):
+    """
+    Process wide registry for openstack connections, so that all resources
+    created from the same client config share one authenticated connection
+    (and its HTTP session) instead of authenticating on their own
+    """
+    def __init__(self,
+                 max_size=DEFAULT_POOL_MAX_SIZE,
+                 max_age=DEFAULT_POOL_MAX_AGE):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.auth_cache = None
+        self._lock = threading.Lock()
+        self._connections = OrderedDict()
+
+    def configure(self, max_size=None, max_age=None):
+        """
+        Update the pool limits, connections exceeding the new limits are
+        dropped on the next lookup
+        :param int max_size: Maximum number of pooled connections
+        :param int max_age: Maximum age in seconds for pooled connection
+        """
+        if max_size is not None:
+            self.max_size = int(max_size)
+        if max_age is not None:
+            self.max_age = int(max_age)
+
+    @staticmethod
+    def get_key(client_config):
+        """
+        Generate normalized hash for client config so that two configs that
+        only differ in the keys order are matched to the same connection
+        :param dict client_config: Openstack client configuration
+        :return str: Hash key for the client config
+        """
+        normalized = json.dumps(client_config,
+                                sort_keys=True,
+                                default=text_type)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def get_connection(self, client_config):
+        """
+        Lookup pooled connection for client config or create a new one if
+        there is no valid connection for it
+        :param dict client_config: Openstack client configuration
+        :return: Instance of openstack.connection.Connection
+        """
+        key = self.get_key(client_config)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry:
+                return entry[1]
+
+        # The connection is created outside the lock so that slow
+        # authentication does not block the other threads
+        connection = openstack.connect(**client_config)
+        if self.auth_cache:
+            # The session is created lazily, so the discovery cache is
+            # installed before anything is requested. Every newly
+            # discovered endpoint is stored alongside the token
+            discovery_cache = DiscoveryCache()
+            discovery_cache.on_update = functools.partial(
+                self._persist, key, connection, discovery_cache)
+            connection.config.set_session_constructor(
+                discovery_cache.get_session_constructor())
+            if not self.auth_cache.load(key, connection, discovery_cache):
+                # Authenticate right away so that the token is stored for
+                # the other operations processes as soon as it is issued
+                connection.authorize()
+                self._persist(key, connection, discovery_cache)
+
+        with self._lock:
+            # Another thread may have created a connection for the same
+            # client config in the meantime, keep using the pooled one
+            entry = self._lookup(key)
+            if not entry:
+                # Values cached per connection (i.e. resolved project ids)
+                # live as long as the connection and its token
+                entry = (time.time(), connection, {})
+                self._connections[key] = entry
+            # Dropped connections are not closed since they may still be used
+            # by resources which already hold them, they are released once
+            # they are no longer referenced
+            while len(self._connections) > max(self.max_size, 1):
+                self._connections.popitem(last=False)
+            return entry[1]
+
+    def _lookup(self, key):
+        # Pop the entry and add it again at the end so that the order of
+        # the registry always reflects the least recently used connection
+        entry = self._connections.pop(key, None)
+        if entry and self._is_expired(entry):
+            entry = None
+        if entry:
+            self._connections[key] = entry
+        return entry
+
+    def get_cache(self, client_config):
+        """
+        Lookup the values cache shared by all resources using the pooled
+        connection of client config
+        :param dict client_config: Openstack client configuration
+        :return dict: Shared cache, empty dict if there is no pooled
+        connection for the client config
+        """
+        key = self.get_key(client_config)
+        with self._lock:
+            entry = self._connections.get(key)
+            return entry[2] if entry else {}
+
+    def _persist(self, key, connection, discovery_cache=None):
+        if not self.auth_cache:
+            return
+        try:
+            self.auth_cache.save(key, connection, discovery_cache)
+        except (EnvironmentError, ValueError, TypeError, AttributeError):
+            # Caching the token is an optimization, failing to store it
+            # must never fail the operation
+            pass
+
+    def clear(self):
+        """
+        Remove all pooled connections
+        """
+        with self._lock:
+            self._connections.clear()
+
+    def _is_expired(self, entry):
+        created_at = entry[0]
+        return self.max_age is not None \
+            and time.time() - created_at > self.max_age
+
+    def __len__(self):
+        return len(self._connections)
+
+
+connection_pool = ConnectionPool()
+
+
 class OpenstackResource(object):
     service_type = None
     resource_type = None
+    # SDK resource class listed by resources whose list API accepts the
+    # "fields" query parameter
+    fields_resource = None
 
     def __init__(self, client_config, resource_config=None, logger=None):
         self.client_config = client_config
         self.configure_ssl()
         self.logger = logger
-        self.connection = openstack.connect(**client_config)
+        self._connection = None
+        self._project_id = None
+        self._quota_details = None
         self.config = resource_config or {}
         self.name = self.config.get('name')
         self.resource_id =\
@@ -54,6 +481,28 @@ class OpenstackResource(object):
     def __str__(self):
         return self.name if not self.resource_id else self.resource_id
 
+    @property
+    def connection(self):
+        # The connection is only created when the first API call is made, so
+        # operations which never reach the API do not open any connection
+        if self._connection is None:
+            self._connection = self._connect()
+        return self._connection
+
+    @connection.setter
+    def connection(self, value):
+        self._connection = value
+
+    def _connect(self):
+        return connection_pool.get_connection(self.client_config)
+
+    @property
+    def connection_cache(self):
+        # The cache is bound to the pooled connection, so make sure the
+        # connection is created before looking it up
+        return connection_pool.get_cache(self.client_config) \
+            if self.connection else {}
+
     def validate_keystone_v3(self):
         if self.auth_url and 'v3' in self.auth_url:
             client_config_keys = set(self.client_config.keys())
@@ -93,12 +542,31 @@ class OpenstackResource(object):
 
     def get_project_id_by_name(self, project_name=None):
         project_name = project_name or self.project_name
+        cache_key = ('project_id', project_name)
+        cache = self.connection_cache
+        if cache.get(cache_key):
+            return cache[cache_key]
+
         project = self.connection.identity.find_project(project_name)
         if not project:
             raise openstack.exceptions.ResourceNotFound(
                 'Project {0} is not found'.format(project_name))
+        cache[cache_key] = project.id
         return project.id
 
+    def invalidate_project_id(self, project_id):
+        """
+        Drop the cached project id so that it is resolved again on the next
+        lookup, this must be called when the project is updated or deleted
+        :param str project_id: Project id to be removed from the cache
+        """
+        cache = self.connection_cache
+        for key, value in list(cache.items()):
+            if key[0] == 'project_id' and value == project_id:
+                del cache[key]
+        if self._project_id == project_id:
+            self._project_id = None
+
     @property
     def project_name(self):
         return self.client_config.get('project_name') or  \
@@ -106,7 +574,11 @@ class OpenstackResource(object):
 
     @property
     def project_id(self):
-        return self.config.get('project_id') or self.get_project_id_by_name()
+        if not self._project_id:
+            self._project_id = \
+                self.config.get('project_id') or \
+                self.get_project_id_by_name()
+        return self._project_id
 
     @property
     def auth_url(self):
@@ -133,17 +605,10 @@ class OpenstackResource(object):
             error_message = 'Resource id & name cannot be both empty'
 
         if self.resource_id:
-            try:
-                self.resource_id = str(self.resource_id)
-                uuid.UUID(self.resource_id)
-            except ValueError:
-                # If it's a value error, then the string
-                # is not a valid hex code for a UUID.
-                try:
-                    int(self.resource_id)
-                except ValueError:
-                    error_message = 'Invalid resource id: {0}' \
-                                    ''.format(self.resource_id)
+            self.resource_id = str(self.resource_id)
+            if get_identifier_type(self.resource_id) == IDENTIFIER_NAME:
+                error_message = 'Invalid resource id: {0}' \
+                                ''.format(self.resource_id)
 
         elif self.name and not isinstance(self.name, text_type):
             error_message = 'Invalid resource name: {0} ' \
@@ -166,9 +631,57 @@ class OpenstackResource(object):
 
         return getattr(quota, quota_type)
 
+    def get_quota_details(self, quota_type):
+        """
+        This method will lookup both the quota limit and the amount of
+        resources in use for the current project using the detailed quota
+        endpoint of the service, so it does not depend on the number of
+        resources in the project
+        :param str quota_type: Quota key of the resource i.e. "volumes"
+        :return dict: Dict with "limit" & "in_use" keys or None if the
+        service does not report the quota usage
+        """
+        if self.service_type not in QUOTA_DETAILS:
+            return None
+
+        url, response_key, in_use_key = QUOTA_DETAILS[self.service_type]
+        # The whole quota set is fetched once, so that checking multiple
+        # quota types for the same service costs a single request
+        if self._quota_details is None:
+            service = getattr(self.connection, self.service_type)
+            response = service.get(url.format(self.project_id),
+                                   raise_exc=False)
+            self._quota_details = \
+                response.json().get(response_key) if response.ok else {}
+
+        quota = self._quota_details.get(quota_type) \
+            if isinstance(self._quota_details, dict) else None
+        if not isinstance(quota, dict):
+            return None
+
+        limit = quota.get('limit')
+        in_use = quota.get(in_use_key)
+        if not (isinstance(limit, int) and isinstance(in_use, int)):
+            return None
+        return {'limit': limit, 'in_use': in_use}
+
     def resource_plural(self, openstack_type):
         return '{0}s'.format(openstack_type)
 
+    def list_fields(self, query):
+        """
+        This method will list resources while requesting only the attributes
+        provided as "fields" in the query from the API
+        :param dict query: Dict that contains filters and fields to use
+        fetch resources
+        :return: Generator of instances that extend openstack.resource.Resource
+        """
+        if not self.fields_resource:
+            raise NotImplementedError()
+        service_type = getattr(self.connection, self.service_type)
+        return get_fields_resource(self.fields_resource).list(service_type,
+                                                              **query)
+
     def list(self):
         raise NotImplementedError()
 
@@ -188,6 +701,17 @@ class ResourceMixin(object):
     based on project_id and to also to be able to find resources from
     specific projects
     """
+    # Set to False for resources whose list API does not accept the name
+    # filter
+    supports_name_filter = True
+    # Set to False for resources whose list API does not support limit &
+    # marker pagination
+    supports_pagination = True
+    # Set to True for resources whose service use numeric ids, so that
+    # numeric identifiers are fetched directly as ids
+    supports_numeric_ids = False
+    lookup_page_size = DEFAULT_LOOKUP_PAGE_SIZE
+
     @staticmethod
     def get_project_id_location(item):
         return item.location.project.id
@@ -195,9 +719,10 @@ class ResourceMixin(object):
     def get_one_match(self, name_or_id, items):
         """
         This method will try to only return one resource match the
-        name_or_id based on the items provided
+        name_or_id based on the items provided, items are consumed lazily so
+        that no more pages are fetched once a duplicate is found
         :param str name_or_id: The name or id of the resource
-        :param items: List of instances that extend
+        :param items: List or generator of instances that extend
         openstack.resource.Resource
         :return: Return target object which will be subtype of
         openstack.resource.Resource
@@ -253,9 +778,231 @@ class ResourceMixin(object):
         if not name_or_id:
             name_or_id = self.name if not\
                 self.resource_id else self.resource_id
+        return self.lookup_resource(name_or_id)
+
+    def lookup_resource(self, name_or_id):
+        """
+        This method will lookup resource based on the identifier type,
+        resources ids are fetched directly using one request while names are
+        matched against a list filtered by the API and streamed page by page.
+        Identifiers that look like ids are looked up as names when there is
+        no resource with such id, and other identifiers are fetched as ids
+        when there is no resource with such name (i.e. keystone LDAP ids)
+        :param str name_or_id: The name or id of the resource
+        :return: Return target object which will be subtype of
+        openstack.resource.Resource
+        """
+        identifier_type = get_identifier_type(name_or_id)
+        fetched_by_id = identifier_type == IDENTIFIER_UUID \
+            or (identifier_type == IDENTIFIER_NUMERIC
+                and self.supports_numeric_ids)
+        if fetched_by_id:
+            try:
+                return self._get(name_or_id)
+            except openstack.exceptions.ResourceNotFound:
+                self.logger.debug(
+                    'There is no {0} with id {1}, looking it up by name'
+                    ''.format(self.resource_type, name_or_id))
+
+        query = {}
+        if self.supports_name_filter:
+            query['name'] = name_or_id
+        if self.supports_pagination:
+            query['limit'] = self.lookup_page_size
+        items = self.list(query) if query else self.list()
         try:
+            return self.get_one_match(name_or_id, items)
+        except openstack.exceptions.ResourceNotFound:
+            if fetched_by_id:
+                raise
+            self.logger.debug(
+                'There is no {0} with name {1}, looking it up by id'
+                ''.format(self.resource_type, name_or_id))
             return self._get(name_or_id)
-        except openstack.exceptions.NotFoundException:
-            pass
 
-        return self.get_one_match(name_or_id, self.list())
+
+def run_concurrently(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    This method will call func for each item using bounded thread pool
+    :param func: Callable that accept one item
+    :param list items: List of items
+    :param int max_workers: Maximum number of concurrent calls
+    :return list: Results in the same order as the items, the error raised
+    by the first failed item (in order) is re-raised
+    """
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) \
+            as executor:
+        futures = [executor.submit(func, item) for item in items]
+    return [future.result() for future in futures]
+
+
+class ResourceStatusPoller(object):
+    """
+    This class will poll the status of a set of resources of one type that
+    an operation waits on, using one list call per poll instead of one get
+    call per resource
+    """
+    def __init__(self,
+                 resource,
+                 resource_ids,
+                 ready_statuses=None,
+                 error_statuses=None,
+                 query=None):
+        """
+        :param resource: Instance of OpenstackResource used to list resources
+        :param list resource_ids: Ids of the polled resources
+        :param list ready_statuses: Statuses of ready resources
+        :param list error_statuses: Statuses of failed resources
+        :param dict query: Filters used to list the polled resources, default
+        to filter the resources by their ids which is supported by neutron,
+        other services should provide filters (i.e. volume_id or status)
+        since the listed resources are matched by their ids anyway
+        """
+        self.resource = resource
+        self.resource_ids = list(resource_ids)
+        self.ready_statuses = ready_statuses or []
+        self.error_statuses = error_statuses or []
+        self.query = query
+
+    def unwatch(self, resource_ids):
+        """
+        Remove resources from the polled resources
+        :param list resource_ids: List of resources ids
+        """
+        self.resource_ids = [resource_id for resource_id in self.resource_ids
+                             if resource_id not in resource_ids]
+
+    def poll(self):
+        """
+        List the polled resources once and group them by their status
+        :return dict: Resources ids grouped by ready, failed, pending &
+        missing (i.e. deleted resources)
+        """
+        statuses = OrderedDict([(STATUS_READY, []),
+                                (STATUS_FAILED, []),
+                                (STATUS_PENDING, []),
+                                (STATUS_MISSING, [])])
+        if not self.resource_ids:
+            return statuses
+
+        query = dict(self.query) if self.query is not None \
+            else {'id': self.resource_ids}
+        listed = {}
+        for item in self.resource.list(query):
+            if item.id in self.resource_ids:
+                listed[item.id] = item.status
+
+        for resource_id in self.resource_ids:
+            if resource_id not in listed:
+                statuses[STATUS_MISSING].append(resource_id)
+            elif listed[resource_id] in self.error_statuses:
+                statuses[STATUS_FAILED].append(resource_id)
+            elif listed[resource_id] in self.ready_statuses:
+                statuses[STATUS_READY].append(resource_id)
+            else:
+                statuses[STATUS_PENDING].append(resource_id)
+        return statuses
+
+
+def lookup_resource(class_decl, name_or_id, client_config, logger=None):
+    """
+    This method will lookup one openstack resource using its name or id
+    :param class_decl: Class that extend OpenstackResource
+    :param str name_or_id: The name or id of the resource
+    :param dict client_config: Openstack client configuration
+    :param logger: Logger used by the resource
+    :return: Instance that extend openstack.resource.Resource
+    """
+    resource = class_decl(client_config=client_config, logger=logger)
+    resource.resource_id = name_or_id
+    return resource.get()
+
+
+class ResourceLookup(object):
+    """
+    This class will lookup batches of openstack resources concurrently using
+    bounded thread pool, all lookups share the pooled connection of the
+    client config and resolved resources are memoized so that they can be
+    prefetched before they are needed
+    """
+
+    def __init__(self,
+                 client_config,
+                 logger=None,
+                 max_workers=DEFAULT_MAX_WORKERS):
+        self.client_config = client_config
+        self.logger = logger
+        self.max_workers = max_workers
+        self._resources = {}
+
+    def _lookup(self, class_decl, name_or_id):
+        try:
+            return lookup_resource(class_decl,
+                                   name_or_id,
+                                   self.client_config,
+                                   self.logger), None
+        except Exception as error:
+            return None, error
+
+    def _resolve(self, requests):
+        """
+        Resolve the requests that are not memoized yet
+        :param list requests: List of (class_decl, name_or_id) tuples
+        :return list: List of (request, resource, error) for the requests
+        that were not resolved before, in the same order
+        """
+        requests = [request for request in OrderedDict.fromkeys(requests)
+                    if request not in self._resources]
+        if len(requests) > 1 and self.max_workers > 1:
+            # Prepare the client config and the connection once before they
+            # are shared by the lookup threads
+            requests[0][0](client_config=self.client_config,
+                           logger=self.logger).connection
+        results = run_concurrently(lambda request: self._lookup(*request),
+                                   requests,
+                                   self.max_workers)
+        return [(request, resource, error)
+                for request, (resource, error) in zip(requests, results)]
+
+    def prefetch(self, requests):
+        """
+        Resolve the requests ahead of time, failed lookups are not memoized
+        so that their error is raised when they are requested again
+        :param list requests: List of (class_decl, name_or_id) tuples
+        """
+        for request, resource, error in self._resolve(requests):
+            if not error:
+                self._resources[request] = resource
+
+    def lookup(self, requests):
+        """
+        Resolve the requests that are not prefetched yet
+        :param list requests: List of (class_decl, name_or_id) tuples
+        :return list: Resources in the same order as the requests, the error
+        raised by the first failed request (in order) is re-raised
+        """
+        for request, resource, error in self._resolve(requests):
+            if error:
+                raise error
+            self._resources[request] = resource
+        return [self._resources[request] for request in requests]
+
+
+def lookup_resources(requests,
+                     client_config,
+                     logger=None,
+                     max_workers=DEFAULT_MAX_WORKERS):
+    """
+    This method will lookup batch of openstack resources concurrently
+    :param list requests: List of (class_decl, name_or_id) tuples
+    :param dict client_config: Openstack client configuration
+    :param logger: Logger used by the resources
+    :param int max_workers: Maximum number of concurrent lookups
+    :return list: Resources in the same order as the requests
+    """
+    resource_lookup = ResourceLookup(client_config,
+                                     logger=logger,
+                                     max_workers=max_workers)
+    return resource_lookup.lookup(requests)
@@ -36,12 +36,15 @@
 # be in the following snippet:                                              #
 #                                                                           #
 # server.add_security_group(self, security_group.name)                      #
+#                                                                           #
+# The security group is only needed for its id, so ids are used as they     #
+# are and server objects are not rebuilt when they are already passed       #
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+from openstack import resource
 from openstack.compute.v2 import _proxy as custom_proxy
 from openstack.compute.v2 import server as _server
-from openstack.network.v2 import security_group as _sg
 
 
 def get_server_password(self, server):
@@ -67,9 +70,10 @@ def add_security_group_to_server(self, server, security_group):
 
     :returns: None
     """
-    server = self._get_resource(_server.Server, server)
-    security_group = self._get_resource(_sg.SecurityGroup, security_group)
-    server.add_security_group(self, security_group.id)
+    if not isinstance(server, _server.Server):
+        server = self._get_resource(_server.Server, server)
+    security_group_id = resource.Resource._get_id(security_group)
+    server.add_security_group(self, security_group_id)
 
 
 def remove_security_group_from_server(self, server, security_group):
@@ -83,9 +87,10 @@ def remove_security_group_from_server(self, server, security_group):
 
     :returns: None
     """
-    server = self._get_resource(_server.Server, server)
-    security_group = self._get_resource(_sg.SecurityGroup, security_group)
-    server.remove_security_group(self, security_group.id)
+    if not isinstance(server, _server.Server):
+        server = self._get_resource(_server.Server, server)
+    security_group_id = resource.Resource._get_id(security_group)
+    server.remove_security_group(self, security_group_id)
 
 
 custom_proxy.Proxy.add_security_group_to_server = \
@@ -17,12 +17,17 @@
 # https://docs.openstack.org/openstacksdk/latest/user/proxies/compute.html.
 
 # Local imports
-from openstack_sdk.common import (OpenstackResource, ResourceMixin)
+from openstack_sdk.common import (OpenstackResource,
+                                  ResourceMixin,
+                                  IDENTIFIER_UUID,
+                                  get_identifier_type)
 
 
 class OpenstackServer(OpenstackResource):
     service_type = 'compute'
     resource_type = 'server'
+    # The server name & the id it was resolved to
+    _resolved_server = None
 
     def list(self, details=True, all_projects=False, query=None):
         query = query or {}
@@ -34,6 +39,27 @@ class OpenstackServer(OpenstackResource):
         server = self.find_server()
         return server
 
+    def _get_server(self, server=None):
+        """
+        Get the server to act on without fetching it, the API is only called
+        once per instance to resolve the server id when the server is
+        referenced by its name
+        :param server: Prefetched instance of
+        openstack.compute.v2.server.Server
+        :return: Instance of openstack.compute.v2.server.Server or server id
+        """
+        if server is not None:
+            return server
+        name_or_id = self.name if not \
+            self.resource_id else self.resource_id
+        if name_or_id and get_identifier_type(name_or_id) == IDENTIFIER_UUID:
+            return name_or_id
+        if not self._resolved_server \
+                or self._resolved_server[0] != name_or_id:
+            self._resolved_server = (name_or_id,
+                                     self.find_server(name_or_id).id)
+        return self._resolved_server[1]
+
     def find_server(self, name_or_id=None):
         if not name_or_id:
             name_or_id = self.name if not\
@@ -56,38 +82,39 @@ class OpenstackServer(OpenstackResource):
             'Created server with this result: {0}'.format(server))
         return server
 
-    def delete(self):
-        server = self.get()
+    def delete(self, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to delete this server: {0}'.format(server))
-        result = self.connection.compute.delete_server(server)
+        result = self.connection.compute.delete_server(server,
+                                                       ignore_missing=False)
         self.logger.debug(
             'Deleted server with this result: {0}'.format(result))
         return result
 
-    def reboot(self, reboot_type):
-        server = self.get()
+    def reboot(self, reboot_type, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to reboot this server: {0}'.format(server))
         self.connection.compute.reboot_server(server, reboot_type)
         return None
 
-    def resume(self):
-        server = self.get()
+    def resume(self, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to resume this server: {0}'.format(server))
         self.connection.compute.resume_server(server)
         return None
 
-    def suspend(self):
-        server = self.get()
+    def suspend(self, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to suspend this server: {0}'.format(server))
         self.connection.compute.suspend_server(server)
         return None
 
-    def backup(self, name, backup_type, rotation):
-        server = self.get()
+    def backup(self, name, backup_type, rotation, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to backup this server: {0}'.format(server))
         self.connection.compute.backup_server(server,
@@ -96,21 +123,22 @@ class OpenstackServer(OpenstackResource):
                                               rotation)
         return None
 
-    def rebuild(self, image, name=None, admin_password='', **attr):
-        server = self.get()
-        name = name or server.name
+    def rebuild(self, image, name=None, admin_password='', server=None,
+                **attr):
+        server = self._get_server(server)
         attr['image'] = image
         self.logger.debug(
             'Attempting to rebuild this server: {0}'.format(server))
 
+        # The server keeps its name when the name is not provided
         self.connection.compute.rebuild_server(server,
                                                name,
                                                admin_password,
                                                **attr)
         return None
 
-    def create_image(self, name, metadata=None):
-        server = self.get()
+    def create_image(self, name, metadata=None, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to create image for this server: {0}'.format(server))
         self.connection.compute.create_server_image(
@@ -118,8 +146,8 @@ class OpenstackServer(OpenstackResource):
         )
         return None
 
-    def update(self, new_config=None):
-        server = self.get()
+    def update(self, new_config=None, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to update this server: {0} with args {1}'.format(
                 server, new_config))
@@ -128,22 +156,22 @@ class OpenstackServer(OpenstackResource):
             'Updated server with this result: {0}'.format(result))
         return result
 
-    def start(self):
-        server = self.get()
+    def start(self, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to start this server: {0}'.format(server))
         self.connection.compute.start_server(server)
         return None
 
-    def stop(self):
-        server = self.get()
+    def stop(self, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to stop this server: {0}'.format(server))
         self.connection.compute.stop_server(server)
         return None
 
-    def get_server_password(self):
-        server = self.get()
+    def get_server_password(self, server=None):
+        server = self._get_server(server)
         self.logger.debug(
             'Attempting to get server'
             ' password for this server: {0}'.format(server))
@@ -226,23 +254,25 @@ class OpenstackServer(OpenstackResource):
         self.logger.debug('Attempting to list server interfaces')
         return self.connection.compute.server_interfaces(self.resource_id)
 
-    def add_security_group_to_server(self, security_group_id):
+    def add_security_group_to_server(self, security_group_id, server=None):
         self.logger.debug(
             'Attempting to add security group {0} to server {1}'
             ''.format(security_group_id, self.resource_id))
         self.connection.compute.add_security_group_to_server(
-            self.resource_id, security_group_id)
+            self._get_server(server), security_group_id)
         self.logger.debug(
             'Security group {0} was added to server {1} '
             'successfully'.format(security_group_id, self.resource_id))
         return None
 
-    def remove_security_group_from_server(self, security_group_id):
+    def remove_security_group_from_server(self,
+                                          security_group_id,
+                                          server=None):
         self.logger.debug(
             'Attempting to remove security group {0} from server {1}'
             ''.format(security_group_id, self.resource_id))
         self.connection.compute.remove_security_group_from_server(
-            self.resource_id, security_group_id)
+            self._get_server(server), security_group_id)
         self.logger.debug(
             'Security group {0} was removed from server {1} '
             'successfully'.format(security_group_id, self.resource_id))
@@ -274,6 +304,9 @@ class OpenstackServer(OpenstackResource):
 class OpenstackHostAggregate(ResourceMixin, OpenstackResource):
     service_type = 'compute'
     resource_type = 'aggregate'
+    supports_name_filter = False
+    supports_pagination = False
+    supports_numeric_ids = True
 
     def list(self):
         self.logger.debug('Attempting to list aggregates')
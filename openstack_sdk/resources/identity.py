@@ -26,6 +26,8 @@ from openstack_sdk.common import (OpenstackResource, ResourceMixin)
 class OpenstackUser(ResourceMixin, OpenstackResource):
     service_type = 'identity'
     resource_type = 'user'
+    # Keystone does not paginate lists
+    supports_pagination = False
     infinite_resource_quota = 10 ** 9
 
     def list(self, query=None):
@@ -78,6 +80,8 @@ class OpenstackUser(ResourceMixin, OpenstackResource):
 class OpenstackGroup(ResourceMixin, OpenstackResource):
     service_type = 'identity'
     resource_type = 'group'
+    # Keystone does not paginate lists
+    supports_pagination = False
     infinite_resource_quota = 10 ** 9
 
     def list(self, query=None):
@@ -130,6 +134,8 @@ class OpenstackGroup(ResourceMixin, OpenstackResource):
 class OpenstackRole(ResourceMixin, OpenstackResource):
     service_type = 'identity'
     resource_type = 'role'
+    # Keystone does not paginate lists
+    supports_pagination = False
     infinite_resource_quota = 10 ** 9
 
     def list(self, query=None):
@@ -207,9 +213,11 @@ class OpenstackRole(ResourceMixin, OpenstackResource):
         return result
 
 
-class OpenstackProject(OpenstackResource):
+class OpenstackProject(ResourceMixin, OpenstackResource):
     service_type = 'identity'
     resource_type = 'project'
+    # Keystone does not paginate lists
+    supports_pagination = False
     infinite_resource_quota = 10 ** 9
 
     def list(self, query=None):
@@ -263,12 +271,7 @@ class OpenstackProject(OpenstackResource):
                 self.resource_id else self.resource_id
         self.logger.debug(
             'Attempting to find this project: {0}'.format(name_or_id))
-        try:
-            project = self.connection.identity.get_project(name_or_id)
-        except openstack.exceptions.NotFoundException:
-            project = self.connection.identity.find_project(
-                name_or_id, ignore_missing=False
-            )
+        project = self.lookup_resource(name_or_id)
 
         self.logger.debug(
             'Found project with this result: {0}'.format(project))
@@ -288,6 +291,7 @@ class OpenstackProject(OpenstackResource):
         self.logger.debug(
             'Attempting to delete this project: {0}'.format(project))
         result = self.connection.identity.delete_project(project)
+        self.invalidate_project_id(project.id)
         self.logger.debug(
             'Deleted project with this result: {0}'.format(result))
         return result
@@ -298,6 +302,7 @@ class OpenstackProject(OpenstackResource):
             'Attempting to update this project: {0} with args {1}'.format(
                 project, new_config))
         result = self.connection.identity.update_project(project, **new_config)
+        self.invalidate_project_id(result.id)
         self.logger.debug(
             'Updated project with this result: {0}'.format(result))
         return result
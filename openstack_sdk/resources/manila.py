@@ -31,13 +31,18 @@ class ManilaResource(OpenstackResource):
         self.client_config = client_config
         self.configure_ssl()
         self.logger = logger
-        self.connection = client.Client(**client_config)
+        self._connection = None
+        self._project_id = None
+        self._quota_details = None
         self.config = resource_config or {}
         self.name = self.config.get('name')
         self.resource_id =\
             None if 'id' not in self.config else self.config['id']
         self.validate_keystone_v3()
 
+    def _connect(self):
+        return client.Client(**self.client_config)
+
     def update_property(self, prop, value):
         setattr(self, prop, value)
 
@@ -19,22 +19,97 @@
 
 # Third part imports
 import openstack.exceptions
+from openstack.network.v2 import (network as _network,
+                                  subnet as _subnet,
+                                  port as _port,
+                                  router as _router,
+                                  floating_ip as _floating_ip,
+                                  security_group as _security_group,
+                                  security_group_rule as _security_group_rule,
+                                  rbac_policy as _rbac_policy)
 
 # Local imports
-from openstack_sdk.common import (OpenstackResource, ResourceMixin)
-
-
-class OpenstackNetwork(OpenstackResource):
+from openstack_sdk.common import (OpenstackResource,
+                                  ResourceMixin,
+                                  FIELDS_QUERY_PARAM,
+                                  DEFAULT_BULK_CHUNK_SIZE,
+                                  DEFAULT_MAX_WORKERS,
+                                  IDENTIFIER_UUID,
+                                  get_identifier_type,
+                                  run_concurrently)
+
+# Maximum number of attempts for conditional updates, the resource is
+# fetched again before each retry when it was changed by another request
+DEFAULT_UPDATE_ATTEMPTS = 5
+# Neutron extension that allow to add & remove router extra routes
+# atomically without replacing the whole routes list
+EXTRAROUTE_ATOMIC_EXTENSION = 'extraroute-atomic'
+
+
+class RevisionMixin(object):
+    """
+    This mixin used in order to update neutron resources conditionally using
+    "If-Match: revision_number=N", so that concurrent updates of the same
+    resource are not lost. When the resource was changed since it was
+    fetched, only this resource is fetched again and the update is retried
+    """
+    update_attempts = DEFAULT_UPDATE_ATTEMPTS
+
+    def get_by_id(self, resource_id):
+        get_method = getattr(self.connection.network,
+                             'get_{0}'.format(self.resource_type))
+        return get_method(resource_id)
+
+    def update_revision(self, new_config, resource=None):
+        """
+        Update the resource only if its revision did not change since it was
+        fetched, otherwise fetch it again and retry
+        :param new_config: Dict of attributes to update, or callable that
+        accept the fetched resource and return the attributes to update, so
+        that they are computed again when the resource is changed. The update
+        is skipped when the callable return None
+        :param resource: Prefetched instance that extend
+        openstack.resource.Resource
+        :return: Instance that extend openstack.resource.Resource
+        """
+        resource = resource or self.get()
+        update_method = getattr(self.connection.network,
+                                'update_{0}'.format(self.resource_type))
+        for attempt in range(1, self.update_attempts + 1):
+            config = new_config(resource) \
+                if callable(new_config) else new_config
+            if config is None:
+                return resource
+            try:
+                # Resources without revision are updated unconditionally
+                return update_method(resource,
+                                     if_revision=resource.revision_number,
+                                     **config)
+            except openstack.exceptions.PreconditionFailedException:
+                if attempt == self.update_attempts:
+                    raise
+                self.logger.debug(
+                    '{0} {1} was changed since revision {2}, '
+                    'fetching it again'.format(self.resource_type,
+                                               resource.id,
+                                               resource.revision_number))
+                resource = self.get_by_id(resource.id)
+
+
+class OpenstackNetwork(ResourceMixin, OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2D2S1xw.
     service_type = 'network'
     resource_type = 'network'
+    fields_resource = _network.Network
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.networks(**query)
 
     def get(self):
@@ -49,15 +124,7 @@ class OpenstackNetwork(OpenstackResource):
                 self.resource_id else self.resource_id
         self.logger.debug(
             'Attempting to find this network: {0}'.format(name_or_id))
-        try:
-            network = self.connection.network.get_network(
-                name_or_id
-            )
-        except openstack.exceptions.NotFoundException:
-            network = self.connection.network.find_network(
-                name_or_id,
-                ignore_missing=False
-            )
+        network = self.lookup_resource(name_or_id)
         self.logger.debug(
             'Found network with this result: {0}'.format(network))
         return network
@@ -91,18 +158,21 @@ class OpenstackNetwork(OpenstackResource):
         return result
 
 
-class OpenstackSubnet(OpenstackResource):
+class OpenstackSubnet(ResourceMixin, OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2SMLuvY
 
     service_type = 'network'
     resource_type = 'subnet'
+    fields_resource = _subnet.Subnet
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.subnets(**query)
 
     def get(self):
@@ -118,14 +188,7 @@ class OpenstackSubnet(OpenstackResource):
                 self.resource_id else self.resource_id
         self.logger.debug(
             'Attempting to find this subnet: {0}'.format(name_or_id))
-        try:
-            subnet = self.connection.network.get_subnet(name_or_id)
-        except openstack.exceptions.NotFoundException:
-            subnet = \
-                self.connection.network.find_subnet(
-                    name_or_id,
-                    ignore_missing=False
-                )
+        subnet = self.lookup_resource(name_or_id)
         self.logger.debug(
             'Found subnet with this result: {0}'.format(subnet))
         return subnet
@@ -159,17 +222,20 @@ class OpenstackSubnet(OpenstackResource):
         return result
 
 
-class OpenstackPort(OpenstackResource):
+class OpenstackPort(RevisionMixin, ResourceMixin, OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2DlPnUj
     service_type = 'network'
     resource_type = 'port'
+    fields_resource = _port.Port
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.ports(**query)
 
     def get(self):
@@ -185,14 +251,7 @@ class OpenstackPort(OpenstackResource):
         self.logger.debug(
             'Attempting to find this port: {0}'.format(name_or_id))
 
-        try:
-            port = self.connection.network.get_port(name_or_id)
-        except openstack.exceptions.NotFoundException:
-            port = \
-                self.connection.network.find_port(
-                    name_or_id,
-                    ignore_missing=False
-                )
+        port = self.lookup_resource(name_or_id)
         self.logger.debug(
             'Found port with this result: {0}'.format(port))
         return port
@@ -215,28 +274,30 @@ class OpenstackPort(OpenstackResource):
             'Deleted port with this result: {0}'.format(result))
         return result
 
-    def update(self, new_config=None):
-        port = self.get()
+    def update(self, new_config=None, port=None):
         self.logger.debug(
             'Attempting to update this port: {0} with args {1}'.format(
-                port, new_config))
-        result = self.connection.network.update_port(port, **new_config)
+                port or self.resource_id, new_config))
+        result = self.update_revision(new_config, port)
         self.logger.debug(
             'Updated port with this result: {0}'.format(result))
         return result
 
 
-class OpenstackRouter(OpenstackResource):
+class OpenstackRouter(RevisionMixin, ResourceMixin, OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2QioQdg
     service_type = 'network'
     resource_type = 'router'
+    fields_resource = _router.Router
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.routers(**query)
 
     def get(self):
@@ -253,14 +314,7 @@ class OpenstackRouter(OpenstackResource):
         self.logger.debug(
             'Attempting to find this router: {0}'.format(name_or_id))
 
-        try:
-            router = self.connection.network.get_router(name_or_id)
-        except openstack.exceptions.NotFoundException:
-            router = \
-                self.connection.network.find_router(
-                    name_or_id,
-                    ignore_missing=False
-                )
+        router = self.lookup_resource(name_or_id)
         self.logger.debug(
             'Found router with this result: {0}'.format(router))
         return router
@@ -283,16 +337,94 @@ class OpenstackRouter(OpenstackResource):
             'Deleted router with this result: {0}'.format(result))
         return result
 
-    def update(self, new_config=None):
-        router = self.get()
+    def update(self, new_config=None, router=None):
         self.logger.debug(
             'Attempting to update this router: {0} with args {1}'.format(
-                router, new_config))
-        result = self.connection.network.update_router(router, **new_config)
+                router or self.resource_id, new_config))
+        result = self.update_revision(new_config, router)
         self.logger.debug(
             'Updated router with this result: {0}'.format(result))
         return result
 
+    def supports_extraroute_atomic(self):
+        """
+        Check if the network API supports adding & removing router extra
+        routes atomically, the result is cached for the pooled connection
+        :return bool: Flag to indicate if the extension is supported
+        """
+        cache = self.connection_cache
+        if EXTRAROUTE_ATOMIC_EXTENSION not in cache:
+            try:
+                supported = bool(self.connection.network.find_extension(
+                    EXTRAROUTE_ATOMIC_EXTENSION))
+            except Exception as error:
+                self.logger.debug(
+                    'Unable to lookup {0} extension: {1}'.format(
+                        EXTRAROUTE_ATOMIC_EXTENSION, error))
+                supported = False
+            cache[EXTRAROUTE_ATOMIC_EXTENSION] = supported
+        return cache[EXTRAROUTE_ATOMIC_EXTENSION]
+
+    def _get_router(self):
+        if self.resource_id \
+                and get_identifier_type(self.resource_id) == IDENTIFIER_UUID:
+            return self.resource_id
+        return self.get()
+
+    def add_routes(self, routes):
+        """
+        Add extra routes to router using one atomic call when supported,
+        otherwise merge them into the router routes using conditional update
+        :param list routes: List of routes with destination and nexthop
+        :return: Instance of openstack.network.v2.router.Router
+        """
+        self.logger.debug(
+            'Attempting to add routes {0} to this router: {1}'.format(
+                routes, self.resource_id))
+        if self.supports_extraroute_atomic():
+            result = self.connection.network.add_extra_routes_to_router(
+                self._get_router(), body={'router': {'routes': routes}})
+        else:
+            def _get_routes(router):
+                remote_routes = router.routes or []
+                missing_routes = [route for route in routes
+                                  if route not in remote_routes]
+                if not missing_routes:
+                    return None
+                return {'routes': remote_routes + missing_routes}
+
+            result = self.update(_get_routes)
+        self.logger.debug(
+            'Added routes to router with this result: {0}'.format(result))
+        return result
+
+    def remove_routes(self, routes):
+        """
+        Remove extra routes from router using one atomic call when
+        supported, otherwise remove them from the router routes using
+        conditional update
+        :param list routes: List of routes with destination and nexthop
+        :return: Instance of openstack.network.v2.router.Router
+        """
+        self.logger.debug(
+            'Attempting to remove routes {0} from this router: {1}'.format(
+                routes, self.resource_id))
+        if self.supports_extraroute_atomic():
+            result = self.connection.network.remove_extra_routes_from_router(
+                self._get_router(), body={'router': {'routes': routes}})
+        else:
+            def _get_routes(router):
+                remote_routes = router.routes or []
+                if not any(route in remote_routes for route in routes):
+                    return None
+                return {'routes': [route for route in remote_routes
+                                   if route not in routes]}
+
+            result = self.update(_get_routes)
+        self.logger.debug(
+            'Removed routes from router with this result: {0}'.format(result))
+        return result
+
     def add_interface(self, kwargs):
         router = self.get()
         self.logger.debug(
@@ -321,12 +453,15 @@ class OpenstackFloatingIP(OpenstackResource):
     # https://bit.ly/2JGHqcQ
     service_type = 'network'
     resource_type = 'floatingip'
+    fields_resource = _floating_ip.FloatingIP
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.ips(**query)
 
     def get(self):
@@ -381,17 +516,22 @@ class OpenstackFloatingIP(OpenstackResource):
         return result
 
 
-class OpenstackSecurityGroup(OpenstackResource):
+class OpenstackSecurityGroup(RevisionMixin,
+                             ResourceMixin,
+                             OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2PCsWA0
     service_type = 'network'
     resource_type = 'security_group'
+    fields_resource = _security_group.SecurityGroup
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.security_groups(**query)
 
     def get(self):
@@ -406,17 +546,7 @@ class OpenstackSecurityGroup(OpenstackResource):
                 self.resource_id else self.resource_id
         self.logger.debug(
             'Attempting to find this security group: {0}'.format(name_or_id))
-        try:
-            security_group = \
-                self.connection.network.get_security_group(
-                    name_or_id
-                )
-        except openstack.exceptions.NotFoundException:
-            security_group = \
-                self.connection.network.find_security_group(
-                    name_or_id,
-                    ignore_missing=False
-                )
+        security_group = self.lookup_resource(name_or_id)
         self.logger.debug(
             'Found security group '
             'with this result: {0}'.format(security_group))
@@ -443,29 +573,32 @@ class OpenstackSecurityGroup(OpenstackResource):
             'Deleted security group with this result: {0}'.format(result))
         return result
 
-    def update(self, new_config=None):
-        security_group = self.get()
+    def update(self, new_config=None, security_group=None):
         self.logger.debug('Attempting to update this '
                           'security group: {0} with args {1}'.format(
-                              security_group, new_config))
-        result = self.connection.network.update_security_group(
-            security_group, **new_config)
+                              security_group or self.resource_id,
+                              new_config))
+        result = self.update_revision(new_config, security_group)
         self.logger.debug(
             'Updated security group with this result: {0}'.format(result))
         return result
 
 
-class OpenstackSecurityGroupRule(OpenstackResource):
+class OpenstackSecurityGroupRule(ResourceMixin, OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2PCsWA0
     service_type = 'network'
     resource_type = 'security_group_rule'
+    fields_resource = _security_group_rule.SecurityGroupRule
+    supports_name_filter = False
 
     def resource_plural(self, openstack_type):
         return openstack_type
 
     def list(self, query=None):
         query = query or {}
+        if query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.connection.network.security_group_rules(**query)
 
     def get(self):
@@ -481,17 +614,7 @@ class OpenstackSecurityGroupRule(OpenstackResource):
         self.logger.debug(
             'Attempting to find '
             'this security group rule: {0}'.format(name_or_id))
-        try:
-            security_group_rule = \
-                self.connection.network.get_security_group_rule(
-                    name_or_id
-                )
-        except openstack.exceptions.NotFoundException:
-            security_group_rule = \
-                self.connection.network.find_security_group_rule(
-                    name_or_id,
-                    ignore_missing=False
-                )
+        security_group_rule = self.lookup_resource(name_or_id)
         self.logger.debug(
             'Found security group rule '
             'with this result: {0}'.format(security_group_rule))
@@ -507,6 +630,29 @@ class OpenstackSecurityGroupRule(OpenstackResource):
                 security_group_rule))
         return security_group_rule
 
+    def bulk_create(self, rules, chunk_size=DEFAULT_BULK_CHUNK_SIZE):
+        """
+        Create security group rules using neutron bulk create API, the rules
+        are sent in chunks so that each request stays within the API limits
+        :param list rules: List of security group rules configurations
+        :param int chunk_size: Maximum number of rules sent in one request
+        :return list: List of created
+        openstack.network.v2.security_group_rule.SecurityGroupRule
+        """
+        security_group_rules = []
+        chunk_size = max(chunk_size or DEFAULT_BULK_CHUNK_SIZE, 1)
+        for index in range(0, len(rules), chunk_size):
+            chunk = rules[index:index + chunk_size]
+            self.logger.debug('Attempting to create {0} security group rules '
+                              'with these args: {1}'.format(len(chunk), chunk))
+            created_rules = _security_group_rule.SecurityGroupRule.bulk_create(
+                self.connection.network, chunk)
+            security_group_rules.extend(created_rules)
+        self.logger.debug(
+            'Created security group rules with this result: {0}'.format(
+                security_group_rules))
+        return security_group_rules
+
     def delete(self):
         security_group_rule = self.get()
         self.logger.debug(
@@ -518,17 +664,45 @@ class OpenstackSecurityGroupRule(OpenstackResource):
             'Deleted security group with this result: {0}'.format(result))
         return result
 
+    def bulk_delete(self, rule_ids, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Delete security group rules concurrently, rules that are already
+        deleted are ignored
+        :param list rule_ids: List of security group rules IDs
+        :param int max_workers: Maximum number of concurrent delete requests
+        :return list: Result of each delete request
+        """
+        self.logger.debug(
+            'Attempting to delete these security group rules: {0}'.format(
+                rule_ids))
+        # Make sure the connection is created before it is shared by the
+        # delete threads
+        network = self.connection.network
+        result = run_concurrently(
+            lambda rule_id: network.delete_security_group_rule(
+                rule_id, ignore_missing=True),
+            rule_ids,
+            max_workers)
+        self.logger.debug(
+            'Deleted security group rules with this result: {0}'.format(
+                result))
+        return result
+
 
 class OpenstackRBACPolicy(ResourceMixin, OpenstackResource):
     # SDK documentation link:
     # https://bit.ly/2DvKSnI
     service_type = 'network'
     resource_type = 'rbac_policy'
+    fields_resource = _rbac_policy.RBACPolicy
+    supports_name_filter = False
 
     def resource_plural(self, openstack_type):
         return 'rbac_policies'
 
     def list(self, query=None):
+        if query and query.get(FIELDS_QUERY_PARAM):
+            return self.list_fields(query)
         return self.list_resources(query)
 
     def get(self):
@@ -544,14 +718,7 @@ class OpenstackRBACPolicy(ResourceMixin, OpenstackResource):
 
         self.logger.debug(
             'Attempting to find this rbac policy: {0}'.format(name_or_id))
-        try:
-            rbac_policy = \
-                self.connection.network.get_rbac_policy(self.resource_id)
-        except openstack.exceptions.NotFoundException:
-            rbac_policy = self.connection.network.find_rbac_policy(
-                name_or_id,
-                ignore_missing=False
-            )
+        rbac_policy = self.lookup_resource(name_or_id)
 
         self.logger.debug(
             'Found rbac policy with this result: {0}'.format(rbac_policy))
@@ -16,8 +16,22 @@
 # Based on this documentation:
 # https://docs.openstack.org/openstacksdk/latest/user/proxies/compute.html.
 
+# Third party imports
+import openstack.utils
+from openstack.block_storage.v3 import backup as _backup
+from openstack.block_storage.v3 import snapshot as _snapshot
+
 # Local imports
-from openstack_sdk.common import (OpenstackResource, ResourceMixin)
+from openstack_sdk.common import (OpenstackResource,
+                                  ResourceMixin,
+                                  get_microversion_resource)
+
+# Minimum block storage microversion that supports the generalized resource
+# filters, so that backups & snapshots can be filtered by the API
+VOLUME_FILTERS_MICROVERSION = '3.31'
+# Filters that are only applied by the API when the microversion is
+# supported, otherwise the listed resources must be matched locally
+VOLUME_FILTERS = ['name', 'volume_id']
 
 
 class OpenstackVolume(ResourceMixin, OpenstackResource):
@@ -65,6 +79,7 @@ class OpenstackVolume(ResourceMixin, OpenstackResource):
 class OpenstackVolumeType(ResourceMixin, OpenstackResource):
     service_type = 'block_storage'
     resource_type = 'type'
+    supports_name_filter = False
 
     def list(self, query=None):
         query = query or {}
@@ -105,14 +120,85 @@ class OpenstackVolumeType(ResourceMixin, OpenstackResource):
         return None
 
 
-class OpenstackVolumeBackup(OpenstackResource):
+class VolumeFiltersMixin(object):
+    """
+    This mixin used in order to push the name & volume id filters of backups
+    and snapshots to the API when the negotiated microversion supports them
+    """
+    # SDK resource class & path used to list resources with filters
+    filters_resource = None
+    filters_base_path = None
+    # Query parameter used to list resources of all projects
+    all_projects_param = 'all_tenants'
+
+    def supports_filters(self):
+        """
+        Check if the block storage API supports filtering by name & volume
+        id, the result is cached for the pooled connection
+        :return bool: Flag to indicate if the filters are supported
+        """
+        cache = self.connection_cache
+        if VOLUME_FILTERS_MICROVERSION not in cache:
+            try:
+                supported = openstack.utils.supports_microversion(
+                    self.connection.block_storage,
+                    VOLUME_FILTERS_MICROVERSION)
+            except Exception as error:
+                # Services that do not expose microversions (i.e. v2) are
+                # treated as they do not support the filters
+                self.logger.debug(
+                    'Unable to negotiate block storage microversion: '
+                    '{0}'.format(error))
+                supported = False
+            cache[VOLUME_FILTERS_MICROVERSION] = supported
+        return cache[VOLUME_FILTERS_MICROVERSION]
+
+    def get_filters_query(self, query=None):
+        """
+        Prepare the list query, the name & volume id filters are removed
+        when the API does not support them
+        :param dict query: Dict that contains filters to use to list
+        resources
+        :return: Tuple of the query & boolean flag to indicate if the query
+        should be sent using the filters microversion
+        """
+        query = dict(query or {})
+        if 'all_tenants' in query:
+            query[self.all_projects_param] = query.pop('all_tenants')
+        if not any(query.get(name) for name in VOLUME_FILTERS):
+            return query, False
+        if self.supports_filters():
+            return query, True
+        for name in VOLUME_FILTERS:
+            query.pop(name, None)
+        return query, False
+
+    def list_filters(self, query):
+        """
+        This method will list resources using the filters microversion
+        :param dict query: Dict that contains filters to use to list
+        resources
+        :return: Generator of instances that extend openstack.resource.Resource
+        """
+        filters_resource = get_microversion_resource(
+            self.filters_resource, VOLUME_FILTERS_MICROVERSION)
+        return filters_resource.list(self.connection.block_storage,
+                                     base_path=self.filters_base_path,
+                                     **query)
+
+
+class OpenstackVolumeBackup(VolumeFiltersMixin, OpenstackResource):
     resource_type = 'block_storage'
     service_type = 'backup'
+    filters_resource = _backup.Backup
+    filters_base_path = '/backups/detail'
 
     def list(self, query=None):
-        query = query or {}
         self.logger.debug('Attempting to list backups')
-        result = self.connection.block_storage.backups(query)
+        query, use_filters = self.get_filters_query(query)
+        if use_filters:
+            return self.list_filters(query)
+        result = self.connection.block_storage.backups(**query)
         return result
 
     def get(self):
@@ -151,14 +237,19 @@ class OpenstackVolumeBackup(OpenstackResource):
         return None
 
 
-class OpenstackVolumeSnapshot(OpenstackResource):
+class OpenstackVolumeSnapshot(VolumeFiltersMixin, OpenstackResource):
     resource_type = 'block_storage'
     service_type = 'snapshot'
+    filters_resource = _snapshot.Snapshot
+    filters_base_path = '/snapshots/detail'
+    all_projects_param = 'all_projects'
 
     def list(self, query=None):
-        query = query or {}
         self.logger.debug('Attempting to list snapshots')
-        result = self.connection.block_storage.snapshots(query)
+        query, use_filters = self.get_filters_query(query)
+        if use_filters:
+            return self.list_filters(query)
+        result = self.connection.block_storage.snapshots(**query)
         return result
 
     def get(self):
@@ -54,6 +54,22 @@ class HostAggregateTestCase(base.OpenStackSDKTestBase):
         self.assertEqual(response.id, 'a34b5509-c122-4c2f-823e-884bb559afe8')
         self.assertEqual(response.name, 'test_aggregate')
 
+    def test_get_host_aggregate_by_numeric_id(self):
+        aggregate = openstack.compute.v2.aggregate.Aggregate(**{
+            'id': '12',
+            'name': 'test_aggregate',
+        })
+        self.host_aggregate_instance.resource_id = '12'
+        self.fake_client.get_aggregate = mock.MagicMock(
+            return_value=aggregate)
+        self.fake_client.aggregates = mock.MagicMock()
+
+        # Nova aggregates ids are numeric
+        response = self.host_aggregate_instance.get()
+        self.assertEqual(response.id, '12')
+        self.fake_client.get_aggregate.assert_called_once_with('12')
+        self.fake_client.aggregates.assert_not_called()
+
     def test_list_aggregates(self):
         aggregate_list = [
             openstack.compute.v2.aggregate.Aggregate(**{
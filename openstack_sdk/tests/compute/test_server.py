@@ -23,6 +23,7 @@ import openstack.compute.v2.server_interface
 
 # Local imports
 from openstack_sdk.tests import base
+from openstack_sdk import resources
 from openstack_sdk.resources import compute
 
 
@@ -190,6 +191,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.update(new_config=new_config)
         self.assertNotEqual(response.name, old_server.name)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.update_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8', name='update_test_server')
 
     def test_delete_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -214,6 +219,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.delete()
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.delete_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8', ignore_missing=False)
 
     def test_reboot_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -239,6 +248,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.reboot(reboot_type='SOFT')
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.reboot_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8', 'SOFT')
 
     def test_resume_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -264,6 +277,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.resume()
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.resume_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
 
     def test_suspend_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -289,6 +306,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.suspend()
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.suspend_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
 
     def test_backup_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -314,6 +335,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.backup('test-backup', 'daily', 30)
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.backup_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8', 'test-backup', 'daily', 30)
 
     def test_rebuild_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -339,6 +364,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.rebuild('12323')
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.rebuild_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8', None, '', image='12323')
 
     def test_create_image(self):
         server = openstack.compute.v2.server.Server(**{
@@ -365,6 +394,11 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.create_image('test-image')
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.create_server_image.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8', 'test-image',
+            metadata=None)
 
     def test_start_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -390,6 +424,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.start()
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.start_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
 
     def test_stop_server(self):
         server = openstack.compute.v2.server.Server(**{
@@ -415,6 +453,10 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.stop()
         self.assertIsNone(response)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.stop_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
 
     def test_get_server_password(self):
         server = openstack.compute.v2.server.Server(**{
@@ -440,6 +482,47 @@ class ServerTestCase(base.OpenStackSDKTestBase):
 
         response = self.server_instance.get_server_password()
         self.assertEqual(response, password)
+        # The action is sent using the server id without fetching it
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.get_server_password.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
+
+    def test_server_actions_by_name(self):
+        server = openstack.compute.v2.server.Server(**{
+            'id': 'a34b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+            'status': 'ACTIVE',
+        })
+        self.server_instance.resource_id = 'test_server'
+        self.fake_client.find_server = mock.MagicMock(return_value=server)
+        self.fake_client.stop_server = mock.MagicMock(return_value=None)
+        self.fake_client.start_server = mock.MagicMock(return_value=None)
+
+        self.server_instance.stop()
+        self.server_instance.start()
+
+        # The server name is resolved only once
+        self.fake_client.find_server.assert_called_once_with(
+            'test_server', ignore_missing=False)
+        self.fake_client.stop_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
+        self.fake_client.start_server.assert_called_once_with(
+            'a34b5509-c122-4c2f-823e-884bb559afe8')
+
+    def test_server_actions_with_prefetched_server(self):
+        server = openstack.compute.v2.server.Server(**{
+            'id': 'a34b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_server',
+            'status': 'ACTIVE',
+        })
+        self.server_instance.resource_id = 'test_server'
+        self.fake_client.stop_server = mock.MagicMock(return_value=None)
+
+        self.server_instance.stop(server)
+
+        # The prefetched server is used as is
+        self.fake_client.find_server.assert_not_called()
+        self.fake_client.stop_server.assert_called_once_with(server)
 
     def test_list_volume_attachments(self):
         server = openstack.compute.v2.server.Server(**{
@@ -736,6 +819,32 @@ class ServerTestCase(base.OpenStackSDKTestBase):
             'a34b5509-d122-4d2f-823e-884bb559afe4')
         self.assertIsNone(response)
 
+    @mock.patch('openstack.compute.v2.server.Server.add_security_group')
+    def test_patched_add_security_group_to_server(self,
+                                                  mock_add_security_group):
+        server = openstack.compute.v2.server.Server(**{
+            'id': 'a34b5509-d122-4d2f-823e-884bb559afe8',
+        })
+        proxy = mock.MagicMock()
+        proxy._get_resource = mock.MagicMock(return_value=server)
+
+        # Security group id is used as is without any lookup
+        resources.add_security_group_to_server(
+            proxy,
+            'a34b5509-d122-4d2f-823e-884bb559afe8',
+            'a34b5509-d122-4d2f-823e-884bb559afe4')
+        proxy._get_resource.assert_called_once_with(
+            openstack.compute.v2.server.Server,
+            'a34b5509-d122-4d2f-823e-884bb559afe8')
+        mock_add_security_group.assert_called_once_with(
+            proxy, 'a34b5509-d122-4d2f-823e-884bb559afe4')
+
+        # Prefetched server is used as is
+        proxy._get_resource.reset_mock()
+        resources.add_security_group_to_server(
+            proxy, server, 'a34b5509-d122-4d2f-823e-884bb559afe4')
+        proxy._get_resource.assert_not_called()
+
     def test_add_floating_ip_to_server(self):
         self.server_instance.resource_id = \
             '1a34b5509-d122-4d2f-823e-884bb559afe8'
@@ -18,6 +18,7 @@ import mock
 
 # Third party imports
 import openstack.identity.v2.user
+import openstack.identity.v3.user
 
 # Local imports
 from openstack_sdk.tests import base
@@ -49,6 +50,23 @@ class UserTestCase(base.OpenStackSDKTestBase):
         self.assertEqual(response.id, 'a95b5509-c122-4c2f-823e-884bb559afe8')
         self.assertEqual(response.name, 'test_user')
 
+    def test_get_user_by_ldap_id(self):
+        user_id = \
+            '5f3d6f3c2b1a4e9d8c7b6a5f4e3d2c1b0a9f8e7d6c5b4a3f2e1d0c9b8a7f6e5d'
+        user = openstack.identity.v3.user.User(**{
+            'id': user_id,
+            'name': 'test_user',
+        })
+        self.user_instance.resource_id = user_id
+        # There is no user with such name
+        self.fake_client.users = mock.MagicMock(return_value=iter([]))
+        self.fake_client.get_user = mock.MagicMock(return_value=user)
+
+        response = self.user_instance.get()
+        self.assertEqual(response.id, user_id)
+        self.fake_client.users.assert_called_once_with(name=user_id)
+        self.fake_client.get_user.assert_called_once_with(user_id)
+
     def test_list_users(self):
         users = [
             openstack.identity.v2.user.User(**{
@@ -17,10 +17,12 @@
 import mock
 
 # Third party imports
+import openstack.exceptions
 import openstack.network.v2.network
 
 # Local imports
 from openstack_sdk.tests import base
+from openstack_sdk.common import get_fields_resource
 from openstack_sdk.resources import networks
 
 
@@ -74,6 +76,67 @@ class NetworkTestCase(base.OpenStackSDKTestBase):
         self.assertEqual(response.name, 'test_network')
         self.assertEqual(response.is_router_external, True)
 
+    def test_find_network_by_name(self):
+        net = openstack.network.v2.network.Network(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_network',
+        })
+        self.fake_client.get_network = mock.MagicMock()
+        self.fake_client.networks = mock.MagicMock(return_value=[net])
+
+        response = self.network_instance.find_network('test_network')
+        self.assertEqual(response.id, 'a95b5509-c122-4c2f-823e-884bb559afe8')
+        self.fake_client.networks.assert_called_once_with(
+            name='test_network', limit=100)
+        self.fake_client.get_network.assert_not_called()
+
+    def test_find_network_by_id_like_name(self):
+        net = openstack.network.v2.network.Network(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'a95b5509-c122-4c2f-823e-884bb559afe7',
+        })
+        self.fake_client.get_network = mock.MagicMock(
+            side_effect=openstack.exceptions.ResourceNotFound())
+        self.fake_client.networks = mock.MagicMock(return_value=[net])
+
+        # Names that look like ids are looked up by name as well
+        response = self.network_instance.find_network(
+            'a95b5509-c122-4c2f-823e-884bb559afe7')
+        self.assertEqual(response.id, 'a95b5509-c122-4c2f-823e-884bb559afe8')
+        self.fake_client.get_network.assert_called_once_with(
+            'a95b5509-c122-4c2f-823e-884bb559afe7')
+        self.fake_client.networks.assert_called_once_with(
+            name='a95b5509-c122-4c2f-823e-884bb559afe7', limit=100)
+
+    def test_find_network_by_numeric_name(self):
+        net = openstack.network.v2.network.Network(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': '123',
+        })
+        self.fake_client.get_network = mock.MagicMock()
+        self.fake_client.networks = mock.MagicMock(return_value=[net])
+
+        # Neutron ids are never numeric
+        response = self.network_instance.find_network('123')
+        self.assertEqual(response.id, 'a95b5509-c122-4c2f-823e-884bb559afe8')
+        self.fake_client.get_network.assert_not_called()
+
+    def test_find_network_duplicate_name(self):
+        networks_list = [
+            openstack.network.v2.network.Network(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+                'name': 'test_network',
+            }),
+            openstack.network.v2.network.Network(**{
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe7',
+                'name': 'test_network',
+            }),
+        ]
+        self.fake_client.networks = mock.MagicMock(return_value=networks_list)
+
+        with self.assertRaises(openstack.exceptions.DuplicateResource):
+            self.network_instance.find_network('test_network')
+
     def test_list_networks(self):
         nets = [
             openstack.network.v2.network.Network(**{
@@ -142,6 +205,22 @@ class NetworkTestCase(base.OpenStackSDKTestBase):
         response = self.network_instance.list()
         self.assertEqual(len(response), 2)
 
+    @mock.patch.object(
+        get_fields_resource(openstack.network.v2.network.Network), 'list')
+    def test_list_networks_with_fields(self, mock_list):
+        mock_list.return_value = []
+        self.fake_client.networks = mock.MagicMock()
+        self.network_instance.list({'fields': ['id', 'name'], 'limit': 10})
+
+        # The fields are sent using the subclass that accepts them
+        self.fake_client.networks.assert_not_called()
+        resource_class = \
+            get_fields_resource(openstack.network.v2.network.Network)
+        self.assertIn('fields', resource_class._query_mapping._mapping)
+        mock_list.assert_called_once_with(self.fake_client,
+                                          fields=['id', 'name'],
+                                          limit=10)
+
     def test_create_network(self):
         net = {
             'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
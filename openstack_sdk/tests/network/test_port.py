@@ -17,6 +17,7 @@
 import mock
 
 # Third party imports
+import openstack.exceptions
 import openstack.network.v2.port
 
 # Local imports
@@ -36,7 +37,7 @@ class PortTestCase(base.OpenStackSDKTestBase):
 
     def test_get_port(self):
         port = openstack.network.v2.port.Port(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_port',
             'admin_state_up': True,
             'binding_host_id': '3',
@@ -65,11 +66,12 @@ class PortTestCase(base.OpenStackSDKTestBase):
             'tenant_id': '26',
             'updated_at': '2016-07-09T12:14:57.233772',
         })
-        self.port_instance.resource_id = '1'
+        self.port_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
         self.fake_client.get_port = mock.MagicMock(return_value=port)
 
         response = self.port_instance.get()
-        self.assertEqual(response.id, '1')
+        self.assertEqual(response.id, 'a95b5509-c122-4c2f-823e-884bb559afe8')
         self.assertEqual(response.name, 'test_port')
         self.assertEqual(response.is_admin_state_up, True)
         self.assertEqual(response.binding_host_id, '3')
@@ -78,7 +80,7 @@ class PortTestCase(base.OpenStackSDKTestBase):
     def test_list_ports(self):
         ports = [
             openstack.network.v2.port.Port(**{
-                'id': '1',
+                'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
                 'name': 'test_port_1',
                 'description': 'test_port_description_1',
                 'admin_state_up': True,
@@ -176,7 +178,7 @@ class PortTestCase(base.OpenStackSDKTestBase):
 
     def test_update_port(self):
         old_port = openstack.network.v2.port.Port(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_port',
             'description': 'test_port_description',
             'admin_state_up': True,
@@ -215,7 +217,7 @@ class PortTestCase(base.OpenStackSDKTestBase):
         }
 
         new_port = openstack.network.v2.port.Port(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_port_updated',
             'description': 'test_port_description_updated',
             'admin_state_up': False,
@@ -246,7 +248,8 @@ class PortTestCase(base.OpenStackSDKTestBase):
 
         })
 
-        self.port_instance.resource_id = '1'
+        self.port_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
         self.fake_client.get_port = mock.MagicMock(return_value=old_port)
         self.fake_client.update_port = \
             mock.MagicMock(return_value=new_port)
@@ -258,9 +261,64 @@ class PortTestCase(base.OpenStackSDKTestBase):
         self.assertNotEqual(response.is_admin_state_up,
                             old_port.is_admin_state_up)
 
+    def test_update_prefetched_port(self):
+        port = openstack.network.v2.port.Port(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'name': 'test_port',
+            'revision_number': 22,
+            'security_groups': ['23', '24'],
+        })
+        self.port_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
+        self.fake_client.get_port = mock.MagicMock()
+        self.fake_client.find_port = mock.MagicMock()
+        self.fake_client.update_port = mock.MagicMock(return_value=port)
+
+        self.port_instance.update({'security_groups': ['23']}, port)
+
+        # The prefetched port is updated only if it did not change
+        self.fake_client.get_port.assert_not_called()
+        self.fake_client.find_port.assert_not_called()
+        self.fake_client.update_port.assert_called_once_with(
+            port, if_revision=22, security_groups=['23'])
+
+    def test_update_port_with_changed_revision(self):
+        port = openstack.network.v2.port.Port(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'revision_number': 22,
+            'security_groups': ['23', '24'],
+        })
+        changed_port = openstack.network.v2.port.Port(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'revision_number': 23,
+            'security_groups': ['23', '24', '25'],
+        })
+        self.port_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
+        self.fake_client.get_port = mock.MagicMock(return_value=changed_port)
+        self.fake_client.update_port = mock.MagicMock(
+            side_effect=[openstack.exceptions.PreconditionFailedException(),
+                         changed_port])
+
+        def _remove_security_group(remote_port):
+            return {
+                'security_groups': [
+                    sg for sg in remote_port.security_group_ids if sg != '24'
+                ]
+            }
+
+        self.port_instance.update(_remove_security_group, port)
+
+        # Only the changed port is fetched again using its id
+        self.fake_client.get_port.assert_called_once_with(
+            'a95b5509-c122-4c2f-823e-884bb559afe8')
+        self.assertEqual(self.fake_client.update_port.call_count, 2)
+        self.fake_client.update_port.assert_called_with(
+            changed_port, if_revision=23, security_groups=['23', '25'])
+
     def test_delete_port(self):
         port = openstack.network.v2.port.Port(**{
-            'id': '1',
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
             'name': 'test_port',
             'description': 'test_port_description',
             'admin_state_up': True,
@@ -291,7 +349,8 @@ class PortTestCase(base.OpenStackSDKTestBase):
 
         })
 
-        self.port_instance.resource_id = '1'
+        self.port_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
         self.fake_client.get_port = mock.MagicMock(return_value=port)
         self.fake_client.delete_port = mock.MagicMock(return_value=None)
 
@@ -17,6 +17,7 @@
 import mock
 
 # Third party imports
+import openstack.exceptions
 import openstack.network.v2.router
 
 # Local imports
@@ -128,6 +129,76 @@ class RouterTestCase(base.OpenStackSDKTestBase):
         self.assertEqual(response.name, router['name'])
         self.assertEqual(response.description, router['description'])
 
+    def test_add_routes_with_extraroute_atomic(self):
+        routes = [
+            {'destination': '10.10.4.0/24', 'nexthop': '192.168.123.123'},
+            {'destination': '10.10.5.0/24', 'nexthop': '192.168.123.124'},
+        ]
+        self.router_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
+        self.fake_client.find_extension = \
+            mock.MagicMock(return_value=mock.MagicMock())
+        self.fake_client.get_router = mock.MagicMock()
+        self.fake_client.update_router = mock.MagicMock()
+        self.fake_client.add_extra_routes_to_router = mock.MagicMock()
+
+        self.router_instance.add_routes(routes)
+
+        # All routes are added in one call without fetching the router
+        self.fake_client.find_extension.assert_called_once_with(
+            'extraroute-atomic')
+        self.fake_client.add_extra_routes_to_router.assert_called_once_with(
+            'a95b5509-c122-4c2f-823e-884bb559afe8',
+            body={'router': {'routes': routes}})
+        self.fake_client.get_router.assert_not_called()
+        self.fake_client.update_router.assert_not_called()
+
+    def test_remove_routes_without_extraroute_atomic(self):
+        router = openstack.network.v2.router.Router(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'revision_number': 7,
+            'routes': [
+                {'destination': '10.10.4.0/24', 'nexthop': '192.168.123.123'},
+                {'destination': '10.10.5.0/24', 'nexthop': '192.168.123.124'},
+            ],
+        })
+        self.router_instance.resource_id = \
+            'a95b5509-c122-4c2f-823e-884bb559afe8'
+        self.fake_client.find_extension = mock.MagicMock(return_value=None)
+        self.fake_client.get_router = mock.MagicMock(return_value=router)
+        self.fake_client.update_router = mock.MagicMock(return_value=router)
+        self.fake_client.remove_extra_routes_from_router = mock.MagicMock()
+
+        self.router_instance.remove_routes([
+            {'destination': '10.10.4.0/24', 'nexthop': '192.168.123.123'}
+        ])
+
+        # Only the given routes are removed using conditional update
+        self.fake_client.remove_extra_routes_from_router.assert_not_called()
+        self.fake_client.update_router.assert_called_once_with(
+            router,
+            if_revision=7,
+            routes=[{'destination': '10.10.5.0/24',
+                     'nexthop': '192.168.123.124'}])
+
+    def test_update_router_with_changed_revision(self):
+        router = openstack.network.v2.router.Router(**{
+            'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
+            'revision_number': 3,
+        })
+        self.router_instance.update_attempts = 2
+        self.fake_client.get_router = mock.MagicMock(return_value=router)
+        self.fake_client.update_router = mock.MagicMock(
+            side_effect=openstack.exceptions.PreconditionFailedException())
+
+        # The error is raised once all attempts are exhausted
+        with self.assertRaises(
+                openstack.exceptions.PreconditionFailedException):
+            self.router_instance.update({'routes': []}, router)
+        self.assertEqual(self.fake_client.update_router.call_count, 2)
+        self.fake_client.get_router.assert_called_once_with(
+            'a95b5509-c122-4c2f-823e-884bb559afe8')
+
     def test_update_router(self):
         old_router = openstack.network.v2.router.Router(**{
             'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
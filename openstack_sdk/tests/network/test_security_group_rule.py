@@ -122,6 +122,26 @@ class SecurityGroupRuleTestCase(base.OpenStackSDKTestBase):
         response = self.security_group_rule_instance.create()
         self.assertEqual(response.id, rule['id'])
 
+    @mock.patch('openstack.network.v2.security_group_rule.'
+                'SecurityGroupRule.bulk_create')
+    def test_bulk_create_security_group_rules(self, mock_bulk_create):
+        rules = [{'direction': 'ingress', 'port_range_min': port}
+                 for port in range(5)]
+
+        def bulk_create(_, chunk):
+            return (openstack.network.v2.security_group_rule.SecurityGroupRule(
+                **rule) for rule in chunk)
+
+        mock_bulk_create.side_effect = bulk_create
+
+        response = self.security_group_rule_instance.bulk_create(
+            rules, chunk_size=2)
+        self.assertEqual(len(response), 5)
+        self.assertEqual(
+            [len(call[0][1]) for call in mock_bulk_create.call_args_list],
+            [2, 2, 1])
+        self.assertIs(mock_bulk_create.call_args[0][0], self.fake_client)
+
     def test_delete_security_group_rule(self):
         sg = openstack.network.v2.security_group_rule.SecurityGroupRule(**{
             'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
@@ -149,3 +169,16 @@ class SecurityGroupRuleTestCase(base.OpenStackSDKTestBase):
 
         response = self.security_group_rule_instance.delete()
         self.assertIsNone(response)
+
+    def test_bulk_delete_security_group_rules(self):
+        rule_ids = ['a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(index)
+                    for index in range(3)]
+        self.fake_client.delete_security_group_rule = \
+            mock.MagicMock(return_value=None)
+
+        self.security_group_rule_instance.bulk_delete(rule_ids)
+        self.fake_client.get_security_group_rule.assert_not_called()
+        self.assertEqual(
+            sorted(call[0][0] for call in
+                   self.fake_client.delete_security_group_rule.call_args_list),
+            rule_ids)
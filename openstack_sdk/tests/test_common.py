@@ -14,15 +14,41 @@
 # limitations under the License.
 
 # Standard imports
+import os
+import json
+import stat
+import shutil
+import datetime
+import tempfile
 import unittest
 import mock
 
 # Third part imports
+import requests
+import openstack
+import openstack.exceptions
 import openstack.compute.v2.server
+import openstack.network.v2.network
+from keystoneauth1 import discover as ks_discover
 
 # Local imports
 from openstack_sdk.resources import get_server_password
-from openstack_sdk.common import OpenstackResource
+from openstack_sdk.resources.networks import OpenstackNetwork
+from openstack_sdk.common import (OpenstackResource,
+                                  AuthCache,
+                                  IDENTIFIER_UUID,
+                                  IDENTIFIER_NUMERIC,
+                                  IDENTIFIER_NAME,
+                                  get_identifier_type,
+                                  lookup_resources,
+                                  ResourceLookup,
+                                  ConnectionPool,
+                                  ResourceStatusPoller,
+                                  connection_pool)
+
+
+# Keep the actual connect method for the tests that use real connections
+openstack_connect = openstack.connect
 
 
 @mock.patch('openstack.connect')
@@ -30,6 +56,7 @@ class OpenStackCommonBase(unittest.TestCase):
 
     def setUp(self):
         super(OpenStackCommonBase, self).setUp()
+        connection_pool.clear()
 
     @mock.patch('openstack.proxy.Proxy')
     def test_get_server(self, mock_proxy, _):
@@ -63,6 +90,34 @@ class OpenStackCommonBase(unittest.TestCase):
                          'a95b5509-c122-4c2f-823e-884bb559afe9')
         self.assertEqual(resource.name, 'foo-name')
 
+    def test_lazy_connection(self, mock_connect):
+        resource = OpenstackResource(
+            client_config={'foo': 'foo', 'bar': 'bar'},
+            resource_config={'name': 'foo-name'}
+        )
+        mock_connect.assert_not_called()
+        self.assertIs(resource.connection, mock_connect.return_value)
+        self.assertIs(resource.connection, mock_connect.return_value)
+        mock_connect.assert_called_once()
+
+    def test_project_id_cache(self, mock_connect):
+        client_config = {'foo': 'foo', 'project_name': 'test_project'}
+        find_project = mock_connect.return_value.identity.find_project
+        find_project.return_value = mock.MagicMock(id='test_project_id')
+        resource_1 = OpenstackResource(client_config=dict(client_config))
+        resource_2 = OpenstackResource(client_config=dict(client_config))
+
+        self.assertEqual(resource_1.project_id, 'test_project_id')
+        self.assertEqual(resource_1.project_id, 'test_project_id')
+        # The resolved project id is shared by resources using the same
+        # connection
+        self.assertEqual(resource_2.project_id, 'test_project_id')
+        find_project.assert_called_once_with('test_project')
+
+        resource_1.invalidate_project_id('test_project_id')
+        self.assertEqual(resource_1.project_id, 'test_project_id')
+        self.assertEqual(find_project.call_count, 2)
+
     def test_valid_resource_id(self, _):
         resource = OpenstackResource(
             client_config={'foo': 'foo', 'bar': 'bar'},
@@ -72,6 +127,17 @@ class OpenStackCommonBase(unittest.TestCase):
 
         self.assertIsNone(resource.validate_resource_identifier())
 
+    def test_get_identifier_type(self, _):
+        self.assertEqual(
+            get_identifier_type('a95b5509-c122-4c2f-823e-884bb559afe9'),
+            IDENTIFIER_UUID)
+        self.assertEqual(
+            get_identifier_type('a95b5509c1224c2f823e884bb559afe9'),
+            IDENTIFIER_UUID)
+        self.assertEqual(get_identifier_type('42'), IDENTIFIER_NUMERIC)
+        self.assertEqual(get_identifier_type(42), IDENTIFIER_NUMERIC)
+        self.assertEqual(get_identifier_type('foo-name'), IDENTIFIER_NAME)
+
     def test_invalid_resource_id(self, _):
         resource = OpenstackResource(
             client_config={'foo': 'foo', 'bar': 'bar'},
@@ -92,6 +158,34 @@ class OpenStackCommonBase(unittest.TestCase):
         mock_quota.return_value = 15
         self.assertEqual(resource.get_quota_sets('test'), 15)
 
+    def test_get_quota_details(self, mock_connect):
+        resource = OpenstackResource(
+            client_config={'foo': 'foo', 'bar': 'bar'},
+            resource_config={'name': 'foo-name',
+                             'project_id': 'test_project_id'}
+        )
+        resource.service_type = 'network'
+        response = mock.MagicMock(ok=True)
+        response.json.return_value = {
+            'quota': {
+                'port': {'limit': 50, 'used': 12, 'reserved': 0},
+                'floatingip': {'limit': 10, 'used': 2, 'reserved': 0},
+            }
+        }
+        mock_connect.return_value.network.get.return_value = response
+
+        self.assertEqual(resource.get_quota_details('port'),
+                         {'limit': 50, 'in_use': 12})
+        self.assertEqual(resource.get_quota_details('floatingip'),
+                         {'limit': 10, 'in_use': 2})
+        mock_connect.return_value.network.get.assert_called_once_with(
+            '/quotas/test_project_id/details.json', raise_exc=False)
+
+        # Missing usage details should fallback to the quota sets
+        response.ok = False
+        resource._quota_details = None
+        self.assertIsNone(resource.get_quota_details('port'))
+
     def test_resource_plural(self, _):
         resource = OpenstackResource(
             client_config={'foo': 'foo', 'bar': 'bar'},
@@ -136,3 +230,279 @@ class OpenStackCommonBase(unittest.TestCase):
         )
         with self.assertRaises(NotImplementedError):
             resource.list()
+
+    def test_shared_connection(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: mock.MagicMock()
+        resource_1 = OpenstackResource(
+            client_config={'foo': 'foo', 'bar': 'bar'},
+            resource_config={'name': 'foo-name'}
+        )
+        resource_2 = OpenstackResource(
+            client_config={'bar': 'bar', 'foo': 'foo'},
+            resource_config={'name': 'bar-name'}
+        )
+        resource_3 = OpenstackResource(
+            client_config={'foo': 'foo', 'bar': 'baz'},
+            resource_config={'name': 'baz-name'}
+        )
+        self.assertIs(resource_1.connection, resource_2.connection)
+        self.assertIsNot(resource_1.connection, resource_3.connection)
+        self.assertEqual(mock_connect.call_count, 2)
+
+    def test_connection_pool_lru_eviction(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: mock.MagicMock()
+        pool = ConnectionPool(max_size=2)
+        connection_1 = pool.get_connection({'foo': '1'})
+        connection_2 = pool.get_connection({'foo': '2'})
+        # Touch the first connection so that the second one is the least
+        # recently used
+        self.assertIs(pool.get_connection({'foo': '1'}), connection_1)
+        pool.get_connection({'foo': '3'})
+        self.assertEqual(len(pool), 2)
+        # Evicted connection may still be used by other resources
+        connection_2.close.assert_not_called()
+        self.assertIs(pool.get_connection({'foo': '1'}), connection_1)
+        self.assertEqual(mock_connect.call_count, 3)
+
+    @mock.patch('openstack_sdk.common.time.time')
+    def test_connection_pool_max_age(self, mock_time, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: mock.MagicMock()
+        pool = ConnectionPool(max_age=60)
+        mock_time.return_value = 1000
+        connection_1 = pool.get_connection({'foo': 'foo'})
+        mock_time.return_value = 1030
+        self.assertIs(pool.get_connection({'foo': 'foo'}), connection_1)
+        mock_time.return_value = 1100
+        connection_2 = pool.get_connection({'foo': 'foo'})
+        self.assertIsNot(connection_1, connection_2)
+        connection_1.close.assert_not_called()
+
+    def test_connection_pool_concurrent_connect(self, mock_connect):
+        pool = ConnectionPool()
+        connection_1 = mock.MagicMock()
+        connection_2 = mock.MagicMock()
+
+        def _connect(**kwargs):
+            if mock_connect.call_count == 1:
+                # The lock is not held while connecting, so another thread
+                # can lookup the pool and connect at the same time
+                self.assertIs(pool.get_connection({'foo': 'foo'}),
+                              connection_2)
+                return connection_1
+            return connection_2
+
+        mock_connect.side_effect = _connect
+        # The connection created first is kept in the pool
+        self.assertIs(pool.get_connection({'foo': 'foo'}), connection_2)
+        self.assertIs(pool.get_connection({'foo': 'foo'}), connection_2)
+        self.assertEqual(mock_connect.call_count, 2)
+
+    def _get_auth_cache_connection(self, expires):
+        connection = mock.MagicMock()
+        connection.session.auth.get_auth_state.return_value = '{"foo": 1}'
+        connection.session.auth.auth_ref.expires = expires
+        return connection
+
+    def test_auth_cache_save_and_load(self, _):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache = AuthCache(os.path.join(cache_dir, 'auth'))
+        expires = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+        connection = self._get_auth_cache_connection(expires)
+        cache.save('key', connection)
+
+        path = os.path.join(cache_dir, 'auth', 'key.json')
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+        new_connection = self._get_auth_cache_connection(expires)
+        self.assertTrue(cache.load('key', new_connection))
+        new_connection.session.auth.set_auth_state.assert_called_once_with(
+            '{"foo": 1}')
+
+    @mock.patch('requests.Session.request')
+    def test_auth_cache_connection_pool(self, mock_request, mock_connect):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        expires = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+        token = {
+            'token': {
+                'methods': ['password'],
+                'expires_at': expires.strftime('%Y-%m-%dT%H:%M:%S.000000Z'),
+                'user': {
+                    'id': 'user-id',
+                    'name': 'foo',
+                    'domain': {'id': 'default', 'name': 'Default'},
+                },
+                'project': {
+                    'id': 'project-id',
+                    'name': 'bar',
+                    'domain': {'id': 'default', 'name': 'Default'},
+                },
+                'catalog': [],
+            }
+        }
+
+        versions = [{
+            'id': 'v2.1',
+            'status': 'CURRENT',
+            'min_version': '2.1',
+            'max_version': '2.79',
+            'links': [{'href': 'http://nova:8774/v2.1/', 'rel': 'self'}],
+        }]
+
+        def _request(method, url, **kwargs):
+            response = requests.Response()
+            response.url = url
+            response.headers['Content-Type'] = 'application/json'
+            if method == 'GET':
+                response.status_code = 200
+                response._content = json.dumps(
+                    {'versions': versions}).encode('utf-8')
+                return response
+            response.status_code = 201
+            response.headers['X-Subject-Token'] = 'token-id'
+            response._content = json.dumps(token).encode('utf-8')
+            return response
+
+        # Only the HTTP requests are faked, the connection, the session and
+        # the auth plugin are the real ones
+        mock_connect.side_effect = openstack_connect
+        mock_request.side_effect = _request
+        client_config = {
+            'auth_type': 'v3password',
+            'auth_url': 'http://keystone:5000/v3',
+            'username': 'foo',
+            'password': 'foo',
+            'project_name': 'bar',
+            'user_domain_name': 'Default',
+            'project_domain_name': 'Default',
+        }
+
+        pool = ConnectionPool()
+        pool.auth_cache = AuthCache(cache_dir)
+        pool.get_connection(client_config)
+        # The token is requested once and stored right away
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args[0][0], 'POST')
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        # Endpoint discovery goes through the session discovery cache and
+        # its result is stored alongside the token
+        connection = pool.get_connection(client_config)
+        ks_discover.get_discovery(connection.session, 'http://nova:8774/')
+        self.assertEqual(mock_request.call_count, 2)
+
+        # Another process using the same credentials re-use the token and
+        # the discovered endpoints
+        new_pool = ConnectionPool()
+        new_pool.auth_cache = AuthCache(cache_dir)
+        connection = new_pool.get_connection(client_config)
+        self.assertEqual(connection.session.get_token(), 'token-id')
+        self.assertEqual(connection.current_project_id, 'project-id')
+        discovery = ks_discover.get_discovery(connection.session,
+                                              'http://nova:8774/')
+        self.assertEqual(discovery.raw_version_data(), versions)
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_auth_cache_expired_token(self, _):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache = AuthCache(cache_dir, expiry_margin=300)
+        # The token is still valid but it is within the expiry margin
+        expires = datetime.datetime.utcnow() + datetime.timedelta(minutes=1)
+        connection = self._get_auth_cache_connection(expires)
+        cache.save('key', connection)
+
+        new_connection = self._get_auth_cache_connection(expires)
+        self.assertFalse(cache.load('key', new_connection))
+        new_connection.session.auth.set_auth_state.assert_not_called()
+        self.assertFalse(os.path.exists(os.path.join(cache_dir, 'key.json')))
+
+    def test_lookup_resources(self, mock_connect):
+        def get_network(network_id):
+            return openstack.network.v2.network.Network(id=network_id)
+
+        mock_connect().network.get_network = \
+            mock.MagicMock(side_effect=get_network)
+        network_ids = ['a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(index)
+                       for index in [3, 1, 2, 1]]
+        networks = lookup_resources(
+            [(OpenstackNetwork, network_id) for network_id in network_ids],
+            client_config={'foo': 'foo'},
+            logger=mock.MagicMock())
+
+        # Resources keep the order of requests & duplicates are fetched once
+        self.assertEqual([network.id for network in networks], network_ids)
+        self.assertEqual(mock_connect().network.get_network.call_count, 3)
+
+    def test_lookup_resources_error(self, mock_connect):
+        def get_network(network_id):
+            if network_id.endswith('2'):
+                raise openstack.exceptions.ResourceNotFound(network_id)
+            return openstack.network.v2.network.Network(id=network_id)
+
+        mock_connect().network.get_network = \
+            mock.MagicMock(side_effect=get_network)
+        network_ids = ['a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(index)
+                       for index in [1, 2, 3]]
+        with self.assertRaises(openstack.exceptions.ResourceNotFound):
+            lookup_resources(
+                [(OpenstackNetwork, network_id) for network_id in network_ids],
+                client_config={'foo': 'foo'},
+                logger=mock.MagicMock())
+
+    def test_resource_lookup_prefetch(self, mock_connect):
+        def get_network(network_id):
+            if network_id.endswith('2'):
+                raise openstack.exceptions.ResourceNotFound(network_id)
+            return openstack.network.v2.network.Network(id=network_id)
+
+        mock_connect().network.get_network = \
+            mock.MagicMock(side_effect=get_network)
+        network_1 = 'a95b5509-c122-4c2f-823e-884bb559afe1'
+        network_2 = 'a95b5509-c122-4c2f-823e-884bb559afe2'
+        resource_lookup = ResourceLookup({'foo': 'foo'},
+                                         logger=mock.MagicMock())
+        # Failed lookups are not raised while prefetching
+        resource_lookup.prefetch([(OpenstackNetwork, network_1),
+                                  (OpenstackNetwork, network_2)])
+        self.assertEqual(mock_connect().network.get_network.call_count, 2)
+
+        network, = resource_lookup.lookup([(OpenstackNetwork, network_1)])
+        self.assertEqual(network.id, network_1)
+        self.assertEqual(mock_connect().network.get_network.call_count, 2)
+
+        # Failed lookups are requested again and their error is raised
+        with self.assertRaises(openstack.exceptions.ResourceNotFound):
+            resource_lookup.lookup([(OpenstackNetwork, network_2)])
+        self.assertEqual(mock_connect().network.get_network.call_count, 3)
+
+    def test_resource_status_poller(self, mock_connect):
+        network_ids = ['a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(index)
+                       for index in range(4)]
+        mock_connect().network.networks = mock.MagicMock(return_value=[
+            openstack.network.v2.network.Network(id=network_ids[0],
+                                                 status='ACTIVE'),
+            openstack.network.v2.network.Network(id=network_ids[1],
+                                                 status='ERROR'),
+            openstack.network.v2.network.Network(id=network_ids[2],
+                                                 status='BUILD'),
+        ])
+        network = OpenstackNetwork({'foo': 'foo'}, logger=mock.MagicMock())
+        poller = ResourceStatusPoller(network, network_ids, ['ACTIVE'],
+                                      ['ERROR'])
+
+        self.assertEqual(poller.poll(), {
+            'ready': [network_ids[0]],
+            'failed': [network_ids[1]],
+            'pending': [network_ids[2]],
+            'missing': [network_ids[3]],
+        })
+        # All the polled resources are listed using one filtered call
+        mock_connect().network.networks.assert_called_once_with(
+            id=network_ids)
+
+        poller.unwatch(network_ids[:2])
+        poller.poll()
+        mock_connect().network.networks.assert_called_with(
+            id=network_ids[2:])
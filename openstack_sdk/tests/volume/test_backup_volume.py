@@ -18,9 +18,11 @@ import mock
 
 # Third party imports
 import openstack.block_storage.v2.backup
+import openstack.block_storage.v3.backup
 
 # Local imports
 from openstack_sdk.tests import base
+from openstack_sdk.common import get_microversion_resource
 from openstack_sdk.resources import volume
 
 
@@ -75,6 +77,41 @@ class VolumeBackupTestCase(base.OpenStackSDKTestBase):
         response = self.volume_backup_instance.list()
         self.assertEqual(len(response), 2)
 
+    @mock.patch.object(
+        get_microversion_resource(openstack.block_storage.v3.backup.Backup,
+                                  '3.31'), 'list')
+    @mock.patch('openstack.utils.supports_microversion', return_value=True)
+    def test_list_backups_with_filters(self,
+                                       mock_supports_microversion,
+                                       mock_list):
+        self.fake_client.backups = mock.MagicMock()
+        mock_list.return_value = []
+        self.volume_backup_instance.list(
+            query={'volume_id': '1', 'name': 'test_volume_backup'})
+
+        # Filters are sent by the API using the negotiated microversion
+        self.fake_client.backups.assert_not_called()
+        mock_list.assert_called_once_with(self.fake_client,
+                                          base_path='/backups/detail',
+                                          volume_id='1',
+                                          name='test_volume_backup')
+
+    @mock.patch.object(
+        get_microversion_resource(openstack.block_storage.v3.backup.Backup,
+                                  '3.31'), 'list')
+    @mock.patch('openstack.utils.supports_microversion', return_value=False)
+    def test_list_backups_without_filters(self,
+                                          mock_supports_microversion,
+                                          mock_list):
+        self.fake_client.backups = mock.MagicMock(return_value=[])
+        self.volume_backup_instance.list(
+            query={'volume_id': '1', 'name': 'test_volume_backup',
+                   'all_tenants': True})
+
+        # Filters that are not supported are not sent to the API
+        mock_list.assert_not_called()
+        self.fake_client.backups.assert_called_once_with(all_tenants=True)
+
     def test_create_backup(self):
         volume_backup = {
             'id': 'a95b5509-c122-4c2f-823e-884bb559afe8',
@@ -17,6 +17,7 @@
 import mock
 
 # Third party imports
+import openstack.exceptions
 import openstack.block_storage.v2.volume
 
 # Local imports
@@ -75,6 +76,23 @@ class VolumeTestCase(base.OpenStackSDKTestBase):
         response = self.volume_instance.list()
         self.assertEqual(len(response), 2)
 
+    def test_find_volume_duplicate_name(self):
+        def _volumes(**_):
+            for index in range(2):
+                yield openstack.block_storage.v2.volume.Volume(**{
+                    'id': 'a95b5509-c122-4c2f-823e-884bb559afe{0}'.format(
+                        index),
+                    'name': 'test_volume',
+                })
+            # Any page after the duplicate must not be requested
+            raise AssertionError('Volumes list is fully consumed')
+
+        self.fake_client.volumes = mock.MagicMock(side_effect=_volumes)
+        with self.assertRaises(openstack.exceptions.DuplicateResource):
+            self.volume_instance.find_volume('test_volume')
+        self.fake_client.volumes.assert_called_once_with(
+            name='test_volume', limit=100)
+
     def test_create_volume(self):
         volume_instance = {
             'name': 'test_volume',